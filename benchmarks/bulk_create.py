@@ -0,0 +1,84 @@
+"""
+Creation of many samples through `CreateMixin.create` (one ORM object per row, then a flush) against
+`BulkCreateMixin.bulk_create`, on both of its paths: multi-row `INSERT ... RETURNING` and asyncpg
+`COPY` (used from `_BULK_COPY_THRESHOLD` rows; forced on either side here to compare equal sizes).
+
+Needs the PostgreSQL database from the settings. Each run is rolled back, so nothing is left behind.
+
+Usage: PYTHONPATH=src python benchmarks/bulk_create.py [rows ...]
+"""
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from apps.soil_laboratory.dto.sample import SampleCreateDTO
+from apps.soil_laboratory.models import Material, MaterialSource, MaterialType
+from apps.soil_laboratory.repositories import SampleRepository
+from database.session import async_postgresql_engine, async_postgresql_session_factory
+
+
+PATHS = ("create", "insert", "copy")
+
+
+async def run(path: str, rows: int) -> float:
+    """Creates `rows` samples through one path and returns the elapsed seconds."""
+    async with async_postgresql_session_factory() as session:
+        suffix = uuid.uuid4().hex[:8]
+        material_type = MaterialType(code=f"bench-{suffix}", name=f"Benchmark {suffix}")
+        material_source = MaterialSource(code=f"bench-{suffix}", name=f"Benchmark {suffix}")
+        session.add_all([material_type, material_source])
+        await session.flush()
+
+        material = Material(material_type_id=material_type.id, name=f"Benchmark {suffix}")
+        session.add(material)
+        await session.flush()
+
+        received_at = datetime.now(timezone.utc)
+        samples_data = [
+            SampleCreateDTO(
+                material_id=material.id,
+                material_source_id=material_source.id,
+                temperature=20.5,
+                received_at=received_at
+            )
+            for _ in range(rows)
+        ]
+        sample_repo = SampleRepository(session)
+        sample_repo._BULK_COPY_THRESHOLD = 0 if path == "copy" else rows + 1
+
+        start_time = time.perf_counter()
+
+        if path == "create":
+            for sample_data in samples_data:
+                await sample_repo.create(sample_data)
+
+            await session.flush()
+        else:
+            await sample_repo.bulk_create(samples_data)
+
+        elapsed = time.perf_counter() - start_time
+        await session.rollback()
+
+    return elapsed
+
+
+async def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+
+    # Warm up (connections, statement caches)
+    for path in PATHS:
+        await run(path, 10)
+
+    print(f"{'rows':>7}" + "".join(f"{path:>16}" for path in PATHS))
+
+    for rows in sizes:
+        timings = [await run(path, rows) for path in PATHS]
+        print(f"{rows:>7}" + "".join(f"{seconds * 1000:13.1f} ms" for seconds in timings))
+
+    await async_postgresql_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Bytes saved and CPU time spent by `GZipMiddleware` per kind of response: a samples list page with
+nested test results, a roles list with embedded permissions, and a DOCX report (already a zip
+archive, so it's not in the compressed content types; shown for reference).
+
+Each response is sent through the middleware in-process, with and without `Accept-Encoding: gzip`,
+so the time difference is the compression's cost.
+
+Usage: PYTHONPATH=src python benchmarks/compression_savings.py
+"""
+import asyncio
+import io
+import json
+import time
+import uuid
+
+from docx import Document
+from starlette.responses import Response
+from starlette.types import Message
+
+from apps.soil_laboratory.schemas.sample import SampleListItemResponse
+from core.config import settings
+from core.middleware import GZipMiddleware
+from sample_list_validation import build_samples
+from schemas.utils import get_type_adapter, resolve_schemas_forward_refs
+
+
+NUMBER = 500
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def build_samples_page() -> bytes:
+    resolve_schemas_forward_refs(settings.BASE_DIR / "apps")
+    adapter = get_type_adapter(list[SampleListItemResponse])
+    items = adapter.validate_python(build_samples(), from_attributes=True)
+
+    return b'{"items":' + adapter.dump_json(items, by_alias=True) + b',"total":20}'
+
+
+def build_roles_page() -> bytes:
+    permissions = [
+        {
+            "id": str(uuid.uuid4()),
+            "code": f"resource_{i // 4}:{action}",
+            "name": f"Resource {i // 4}: {action}",
+            "description": f"Allows to {action} resource {i // 4}"
+        }
+        for i, action in enumerate(["read", "create", "update", "delete"] * 10)
+    ]
+    roles = [
+        {"id": str(uuid.uuid4()), "name": f"Role {i}", "permissions": permissions}
+        for i in range(20)
+    ]
+
+    return json.dumps({"items": roles, "total": len(roles)}).encode()
+
+
+def build_report() -> bytes:
+    document = Document()
+    table = document.add_table(rows=1, cols=5)
+
+    for _ in range(200):
+        cells = table.add_row().cells
+        cells[0].text = str(uuid.uuid4())
+        cells[1].text = "Quartz sand"
+        cells[2].text = "Quarry 1"
+        cells[3].text = "20.5"
+        cells[4].text = "Compliant"
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    return buffer.getvalue()
+
+
+async def send_through(app: GZipMiddleware, accept_encoding: str) -> int:
+    """Sends a request through the middleware and returns the response body's size."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())]
+    }
+    body_size = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal body_size
+
+        if message["type"] == "http.response.body":
+            body_size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+    return body_size
+
+
+async def measure(name: str, body: bytes, media_type: str) -> None:
+    app = GZipMiddleware(Response(body, media_type=media_type))
+    timings = {}
+    sizes = {}
+
+    for accept_encoding in ("identity", "gzip"):
+        start_time = time.perf_counter()
+
+        for _ in range(NUMBER):
+            sizes[accept_encoding] = await send_through(app, accept_encoding)
+
+        timings[accept_encoding] = (time.perf_counter() - start_time) / NUMBER
+
+    saved = 1 - sizes["gzip"] / sizes["identity"]
+    cpu_ms = (timings["gzip"] - timings["identity"]) * 1000
+
+    print(f"{name:<14} {sizes['identity']:>9} B -> {sizes['gzip']:>9} B"
+          f"   saved {saved:6.1%}   compression {cpu_ms:6.3f} ms/response")
+
+
+async def main() -> None:
+    await measure("samples page", build_samples_page(), "application/json")
+    await measure("roles page", build_roles_page(), "application/json")
+    await measure("DOCX report", build_report(), DOCX_MEDIA_TYPE)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
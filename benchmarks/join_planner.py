@@ -0,0 +1,110 @@
+"""
+Query plans and timings of the unfiltered samples list queries (the count and the first page, with
+the default "-receivedAt" ordering) with every join path declared by the specifications (as before
+the join planner) against the joins planned from the clauses actually built.
+
+Prints `EXPLAIN (ANALYZE, BUFFERS)` of each statement, then its mean execution time.
+
+Needs the PostgreSQL database from the settings, with samples in it.
+
+Usage: PYTHONPATH=src python benchmarks/join_planner.py [runs]
+"""
+import sys
+import time
+
+from sqlalchemy import Select, create_engine, func, select, text
+from sqlalchemy.dialects import postgresql
+
+from apps.soil_laboratory.models import Sample
+from apps.soil_laboratory.repositories import SampleRepository
+from apps.soil_laboratory.specifications import (
+    PaginationSpecification,
+    SampleFilterSpecification,
+    SampleOrderingSpecification,
+    SampleSearchSpecification
+)
+from core.config import settings
+from repositories.join_planner import unique_join_paths
+
+
+PAGE_SIZE = 20
+
+
+def build_always_joined_stmt(
+    stmt: Select,
+    filter_spec: SampleFilterSpecification,
+    search_spec: SampleSearchSpecification,
+    ordering_spec: SampleOrderingSpecification
+) -> Select:
+    """Applies the specifications and joins every path they declare."""
+    stmt = search_spec.apply(filter_spec.apply(stmt))
+    join_paths = unique_join_paths(
+        filter_spec.join_paths,
+        search_spec.join_paths,
+        ordering_spec.join_paths
+    )
+
+    for path in join_paths:
+        stmt = stmt.join(path)
+
+    return stmt
+
+
+def build_statements() -> dict[str, Select]:
+    sample_repo = SampleRepository(db=None)
+    filter_spec = SampleFilterSpecification()
+    search_spec = SampleSearchSpecification(None)
+    ordering_spec = SampleOrderingSpecification(None)
+    pagination_spec = PaginationSpecification(1, PAGE_SIZE)
+
+    count_stmt = select(func.count(Sample.id))
+    page_stmt = ordering_spec.apply(select(Sample, func.count().over().label("total_count")))
+
+    def paginate(stmt: Select) -> Select:
+        return pagination_spec.apply(stmt).limit(pagination_spec.limit + 1)
+
+    return {
+        "count, always joined": build_always_joined_stmt(
+            count_stmt, filter_spec, search_spec, ordering_spec
+        ),
+        "count, planned": sample_repo._build_filtered_stmt(count_stmt, filter_spec, search_spec),
+        "page, always joined": paginate(build_always_joined_stmt(
+            page_stmt, filter_spec, search_spec, ordering_spec
+        )),
+        "page, planned": paginate(sample_repo._build_filtered_stmt(
+            page_stmt, filter_spec, search_spec, ordering_spec
+        ))
+    }
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    engine = create_engine(settings.SYNC_POSTGRES_DATABASE_URL)
+    timings = {}
+
+    with engine.connect() as connection:
+        for name, stmt in build_statements().items():
+            sql = str(stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True}
+            ))
+            plan = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")).scalars().all()
+
+            print(f"--- {name}\n{sql}\n")
+            print("\n".join(plan), end="\n\n")
+
+            # Warm up (buffer cache)
+            connection.execute(text(sql)).all()
+            start_time = time.perf_counter()
+
+            for _ in range(runs):
+                connection.execute(text(sql)).all()
+
+            timings[name] = (time.perf_counter() - start_time) / runs
+
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
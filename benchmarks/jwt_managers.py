@@ -0,0 +1,39 @@
+"""
+Encode and decode throughput of the python-jose based `JWTManager` against the hmac/hashlib based
+`HMACJWTManager`, for every supported HMAC algorithm.
+
+Usage: PYTHONPATH=src python benchmarks/jwt_managers.py
+"""
+import timeit
+
+from core.security.hmac_token_manager import HMAC_ALGORITHMS, HMACJWTManager
+from core.security.token_manager import JWTManager
+
+
+NUMBER = 20000
+DATA = {"sub": "8a6e0804-2bd0-4672-b79d-d97027f9071a", "email": "user@example.com"}
+
+
+def main() -> None:
+    print(f"{'':<22} {'encode/s':>10} {'decode/s':>10}")
+
+    for algorithm in HMAC_ALGORITHMS:
+        for manager_class in (JWTManager, HMACJWTManager):
+            jwt_manager = manager_class("access-secret", "refresh-secret", algorithm, 15, 7)
+            token = jwt_manager.create_access_token(DATA)
+
+            encode_seconds = timeit.timeit(
+                lambda: jwt_manager.create_access_token(DATA),
+                number=NUMBER
+            )
+            decode_seconds = timeit.timeit(
+                lambda: jwt_manager.decode_access_token(token),
+                number=NUMBER
+            )
+
+            print(f"{manager_class.__name__:<15} {algorithm} "
+                  f"{NUMBER / encode_seconds:10.0f} {NUMBER / decode_seconds:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
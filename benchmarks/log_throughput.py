@@ -0,0 +1,88 @@
+"""
+Log events per second of the production structlog configuration against the previous one (events
+rendered to str and passed on to stdlib `logging`), with and without the async sink, plus the cost
+of calls filtered out by the log level.
+
+Events are written to /dev/null, so the figures are the processing cost, not the output's.
+
+Usage: PYTHONPATH=src python benchmarks/log_throughput.py
+"""
+import logging
+import os
+import sys
+import timeit
+
+import structlog
+
+import core.context as context
+from core.logging import StructlogLogger, configure_structlog, shutdown_logging
+from core.logging.structlog.config import add_context_data
+
+
+NUMBER = 100_000
+
+
+def configure_previous(stream) -> None:
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            add_context_data,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer()
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True
+    )
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.StreamHandler(stream)]
+    root_logger.setLevel(logging.INFO)
+
+
+def measure() -> tuple[float, float]:
+    """Returns the info events and filtered debug calls per second."""
+    logger = StructlogLogger("benchmark")
+
+    info_seconds = timeit.timeit(
+        lambda: logger.info("Sample created", sample_id="8a6e0804", count=3),
+        number=NUMBER
+    )
+    debug_seconds = timeit.timeit(lambda: logger.debug("Filtered out"), number=NUMBER)
+
+    return NUMBER / info_seconds, NUMBER / debug_seconds
+
+
+def main() -> None:
+    context.set_correlation_id("abc-123")
+    context.set_request_method("GET")
+    context.set_request_path("/samples")
+    results = {}
+
+    # The production configuration writes to stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+
+        try:
+            configure_previous(devnull)
+            results["previous (stdlib)"] = measure()
+
+            configure_structlog(log_level="INFO", environment="production")
+            results["current"] = measure()
+
+            configure_structlog(log_level="INFO", environment="production", async_sink=True)
+            results["current, async sink"] = measure()
+            shutdown_logging()
+        finally:
+            sys.stdout = sys.__stdout__
+
+    for name, (events_per_second, filtered_per_second) in results.items():
+        print(f"{name:<20} {events_per_second:10.0f} events/s"
+              f"   {filtered_per_second:10.0f} filtered calls/s")
+
+
+if __name__ == "__main__":
+    main()
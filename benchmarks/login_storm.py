@@ -0,0 +1,66 @@
+"""
+Latency of unrelated requests on a worker while it handles a storm of logins, with bcrypt password
+verification run on the event loop (the previous behaviour) against run in the bounded password
+hashing pool.
+
+Unrelated requests are trivial handlers issued every few milliseconds on the same event loop, so
+their latency is the time they wait for the loop.
+
+Usage: PYTHONPATH=src python benchmarks/login_storm.py
+"""
+import asyncio
+import statistics
+import time
+
+from core.security.passwords import (
+    hash_password,
+    shutdown_password_executor,
+    verify_password,
+    verify_password_async
+)
+
+
+LOGINS = 10
+REQUEST_INTERVAL_SECONDS = 0.005
+
+
+async def unrelated_request() -> float:
+    start_time = time.perf_counter()
+    await asyncio.sleep(0)
+
+    return time.perf_counter() - start_time
+
+
+async def run(name: str, login) -> None:
+    hashed_password = hash_password("correct horse")
+    latencies = []
+    storm = asyncio.gather(*(login("correct horse", hashed_password) for _ in range(LOGINS)))
+    start_time = time.perf_counter()
+
+    while not storm.done():
+        latencies.append(await unrelated_request())
+        await asyncio.sleep(REQUEST_INTERVAL_SECONDS)
+
+    await storm
+    elapsed = time.perf_counter() - start_time
+
+    print(
+        f"{name:<10} storm {elapsed:6.2f} s   unrelated requests: {len(latencies):5d}"
+        f"   p50 {statistics.median(latencies) * 1000:8.2f} ms"
+        f"   max {max(latencies) * 1000:8.2f} ms"
+    )
+
+
+async def blocking_login(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+def main() -> None:
+    print(f"{LOGINS} concurrent logins")
+    asyncio.run(run("blocking", blocking_login))
+    asyncio.run(run("executor", verify_password_async))
+    shutdown_password_executor()
+
+
+if __name__ == "__main__":
+    main()
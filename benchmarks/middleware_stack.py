@@ -0,0 +1,201 @@
+"""
+Throughput and latency of an authenticated JSON endpoint behind the previous middleware stack
+(`BaseHTTPMiddleware` subclasses) against the current one (pure ASGI middlewares), with and without
+the verified token cache.
+
+Requests are sent straight to the ASGI application by concurrent in-process clients (no server and
+no network), and logging calls are no-ops, so the figures are the middlewares' own overhead.
+
+Usage: PYTHONPATH=src python benchmarks/middleware_stack.py
+"""
+import asyncio
+import statistics
+import time
+import traceback
+import uuid
+from typing import Callable
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+import core.context as context
+from core.exceptions import AppException
+from core.middleware import (
+    ErrorHandlingMiddleware,
+    JWTAuthenticationMiddleware,
+    RequestLoggingMiddleware
+)
+from core.security.hmac_token_manager import HMACJWTManager
+from core.security.token_cache import VerifiedTokenCache
+
+
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 200
+
+
+class NullLogger:
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+# Previous middlewares (as they were before the pure ASGI rewrite)
+
+class BaseRequestLoggingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, logger):
+        super().__init__(app)
+        self._logger = logger
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        correlation_id = request.headers.get("Correlation-Id", str(uuid.uuid4()))
+        context.set_correlation_id(correlation_id)
+        context.set_request_method(request.method)
+        context.set_request_path(request.url.path)
+
+        start_time = time.perf_counter()
+        self._logger.request_start(request)
+
+        response = await call_next(request)
+
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        response.headers["Correlation-Id"] = correlation_id
+        self._logger.request_end(request, response.status_code, duration_ms)
+
+        return response
+
+
+class BaseErrorHandlingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, logger):
+        super().__init__(app)
+        self._logger = logger
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        try:
+            return await call_next(request)
+        except AppException as e:
+            self._logger.request_error(e, request)
+
+            return JSONResponse(
+                status_code=e.status_code,
+                content={"detail": e.message, "exception": traceback.format_exc()}
+            )
+        except Exception as e:
+            self._logger.request_unexpected_error(e, request)
+
+            return JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": "Internal Server Error", "exception": traceback.format_exc()}
+            )
+
+
+class BaseJWTAuthenticationMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, jwt_manager):
+        super().__init__(app)
+        self.jwt_manager = jwt_manager
+
+    async def dispatch(self, request: Request, call_next):
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+        if scheme != "Bearer" or not token:
+            return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={})
+
+        payload = self.jwt_manager.decode_access_token(token)
+        request.state.user_id = payload.get("sub")
+        request.state.user_email = payload.get("email")
+
+        return await call_next(request)
+
+
+def build_app(stack: str, jwt_manager: HMACJWTManager) -> FastAPI:
+    app = FastAPI()
+    logger = NullLogger()
+
+    @app.get("/api/v1/samples")
+    async def list_samples(request: Request):
+        return {"items": [{"id": i, "user": request.state.user_id} for i in range(20)]}
+
+    if stack == "previous":
+        app.add_middleware(BaseJWTAuthenticationMiddleware, jwt_manager=jwt_manager)
+        app.add_middleware(BaseErrorHandlingMiddleware, logger=logger)
+        app.add_middleware(BaseRequestLoggingMiddleware, logger=logger)
+    else:
+        app.add_middleware(
+            JWTAuthenticationMiddleware,
+            jwt_manager=jwt_manager,
+            token_cache=VerifiedTokenCache(max_size=1000) if stack == "current+cache" else None
+        )
+        app.add_middleware(ErrorHandlingMiddleware, logger=logger)
+        app.add_middleware(RequestLoggingMiddleware, logger=logger)
+
+    return app
+
+
+async def request(app: FastAPI, token: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/samples",
+        "raw_path": b"/api/v1/samples",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "server": ("benchmark", 80),
+        "client": ("benchmark", 50000)
+    }
+    response_complete = asyncio.Event()
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await response_complete.wait()
+
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    start_time = time.perf_counter()
+    await app(scope, receive, send)
+
+    return time.perf_counter() - start_time
+
+
+async def run(stack: str) -> None:
+    jwt_manager = HMACJWTManager("access-secret", "refresh-secret", "HS256", 15, 7)
+    app = build_app(stack, jwt_manager)
+    token = jwt_manager.create_access_token({"sub": "user-1", "email": "user@example.com"})
+
+    async def client() -> list[float]:
+        return [await request(app, token) for _ in range(REQUESTS_PER_CLIENT)]
+
+    # Warm up (route compilation, schema caches)
+    await client()
+
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(client() for _ in range(CLIENTS)))
+    elapsed = time.perf_counter() - start_time
+
+    latencies = [latency for result in results for latency in result]
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f"{stack:<14} {len(latencies) / elapsed:10.0f} req/s   p99 {p99 * 1000:7.2f} ms")
+
+
+def main() -> None:
+    print(f"{CLIENTS} concurrent clients x {REQUESTS_PER_CLIENT} requests")
+
+    for stack in ("previous", "current", "current+cache"):
+        asyncio.run(run(stack))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Refresh token lookups by the previous 512-character unique `token` column against the 32-byte
+SHA-256 `token_hash` column, on tables of a few million rows, plus the size of each unique index.
+
+Needs the PostgreSQL database from the settings. The tables are created as temporary tables, so
+nothing is left behind.
+
+Usage: PYTHONPATH=src python benchmarks/refresh_token_lookup.py [rows]
+"""
+import hashlib
+import random
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+
+from core.config import settings
+
+
+LOOKUPS = 20000
+# Previous tokens were 512 characters long (the refresh JWTs stored verbatim)
+TOKEN_PREFIX = "x" * 448
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+    engine = create_engine(settings.SYNC_POSTGRES_DATABASE_URL)
+
+    with engine.connect() as connection:
+        connection.execute(text(
+            "CREATE TEMPORARY TABLE tokens_by_value "
+            "(id bigint PRIMARY KEY, token varchar(512) UNIQUE)"
+        ))
+        connection.execute(text(
+            "CREATE TEMPORARY TABLE tokens_by_hash (id bigint PRIMARY KEY, token_hash bytea UNIQUE)"
+        ))
+        connection.execute(text(
+            "INSERT INTO tokens_by_value "
+            "SELECT i, :prefix || md5(i::text) FROM generate_series(1, :rows) AS i"
+        ), {"prefix": TOKEN_PREFIX, "rows": rows})
+        connection.execute(text(
+            "INSERT INTO tokens_by_hash "
+            "SELECT id, sha256(convert_to(token, 'UTF8')) FROM tokens_by_value"
+        ))
+        connection.execute(text("ANALYZE tokens_by_value"))
+        connection.execute(text("ANALYZE tokens_by_hash"))
+
+        tokens = [
+            TOKEN_PREFIX + hashlib.md5(str(random.randint(1, rows)).encode()).hexdigest()
+            for _ in range(LOOKUPS)
+        ]
+
+        start_time = time.perf_counter()
+
+        for token in tokens:
+            connection.execute(
+                text("SELECT id FROM tokens_by_value WHERE token = :token"),
+                {"token": token}
+            ).one()
+
+        by_value_seconds = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+
+        for token in tokens:
+            connection.execute(
+                text("SELECT id FROM tokens_by_hash WHERE token_hash = :token_hash"),
+                {"token_hash": hashlib.sha256(token.encode()).digest()}
+            ).one()
+
+        by_hash_seconds = time.perf_counter() - start_time
+
+        index_sizes = dict(connection.execute(text(
+            "SELECT relname, pg_size_pretty(pg_relation_size(oid)) FROM pg_class "
+            "WHERE relname IN ('tokens_by_value_token_key', 'tokens_by_hash_token_hash_key')"
+        )).all())
+
+    print(f"{rows} tokens, {LOOKUPS} lookups")
+    print(f"token (varchar 512):  {by_value_seconds / LOOKUPS * 1e6:7.1f} us/lookup"
+          f"   unique index {index_sizes['tokens_by_value_token_key']}")
+    print(f"token_hash (bytea 32): {by_hash_seconds / LOOKUPS * 1e6:7.1f} us/lookup"
+          f"   unique index {index_sizes['tokens_by_hash_token_hash_key']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Validation cost of a 20-item samples page: ORM objects through `from_attributes` (the previous
+list path) against projected mappings through a cached `TypeAdapter` (the projection path).
+
+Only the Python side is measured (no database): the ORM objects are built in memory, so their
+hydration cost from result rows comes on top of the "ORM" figure in a real request.
+
+Usage: PYTHONPATH=src python benchmarks/sample_list_validation.py
+"""
+import timeit
+import uuid
+from datetime import datetime, timezone
+
+from apps.soil_laboratory.models import (
+    Material,
+    MaterialSource,
+    MaterialType,
+    Parameter,
+    Sample,
+    TestResult
+)
+from apps.soil_laboratory.schemas.sample import SampleListItemResponse
+from core.config import settings
+from schemas.utils import get_type_adapter, resolve_schemas_forward_refs
+
+
+PAGE_SIZE = 20
+TEST_RESULTS_PER_SAMPLE = 3
+NUMBER = 2000
+
+
+def build_samples() -> list[Sample]:
+    now = datetime.now(timezone.utc)
+    material_type = MaterialType(id=uuid.uuid4(), code="SAND", name="Sand")
+    material = Material(id=uuid.uuid4(), name="Quartz sand", material_type=material_type)
+    material_source = MaterialSource(id=uuid.uuid4(), code="Q1", name="Quarry 1")
+    parameters = [
+        Parameter(id=uuid.uuid4(), code=f"P{i}", name=f"Parameter {i}", units="%")
+        for i in range(TEST_RESULTS_PER_SAMPLE)
+    ]
+
+    return [
+        Sample(
+            id=uuid.uuid4(),
+            material=material,
+            material_source=material_source,
+            temperature=20.5,
+            received_at=now,
+            created_at=now,
+            updated_at=now,
+            test_results=[
+                TestResult(
+                    id=uuid.uuid4(),
+                    parameter=parameter,
+                    mean_value=1.5,
+                    variation_percentage=2.5,
+                    is_compliant=True
+                )
+                for parameter in parameters
+            ]
+        )
+        for _ in range(PAGE_SIZE)
+    ]
+
+
+def to_mapping(sample: Sample) -> dict:
+    """The mapping the projection path returns for a sample (nested objects as JSON values)."""
+    material = sample.material
+    material_type = material.material_type
+
+    return {
+        "id": sample.id,
+        "material": {
+            "id": str(material.id),
+            "name": material.name,
+            "material_type": {
+                "id": str(material_type.id),
+                "code": material_type.code,
+                "name": material_type.name
+            }
+        },
+        "material_source": {
+            "id": str(sample.material_source.id),
+            "code": sample.material_source.code,
+            "name": sample.material_source.name
+        },
+        "temperature": sample.temperature,
+        "received_at": sample.received_at,
+        "test_results": [
+            {
+                "id": str(test_result.id),
+                "parameter": {
+                    "id": str(test_result.parameter.id),
+                    "code": test_result.parameter.code,
+                    "name": test_result.parameter.name,
+                    "units": test_result.parameter.units
+                },
+                "mean_value": test_result.mean_value,
+                "variation_percentage": test_result.variation_percentage,
+                "is_compliant": test_result.is_compliant
+            }
+            for test_result in sample.test_results
+        ],
+        "created_at": sample.created_at,
+        "created_by_id": None,
+        "updated_at": sample.updated_at,
+        "updated_by_id": None,
+        "deleted_at": None
+    }
+
+
+def main() -> None:
+    resolve_schemas_forward_refs(settings.BASE_DIR / "apps")
+
+    samples = build_samples()
+    mappings = [to_mapping(sample) for sample in samples]
+    adapter = get_type_adapter(list[SampleListItemResponse])
+
+    orm_seconds = timeit.timeit(
+        lambda: [SampleListItemResponse.model_validate(sample) for sample in samples],
+        number=NUMBER
+    )
+    projected_seconds = timeit.timeit(lambda: adapter.validate_python(mappings), number=NUMBER)
+
+    print(f"{PAGE_SIZE}-item page, {TEST_RESULTS_PER_SAMPLE} test results per sample")
+    print(f"ORM objects (from_attributes):  {orm_seconds / NUMBER * 1e6:8.1f} us/page")
+    print(f"Mappings (cached TypeAdapter):  {projected_seconds / NUMBER * 1e6:8.1f} us/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Cost of authenticating a request's access token: a full decode (parse, signature verification and
+claims validation) against a lookup in the verified token cache, for both JWT managers.
+
+Usage: PYTHONPATH=src python benchmarks/token_decode.py
+"""
+import timeit
+
+from core.security.hmac_token_manager import HMACJWTManager
+from core.security.interfaces import JWTManagerInterface
+from core.security.token_cache import VerifiedTokenCache
+from core.security.token_manager import JWTManager
+
+
+NUMBER = 20000
+
+
+def measure(name: str, jwt_manager: JWTManagerInterface) -> None:
+    token = jwt_manager.create_access_token({"sub": "user-1", "email": "user@example.com"})
+    cache = VerifiedTokenCache(max_size=4096)
+
+    def decode_with_cache() -> None:
+        payload = cache.get(token)
+
+        if payload is None:
+            cache.set(token, jwt_manager.decode_access_token(token))
+
+    decode_seconds = timeit.timeit(lambda: jwt_manager.decode_access_token(token), number=NUMBER)
+    cached_seconds = timeit.timeit(decode_with_cache, number=NUMBER)
+
+    print(f"{name:<16} decode {decode_seconds / NUMBER * 1e6:7.1f} us"
+          f"   cached {cached_seconds / NUMBER * 1e6:7.1f} us")
+
+
+def main() -> None:
+    arguments = ("access-secret", "refresh-secret", "HS256", 15, 7)
+
+    measure("JWTManager", JWTManager(*arguments))
+    measure("HMACJWTManager", HMACJWTManager(*arguments))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from apps.identity.schemas import (
     UserData
 )
 from apps.identity.services import PermissionService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/permissions", tags=["permissions"])
@@ -33,6 +34,11 @@ async def get_permission_lookups_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -46,6 +52,7 @@ async def get_permission_lookups_list(
     return await permission_service.get_permissions_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
@@ -67,6 +74,11 @@ async def get_permissions_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -80,6 +92,7 @@ async def get_permissions_list(
     return await permission_service.get_permissions_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
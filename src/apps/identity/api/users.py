@@ -12,6 +12,7 @@ from apps.identity.schemas import (
     UserUpdate
 )
 from apps.identity.services import UserService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -33,6 +34,11 @@ async def get_users_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -46,6 +52,7 @@ async def get_users_list(
     return await user_service.get_users_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
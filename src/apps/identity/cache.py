@@ -0,0 +1,206 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Final, Protocol
+from uuid import UUID
+
+from apps.identity.schemas import UserData
+from core.config import settings
+
+
+@dataclass(slots=True, frozen=True)
+class UserDataCacheStats:
+    """
+    Snapshot of a user data cache's lookups made by this process.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups of absent or expired entries.
+    """
+    hits: int
+    misses: int
+
+
+class UserDataCacheInterface(ABC):
+    """Interface for caches of authenticated users' data (`UserData`), keyed by user ID."""
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> UserData | None:
+        """Return the cached user data, or `None` if absent or expired."""
+        ...
+
+    @abstractmethod
+    async def set(self, user_data: UserData) -> None:
+        """Store the user data for the configured TTL."""
+        ...
+
+    @abstractmethod
+    async def invalidate(self, *user_ids: UUID) -> None:
+        """Drop the entries of the given users."""
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry (e.g., after a role's or a permission's change)."""
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> UserDataCacheStats:
+        """Return the counts of lookups made by this process."""
+        ...
+
+
+class InMemoryUserDataCache(UserDataCacheInterface):
+    """
+    Bounded, TTL-based in-process user data cache with LRU eviction.
+
+    Each worker process has its own cache, so invalidations only reach the worker that made the
+    change: on the other workers, a deactivated user or a revoked permission stays effective until
+    the entry expires. Keep the TTL short with several workers, or use `RedisUserDataCache`.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[UserData, float]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, user_id: UUID) -> UserData | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            user_data, expires_at = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+
+            return user_data
+
+    async def set(self, user_data: UserData) -> None:
+        with self._lock:
+            expires_at = time.monotonic() + self._ttl_seconds
+            self._entries[user_data.id] = (user_data, expires_at)
+            self._entries.move_to_end(user_data.id)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    async def invalidate(self, *user_ids: UUID) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> UserDataCacheStats:
+        with self._lock:
+            return UserDataCacheStats(hits=self._hits, misses=self._misses)
+
+
+class RedisClientProtocol(Protocol):
+    """The subset of the `redis.asyncio.Redis` API used by `RedisUserDataCache`."""
+
+    async def get(self, name: str) -> bytes | str | None:
+        ...
+
+    async def set(self, name: str, value: str, ex: int | None = None) -> Any:
+        ...
+
+    async def delete(self, *names: str) -> int:
+        ...
+
+    def scan_iter(self, match: str | None = None) -> Any:
+        ...
+
+
+class RedisUserDataCache(UserDataCacheInterface):
+    """
+    User data cache shared by all worker processes through a Redis-protocol server.
+
+    Entries are stored as JSON and expire on the server's side (Redis evicts them according to its
+    `maxmemory-policy`, e.g., `volatile-lru`, which spares the non-expiring permissions epochs kept
+    on the same server). Any client implementing `RedisClientProtocol` can be used, e.g., an
+    in-process stand-in for local development and testing.
+    """
+
+    def __init__(
+        self,
+        client: RedisClientProtocol,
+        ttl_seconds: int,
+        key_prefix: str = "user_data"
+    ):
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self._hits = 0
+        self._misses = 0
+
+    def _get_key(self, user_id: UUID) -> str:
+        return f"{self._key_prefix}:{user_id}"
+
+    async def get(self, user_id: UUID) -> UserData | None:
+        cached = await self._client.get(self._get_key(user_id))
+
+        if cached is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+
+        return UserData.model_validate_json(cached)
+
+    async def set(self, user_data: UserData) -> None:
+        await self._client.set(
+            self._get_key(user_data.id),
+            user_data.model_dump_json(),
+            ex=self._ttl_seconds
+        )
+
+    async def invalidate(self, *user_ids: UUID) -> None:
+        if user_ids:
+            await self._client.delete(*(self._get_key(user_id) for user_id in user_ids))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=f"{self._key_prefix}:*")]
+
+        if keys:
+            await self._client.delete(*keys)
+
+    def get_stats(self) -> UserDataCacheStats:
+        return UserDataCacheStats(hits=self._hits, misses=self._misses)
+
+
+def create_user_data_cache() -> UserDataCacheInterface:
+    """Create the user data cache backend selected by `USER_DATA_CACHE_BACKEND`."""
+    if settings.USER_DATA_CACHE_BACKEND == "redis":
+        # Optional dependency, only required by the Redis backend
+        from redis.asyncio import Redis
+
+        return RedisUserDataCache(
+            Redis.from_url(settings.REDIS_URL),
+            ttl_seconds=settings.USER_DATA_CACHE_TTL_SECONDS
+        )
+
+    return InMemoryUserDataCache(
+        max_size=settings.USER_DATA_CACHE_MAX_SIZE,
+        ttl_seconds=settings.USER_DATA_CACHE_TTL_SECONDS
+    )
+
+
+# Global user data cache instance
+user_data_cache: Final[UserDataCacheInterface] = create_user_data_cache()
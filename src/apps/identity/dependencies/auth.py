@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import Depends, Request
 
 import core.context as context
+from apps.identity.dependencies.cache import get_permissions_epoch_store
 from apps.identity.dependencies.services import get_auth_service
 from apps.identity.exceptions import (
     AuthenticationError,
@@ -11,13 +12,35 @@ from apps.identity.exceptions import (
     InsufficientRolesError,
     UserNotFoundError
 )
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.schemas import UserData
 from apps.identity.services import AuthService
+from core.config import settings
+
+
+async def _get_user_data_from_token_claims(
+    request: Request,
+    user_id: UUID,
+    permissions_epoch_store: PermissionsEpochStoreInterface
+) -> UserData | None:
+    """Rebuild user data from the access token's claims, unless they are missing or stale."""
+    payload = getattr(request.state, "access_token_payload", None)
+
+    if not settings.JWT_EMBED_AUTHORIZATION_CLAIMS or not payload or "pe" not in payload:
+        return None
+
+    permissions_epoch = await permissions_epoch_store.get(user_id)
+
+    if permissions_epoch is None or payload["pe"] != permissions_epoch:
+        return None
+
+    return UserData.from_token_claims(payload)
 
 
 async def _get_current_user(
     request: Request,
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AuthService = Depends(get_auth_service),
+    permissions_epoch_store: PermissionsEpochStoreInterface = Depends(get_permissions_epoch_store)
 ) -> UserData:
     x_user_id = getattr(request.state, "user_id", None)
 
@@ -29,7 +52,10 @@ async def _get_current_user(
     except ValueError:
         raise AuthenticationError("Invalid user ID format")
 
-    user_data = await auth_service.get_user_data(user_id)
+    user_data = (
+        await _get_user_data_from_token_claims(request, user_id, permissions_epoch_store)
+        or await auth_service.get_user_data(user_id)
+    )
 
     if not user_data:
         raise UserNotFoundError(user_id=user_id)
@@ -0,0 +1,10 @@
+from apps.identity.cache import UserDataCacheInterface, user_data_cache
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface, permissions_epoch_store
+
+
+def get_user_data_cache() -> UserDataCacheInterface:
+    return user_data_cache
+
+
+def get_permissions_epoch_store() -> PermissionsEpochStoreInterface:
+    return permissions_epoch_store
@@ -1,12 +1,15 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.identity.cache import UserDataCacheInterface
+from apps.identity.dependencies.cache import get_permissions_epoch_store, get_user_data_cache
 from apps.identity.dependencies.repositories import (
     get_permission_repository,
     get_role_repository,
     get_token_repository,
     get_user_repository
 )
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.repositories import (
     PermissionRepository,
     RoleRepository,
@@ -24,29 +27,51 @@ def get_auth_service(
     jwt_manager: JWTManagerInterface = Depends(get_jwt_manager),
     user_repo: UserRepository = Depends(get_user_repository),
     token_repo: TokenRepository = Depends(get_token_repository),
+    user_data_cache: UserDataCacheInterface = Depends(get_user_data_cache),
+    permissions_epoch_store: PermissionsEpochStoreInterface = Depends(get_permissions_epoch_store)
 ) -> AuthService:
-    return AuthService(db, jwt_manager, user_repo, token_repo)
+    return AuthService(
+        db,
+        jwt_manager,
+        user_repo,
+        token_repo,
+        user_data_cache,
+        permissions_epoch_store
+    )
 
 
 def get_permission_service(
     db: AsyncSession = Depends(get_db_session),
-    permission_repo: PermissionRepository = Depends(get_permission_repository)
+    permission_repo: PermissionRepository = Depends(get_permission_repository),
+    user_data_cache: UserDataCacheInterface = Depends(get_user_data_cache),
+    permissions_epoch_store: PermissionsEpochStoreInterface = Depends(get_permissions_epoch_store)
 ) -> PermissionService:
-    return PermissionService(db, permission_repo)
+    return PermissionService(db, permission_repo, user_data_cache, permissions_epoch_store)
 
 
 def get_role_service(
     db: AsyncSession = Depends(get_db_session),
     role_repo: RoleRepository = Depends(get_role_repository),
-    permission_repo: PermissionRepository = Depends(get_permission_repository)
+    permission_repo: PermissionRepository = Depends(get_permission_repository),
+    user_data_cache: UserDataCacheInterface = Depends(get_user_data_cache),
+    permissions_epoch_store: PermissionsEpochStoreInterface = Depends(get_permissions_epoch_store)
 ) -> RoleService:
-    return RoleService(db, role_repo, permission_repo)
+    return RoleService(db, role_repo, permission_repo, user_data_cache, permissions_epoch_store)
 
 
 def get_user_service(
     db: AsyncSession = Depends(get_db_session),
     user_repo: UserRepository = Depends(get_user_repository),
     role_repo: RoleRepository = Depends(get_role_repository),
-    permission_repo: PermissionRepository = Depends(get_permission_repository)
+    permission_repo: PermissionRepository = Depends(get_permission_repository),
+    user_data_cache: UserDataCacheInterface = Depends(get_user_data_cache),
+    permissions_epoch_store: PermissionsEpochStoreInterface = Depends(get_permissions_epoch_store)
 ) -> UserService:
-    return UserService(db, user_repo, role_repo, permission_repo)
+    return UserService(
+        db,
+        user_repo,
+        role_repo,
+        permission_repo,
+        user_data_cache,
+        permissions_epoch_store
+    )
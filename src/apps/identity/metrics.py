@@ -0,0 +1,24 @@
+from apps.identity.cache import UserDataCacheInterface
+from core.metrics import MetricsRegistry
+
+
+def register_user_data_cache_metrics(
+    registry: MetricsRegistry,
+    user_data_cache: UserDataCacheInterface
+) -> None:
+    """Expose the user data cache's lookups."""
+    hits = registry.counter(
+        "auth_user_data_cache_hits_total",
+        "User data lookups answered from the cache."
+    )
+    misses = registry.counter(
+        "auth_user_data_cache_misses_total",
+        "User data lookups that required a database query (absent or expired entries)."
+    )
+
+    def collect() -> None:
+        stats = user_data_cache.get_stats()
+        hits.inc_to_total(stats.hits)
+        misses.inc_to_total(stats.misses)
+
+    registry.add_collect_hook(collect)
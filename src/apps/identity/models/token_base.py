@@ -1,18 +1,15 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String, UUID
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from core.security.utils import generate_secure_token
 from database.models.base import BaseORM
 
 
 class BaseToken(BaseORM):
     __abstract__ = True
 
-    TOKEN_LENGTH: int = 64
-
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -20,14 +17,13 @@ class BaseToken(BaseORM):
         nullable=False
     )
 
-    token: Mapped[str] = mapped_column(
-        String(TOKEN_LENGTH),
-        unique=True,
-        default=generate_secure_token
-    )
+    # SHA-256 digest of the token (see `core.security.utils.hash_token`), the token itself is never
+    # stored
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True)
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc) + timedelta(days=1)
+        default=lambda: datetime.now(timezone.utc) + timedelta(days=1),
+        index=True
     )
 
     def is_expired(self) -> bool:
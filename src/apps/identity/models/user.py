@@ -6,7 +6,7 @@ from sqlalchemy import Boolean, DateTime, String, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from apps.identity.models.relationships import users_permissions, users_roles
-from core.security.passwords import hash_password, verify_password
+from core.security.passwords import hash_password, verify_password, verify_password_async
 from database.models import BaseORM, BusinessEntityMetadataMixin
 from database.utils import safe_relationship
 
@@ -49,17 +49,25 @@ class User(BaseORM, BusinessEntityMetadataMixin):
         first_name: str,
         last_name: str,
         email: str,
-        raw_password: str,
+        raw_password: str | None = None,
         is_active: bool = True,
         is_superuser: bool = False,
-        id: uuid.UUID | None = None
+        id: uuid.UUID | None = None,
+        hashed_password: str | None = None
     ) -> Self:
         """
         Factory method to create a new User instance.
 
         This method simplifies the creation of a new user by handling password hashing and setting
-        required attributes.
+        required attributes. Pass either `raw_password` (hashed here, blocking) or `hashed_password`
+        (e.g., hashed off the event loop with `hash_password_async`).
+
+        Raises:
+            ValueError: If neither `raw_password` nor `hashed_password` is given.
         """
+        if raw_password is None and hashed_password is None:
+            raise ValueError("Either raw_password or hashed_password must be given")
+
         user = cls(
             id=id if id is not None else uuid.uuid4(),
             first_name=first_name,
@@ -68,7 +76,10 @@ class User(BaseORM, BusinessEntityMetadataMixin):
             is_active=is_active,
             is_superuser=is_superuser
         )
-        user.password = raw_password
+        if hashed_password is not None:
+            user._hashed_password = hashed_password
+        else:
+            user.password = raw_password
 
         return user
 
@@ -86,5 +97,9 @@ class User(BaseORM, BusinessEntityMetadataMixin):
         """Verify the provided password against the stored hashed password."""
         return verify_password(raw_password, self._hashed_password)
 
+    async def verify_password_async(self, raw_password: str) -> bool:
+        """Verify the provided password without blocking the event loop."""
+        return await verify_password_async(raw_password, self._hashed_password)
+
     def __repr__(self) -> str:
         return f"<User id={self.id} email='{self.email}')>"
@@ -0,0 +1,64 @@
+from threading import Lock
+from typing import Final, Iterable
+
+
+class PermissionRegistry:
+    """
+    Process-wide registry assigning each permission code a bit, so sets of permission codes compile
+    into integer bitsets and permission checks become single bit tests.
+
+    Bits are only ever added (never reassigned), so bitsets compiled earlier stay valid. Whenever a
+    code is added the `generation` changes and bitsets compiled before should be recompiled to
+    include it.
+    """
+
+    def __init__(self):
+        self._bits: dict[str, int] = {}
+        self._masks: dict[tuple[str, ...], int | None] = {}
+        self._lock = Lock()
+        self.generation = 0
+
+    def rebuild(self, codes: Iterable[str]) -> None:
+        """Registers the given permission codes (keeping the bits of those already registered)."""
+        with self._lock:
+            bits = dict(self._bits)
+
+            for code in sorted(set(codes) - bits.keys()):
+                bits[code] = 1 << len(bits)
+
+            if len(bits) == len(self._bits):
+                return
+
+            self._bits = bits
+            self._masks = {}
+            self.generation += 1
+
+    def compile(self, codes: Iterable[str]) -> int:
+        """Compiles permission codes into a bitset, ignoring codes that are not registered."""
+        bits = self._bits
+        bitset = 0
+
+        for code in codes:
+            bitset |= bits.get(code, 0)
+
+        return bitset
+
+    def get_mask(self, codes: tuple[str, ...]) -> int | None:
+        """
+        Returns the (memoized) bitset of the required permission codes, or `None` if any of them is
+        not registered (the caller should then fall back to comparing the codes).
+        """
+        masks = self._masks
+
+        if codes in masks:
+            return masks[codes]
+
+        bits = self._bits
+        mask = self.compile(codes) if all(code in bits for code in codes) else None
+        masks[codes] = mask
+
+        return mask
+
+
+# Global permission registry instance
+permission_registry: Final[PermissionRegistry] = PermissionRegistry()
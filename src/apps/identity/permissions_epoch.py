@@ -0,0 +1,149 @@
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Any, Final, Protocol
+from uuid import UUID
+
+from core.config import settings
+
+
+class PermissionsEpochStoreInterface(ABC):
+    """
+    Interface for stores of "permissions epochs".
+
+    An epoch identifies the state of a user's roles and permissions. It changes whenever they (or a
+    role's or a permission's definition) change, so authorization claims stamped with an older
+    epoch (e.g., in an access token) can be recognized as stale.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> str | None:
+        """
+        Return the user's current epoch, or `None` if it's unknown (e.g., lost by the store). Claims
+        can't be checked against an unknown epoch, so they must be neither trusted nor stamped.
+        """
+        ...
+
+    @abstractmethod
+    async def bump(self, *user_ids: UUID) -> None:
+        """Change the epochs of the given users."""
+        ...
+
+    @abstractmethod
+    async def bump_all(self) -> None:
+        """Change the epochs of all users (e.g., after a role's or a permission's change)."""
+        ...
+
+
+class InMemoryPermissionsEpochStore(PermissionsEpochStoreInterface):
+    """
+    In-process permissions epoch store, for a single worker process only.
+
+    The global part of the epoch starts from the process start time, so epochs never repeat across
+    restarts. Epochs are not shared between processes: a change handled by one worker bumps only
+    that worker's epochs, and the claims stamped by another worker keep matching its own epochs
+    until the tokens expire. `create_permissions_epoch_store` therefore refuses to use this store
+    with several workers; use the Redis store instead.
+    """
+
+    def __init__(self):
+        self._global_epoch = time.time_ns()
+        self._user_epochs: dict[UUID, int] = {}
+        self._lock = Lock()
+
+    async def get(self, user_id: UUID) -> str:
+        with self._lock:
+            return f"{self._global_epoch}.{self._user_epochs.get(user_id, 0)}"
+
+    async def bump(self, *user_ids: UUID) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._user_epochs[user_id] = self._user_epochs.get(user_id, 0) + 1
+
+    async def bump_all(self) -> None:
+        with self._lock:
+            self._global_epoch += 1
+
+
+class RedisClientProtocol(Protocol):
+    """The subset of the `redis.asyncio.Redis` API used by `RedisPermissionsEpochStore`."""
+
+    async def mget(self, keys: list[str]) -> list[bytes | str | None]:
+        ...
+
+    async def incr(self, name: str) -> int:
+        ...
+
+    async def set(self, name: str, value: int, nx: bool = False) -> Any:
+        ...
+
+
+class RedisPermissionsEpochStore(PermissionsEpochStoreInterface):
+    """
+    Permissions epoch store shared by all worker processes through a Redis-protocol server.
+
+    Epoch keys have no expiry and must not be evicted: a server shared with the user data cache
+    needs a `volatile-*` `maxmemory-policy` (e.g., `volatile-lru`, which evicts only the cache's
+    expiring entries) or `noeviction`, never an `allkeys-*` one.
+
+    A missing key still can't revive stale claims: it makes the epoch unknown, and it's seeded anew
+    from the current time, so it never repeats an epoch stamped before it was lost.
+    """
+
+    def __init__(self, client: RedisClientProtocol, key_prefix: str = "permissions_epoch"):
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def _get_key(self, user_id: UUID | None) -> str:
+        return f"{self._key_prefix}:{user_id if user_id is not None else 'global'}"
+
+    async def get(self, user_id: UUID) -> str | None:
+        keys = [self._get_key(None), self._get_key(user_id)]
+        epochs = await self._client.mget(keys)
+
+        if any(epoch is None for epoch in epochs):
+            # Never stored or evicted: seed the missing keys (unless another worker just did)
+            for key, epoch in zip(keys, epochs):
+                if epoch is None:
+                    await self._client.set(key, time.time_ns(), nx=True)
+
+            return None
+
+        global_epoch, user_epoch = epochs
+
+        return f"{int(global_epoch)}.{int(user_epoch)}"
+
+    async def bump(self, *user_ids: UUID) -> None:
+        for user_id in user_ids:
+            await self._client.incr(self._get_key(user_id))
+
+    async def bump_all(self) -> None:
+        await self._client.incr(self._get_key(None))
+
+
+def create_permissions_epoch_store() -> PermissionsEpochStoreInterface:
+    """
+    Create the permissions epoch store backend selected by `USER_DATA_CACHE_BACKEND`.
+
+    Raises:
+        RuntimeError: If authorization claims are embedded into access tokens and served by several
+        worker processes without a shared (Redis) store, so revocations would not reach them.
+    """
+    if settings.USER_DATA_CACHE_BACKEND == "redis":
+        # Optional dependency, only required by the Redis backend
+        from redis.asyncio import Redis
+
+        return RedisPermissionsEpochStore(Redis.from_url(settings.REDIS_URL))
+
+    if settings.JWT_EMBED_AUTHORIZATION_CLAIMS and settings.WEB_CONCURRENCY > 1:
+        raise RuntimeError(
+            "JWT_EMBED_AUTHORIZATION_CLAIMS with several worker processes requires "
+            "USER_DATA_CACHE_BACKEND=redis: in-memory permissions epochs are per process, so "
+            "revocations would not reach tokens stamped by the other workers"
+        )
+
+    return InMemoryPermissionsEpochStore()
+
+
+# Global permissions epoch store instance
+permissions_epoch_store: Final[PermissionsEpochStoreInterface] = create_permissions_epoch_store()
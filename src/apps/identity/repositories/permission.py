@@ -1,5 +1,6 @@
 from enum import Enum
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Load, selectinload
 
@@ -34,3 +35,10 @@ class PermissionRepository(
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Permission)
+
+    async def get_active_codes(self) -> list[str]:
+        """Retrieve the codes of all permissions that are not archived."""
+        stmt = select(Permission.code).where(Permission.archived_at.is_(None))
+        result = await self.db.execute(stmt)
+
+        return list(result.scalars().all())
@@ -1,9 +1,11 @@
 from uuid import UUID
 
+from sqlalchemy import delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from apps.identity.models import RefreshToken
+from core.security.utils import hash_token
 
 
 class TokenRepository:
@@ -11,7 +13,7 @@ class TokenRepository:
         self.db = db
 
     async def get_refresh_token_by_token(self, token: str) -> RefreshToken | None:
-        stmt = select(RefreshToken).filter_by(token=token)
+        stmt = select(RefreshToken).where(RefreshToken.token_hash == hash_token(token))
         result = await self.db.execute(stmt)
 
         return result.scalars().first()
@@ -23,7 +25,7 @@ class TokenRepository:
     ) -> RefreshToken | None:
         stmt = (
             select(RefreshToken)
-            .where(RefreshToken.token == token)
+            .where(RefreshToken.token_hash == hash_token(token))
             .where(RefreshToken.user_id == user_id)
         )
         result = await self.db.execute(stmt)
@@ -35,3 +37,24 @@ class TokenRepository:
 
     async def delete_refresh_token(self, refresh_token: RefreshToken) -> None:
         await self.db.delete(refresh_token)
+
+    async def delete_expired_refresh_tokens(self, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` expired refresh tokens, returning how many were deleted.
+
+        Rows locked by concurrent purges (e.g., in other worker processes) are skipped.
+        """
+        expired_ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+
+        return result.rowcount
@@ -1,11 +1,14 @@
 from enum import Enum
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, func, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Load, selectinload
 
 from apps.identity.dto import UserCreateDTO
-from apps.identity.models import User
+from apps.identity.models import Permission, Role, User
+from apps.identity.models.relationships import roles_permissions, users_permissions, users_roles
+from core.security.passwords import hash_password_async
 from repositories.base import (
     BaseRepository,
     CreateMixin,
@@ -43,7 +46,11 @@ class UserRepository(
         super().__init__(db, User)
 
     async def create(self, user_data: UserCreateDTO) -> User:
-        user = User.create(**user_data.model_dump())
+        hashed_password = await hash_password_async(user_data.raw_password)
+        user = User.create(
+            **user_data.model_dump(exclude={"raw_password"}),
+            hashed_password=hashed_password
+        )
         self.db.add(user)
 
         return user
@@ -58,3 +65,48 @@ class UserRepository(
         result = await self.db.execute(stmt)
 
         return result.scalar_one_or_none()
+
+    async def get_authorization_data(self, user_id: UUID) -> RowMapping | None:
+        """
+        Retrieve the user's authorization data (the fields of `UserData`) in a single query.
+
+        Permission codes are the effective ones: granted directly (`users_permissions`) or through
+        any of the user's roles (`users_roles` -> `roles_permissions`). Archived roles and
+        permissions are skipped. The code arrays are `NULL` when empty.
+        """
+        active_role_ids = (
+            select(users_roles.c.role_id)
+            .join(Role, Role.id == users_roles.c.role_id)
+            .where(users_roles.c.user_id == user_id, Role.archived_at.is_(None))
+        )
+        role_codes = (
+            select(func.array_agg(Role.code))
+            .where(Role.id.in_(active_role_ids))
+            .scalar_subquery()
+        )
+        permission_codes = (
+            select(func.array_agg(Permission.code))
+            .where(
+                Permission.id.in_(
+                    union(
+                        select(users_permissions.c.permission_id)
+                        .where(users_permissions.c.user_id == user_id),
+                        select(roles_permissions.c.permission_id)
+                        .where(roles_permissions.c.role_id.in_(active_role_ids))
+                    )
+                ),
+                Permission.archived_at.is_(None)
+            )
+            .scalar_subquery()
+        )
+        stmt = select(
+            User.id,
+            User.email,
+            User.is_active,
+            User.is_superuser,
+            role_codes.label("role_codes"),
+            permission_codes.label("permission_codes")
+        ).where(User.id == user_id)
+        result = await self.db.execute(stmt)
+
+        return result.mappings().one_or_none()
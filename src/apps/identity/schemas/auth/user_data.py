@@ -1,8 +1,10 @@
 import copy
-from typing import Any
+from typing import Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, PrivateAttr, model_validator
+
+from apps.identity.permission_registry import permission_registry
 
 
 class UserData(BaseModel):
@@ -16,7 +18,11 @@ class UserData(BaseModel):
     is_superuser: bool
 
     role_codes: list[str] = []
-    permission_codes: list[str] = []
+    permission_codes: list[str] = []  # Effective permissions (granted directly or through roles)
+
+    # Permission codes compiled against the permission registry (of the given generation)
+    _permission_bits: int = PrivateAttr(default=0)
+    _permission_bits_generation: int = PrivateAttr(default=-1)
 
     def has_role(self, role: str) -> bool:
         """Check if the user has the specified role"""
@@ -28,15 +34,59 @@ class UserData(BaseModel):
 
     def has_permission(self, permission: str) -> bool:
         """Check if the user has a specific permission"""
-        return permission in self.permission_codes
+        return self.has_permissions(permission)
 
     def has_permissions(self, *permissions: str) -> bool:
         """Checks if the user has all the specified permissions"""
-        return all(self.has_permission(perm) for perm in permissions)
+        required_bits = permission_registry.get_mask(permissions)
+
+        if required_bits is None:
+            return all(perm in self.permission_codes for perm in permissions)
+
+        return self._get_permission_bits() & required_bits == required_bits
 
     def has_any_permission(self, *permissions: str) -> bool:
         """Checks if the user has at least one of the specified permissions"""
-        return any(self.has_permission(perm) for perm in permissions)
+        required_bits = permission_registry.get_mask(permissions)
+
+        if required_bits is None:
+            return any(perm in self.permission_codes for perm in permissions)
+
+        return self._get_permission_bits() & required_bits != 0
+
+    def _get_permission_bits(self) -> int:
+        """Compile the permission codes into a bitset (again, if the registry has changed since)"""
+        generation = permission_registry.generation
+
+        if self._permission_bits_generation != generation:
+            self._permission_bits = permission_registry.compile(self.permission_codes)
+            self._permission_bits_generation = generation
+
+        return self._permission_bits
+
+    def to_token_claims(self) -> dict[str, Any]:
+        """Compact authorization claims to embed into an access token (see `from_token_claims`)"""
+        return {
+            "act": self.is_active,
+            "su": self.is_superuser,
+            "rol": self.role_codes,
+            "prm": self.permission_codes
+        }
+
+    @classmethod
+    def from_token_claims(cls, payload: dict[str, Any]) -> Self | None:
+        """Rebuild the user data from an access token payload, or `None` if it has no claims"""
+        if "prm" not in payload:
+            return None
+
+        return cls(
+            id=payload["sub"],
+            email=payload["email"],
+            is_active=payload["act"],
+            is_superuser=payload["su"],
+            role_codes=payload["rol"],
+            permission_codes=payload["prm"]
+        )
 
     @model_validator(mode="before")
     @classmethod
@@ -4,6 +4,8 @@ from jose import JWTError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.identity.cache import UserDataCacheInterface
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.repositories.token import TokenRepository
 from core.config import settings
 from apps.identity.exceptions import (
@@ -15,7 +17,7 @@ from apps.identity.exceptions import (
 )
 from core.security.interfaces import JWTManagerInterface
 from apps.identity.models import RefreshToken, User
-from apps.identity.repositories.user import UserLoadOptions, UserRepository
+from apps.identity.repositories.user import UserRepository
 from apps.identity.schemas import (
     UserData,
     LoginRequest,
@@ -32,42 +34,32 @@ class AuthService:
         db: AsyncSession,
         jwt_manager: JWTManagerInterface,
         user_repo: UserRepository,
-        token_repo: TokenRepository
+        token_repo: TokenRepository,
+        user_data_cache: UserDataCacheInterface,
+        permissions_epoch_store: PermissionsEpochStoreInterface
     ):
         self.db = db
         self.jwt_manager = jwt_manager
         self.user_repo = user_repo
         self.token_repo = token_repo
-
-        self.redis = None  # TODO: connect Redis
-        self.cache_ttl = 900  # == 15 minutes
+        self.user_data_cache = user_data_cache
+        self.permissions_epoch_store = permissions_epoch_store
 
     async def get_user_data(self, user_id: UUID) -> UserData | None:
         """Retrieve User data from cache or database"""
-        # Check Redis cache
-        # cache_key = f"user_data:{user_id}"
-        # cached = await self.redis.get(cache_key) if self.redis else None
-        # if cached:
-        #     data = json.loads(cached)
-        #     return UserData(**data)
-
-        user = await self.user_repo.get_by_id(
-            user_id,
-            include=[UserLoadOptions.ROLES, UserLoadOptions.PERMISSIONS]
-        )
+        cached_user_data = await self.user_data_cache.get(user_id)
 
-        if not user:
+        if cached_user_data:
+            return cached_user_data
+
+        user_data = await self._load_user_data(user_id)
+
+        if not user_data:
             return None
 
-        # Cache into Redis
-        # if self.redis:
-        #     await self.redis.setex(
-        #         cache_key,
-        #         self.cache_ttl,
-        #         user_data.model_dump_json()
-        #     )
+        await self.user_data_cache.set(user_data)
 
-        return UserData.model_validate(user)
+        return user_data
 
     async def get_token_pair(self, login_data: LoginRequest) -> TokenPairResponse:
         """
@@ -82,7 +74,7 @@ class AuthService:
         if not user:
             raise UserNotFoundError(user_email=login_data.email)
 
-        if not user.verify_password(login_data.password):
+        if not await user.verify_password_async(login_data.password):
             raise InvalidCredentialsError("Invalid password")
 
         try:
@@ -98,7 +90,7 @@ class AuthService:
         except SQLAlchemyError as e:
             raise TokenCreationError("Failed to create refresh token") from e
 
-        access_token_str = self._create_access_token_with_user_data(user)
+        access_token_str = await self._create_access_token_with_user_data(user)
 
         return TokenPairResponse(access_token=access_token_str, refresh_token=refresh_token_str)
 
@@ -127,7 +119,7 @@ class AuthService:
         if not user:
             raise UserNotFoundError(user_id=user_id)
 
-        new_access_token = self._create_access_token_with_user_data(user)
+        new_access_token = await self._create_access_token_with_user_data(user)
 
         return TokenRefreshResponse(access_token=new_access_token)
 
@@ -154,8 +146,33 @@ class AuthService:
 
         return True
 
-    def _create_access_token_with_user_data(self, user: User) -> str:
+    async def _create_access_token_with_user_data(self, user: User) -> str:
         user_data = {"sub": str(user.id), "email": user.email}
+
+        if settings.JWT_EMBED_AUTHORIZATION_CLAIMS:
+            # Read the epoch before the user's data, so a concurrent change makes the claims stale
+            permissions_epoch = await self.permissions_epoch_store.get(user.id)
+
+            # Without a known epoch, the token carries no claims and is authorized from the database
+            if permissions_epoch is not None:
+                user_data.update((await self._load_user_data(user.id)).to_token_claims())
+                user_data["pe"] = permissions_epoch
+
         jwt_access_token = self.jwt_manager.create_access_token(user_data)
 
         return jwt_access_token
+
+    async def _load_user_data(self, user_id: UUID) -> UserData | None:
+        authorization_data = await self.user_repo.get_authorization_data(user_id)
+
+        if not authorization_data:
+            return None
+
+        return UserData(
+            id=authorization_data["id"],
+            email=authorization_data["email"],
+            is_active=authorization_data["is_active"],
+            is_superuser=authorization_data["is_superuser"],
+            role_codes=authorization_data["role_codes"] or [],
+            permission_codes=authorization_data["permission_codes"] or []
+        )
@@ -2,7 +2,10 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.identity.cache import UserDataCacheInterface
 from apps.identity.models import Permission
+from apps.identity.permission_registry import permission_registry
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.repositories import PermissionRepository
 from apps.identity.schemas import (
     PermissionCreate,
@@ -18,12 +21,21 @@ from apps.identity.specifications import (
     PermissionSearchSpecification
 )
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
 
 
 class PermissionService:
-    def __init__(self, db: AsyncSession, permission_repo: PermissionRepository):
+    def __init__(
+        self,
+        db: AsyncSession,
+        permission_repo: PermissionRepository,
+        user_data_cache: UserDataCacheInterface,
+        permissions_epoch_store: PermissionsEpochStoreInterface
+    ):
         self.db = db
         self.permission_repo = permission_repo
+        self.user_data_cache = user_data_cache
+        self.permissions_epoch_store = permissions_epoch_store
 
     async def get_permission_by_id(self, permission_id: UUID) -> PermissionDetailResponse:
         permission = await self.permission_repo.get_by_id(permission_id)
@@ -46,18 +58,16 @@ class PermissionService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> PermissionPaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = PermissionOrderingSpecification(ordering)
         filter_spec = PermissionFilterSpecification()
         search_spec = PermissionSearchSpecification(q)
 
-        total_permissions = await self.permission_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_permissions)
-
-        permission_entities = await self.permission_repo.get_all_paginated(
+        permission_page = await self.permission_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
@@ -65,14 +75,16 @@ class PermissionService:
         )
         response_items = [
             PermissionListItemResponse.model_validate(permission)
-            for permission in permission_entities
+            for permission in permission_page.items
         ]
 
         return PermissionPaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_permissions
+            total_pages=pagination_spec.get_total_pages(permission_page.total_items),
+            total_items=permission_page.total_items,
+            has_next=permission_page.has_next,
+            count_strategy=permission_page.count_strategy
         )
 
     async def create_permission(
@@ -82,6 +94,7 @@ class PermissionService:
         permission = await self.permission_repo.create(permission_data.to_dto())
 
         await self.db.commit()
+        await self._rebuild_permission_registry()
 
         return PermissionDetailResponse.model_validate(permission)
 
@@ -96,6 +109,9 @@ class PermissionService:
             raise EntityNotFoundError(Permission, permission_id)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
+        await self._rebuild_permission_registry()
 
         return await self.get_permission_by_id(permission_id)
 
@@ -106,6 +122,9 @@ class PermissionService:
             raise EntityNotFoundError(Permission, permission_id)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
+        await self._rebuild_permission_registry()
 
         return await self.get_permission_by_id(permission_id)
 
@@ -116,5 +135,11 @@ class PermissionService:
             raise EntityNotFoundError(Permission, permission_id)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
+        await self._rebuild_permission_registry()
 
         return await self.get_permission_by_id(permission_id)
+
+    async def _rebuild_permission_registry(self) -> None:
+        permission_registry.rebuild(await self.permission_repo.get_active_codes())
@@ -2,7 +2,9 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.identity.cache import UserDataCacheInterface
 from apps.identity.models import Role
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.repositories import PermissionRepository, RoleLoadOptions, RoleRepository
 from apps.identity.schemas import (
     RoleCreate,
@@ -18,6 +20,7 @@ from apps.identity.specifications import (
     RoleSearchSpecification
 )
 from core.exceptions.database import EntityNotFoundError, RelatedEntitiesNotFoundError
+from core.pagination import CountStrategy
 
 
 class RoleService:
@@ -25,11 +28,15 @@ class RoleService:
         self,
         db: AsyncSession,
         role_repo: RoleRepository,
-        permission_repo: PermissionRepository
+        permission_repo: PermissionRepository,
+        user_data_cache: UserDataCacheInterface,
+        permissions_epoch_store: PermissionsEpochStoreInterface
     ):
         self.db = db
         self.role_repo = role_repo
         self.permission_repo = permission_repo
+        self.user_data_cache = user_data_cache
+        self.permissions_epoch_store = permissions_epoch_store
 
     async def get_role_by_id(self, role_id: UUID) -> RoleDetailResponse:
         role = await self.role_repo.get_by_id(role_id, include=[RoleLoadOptions.PERMISSIONS, ])
@@ -52,31 +59,31 @@ class RoleService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> RolePaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = RoleOrderingSpecification(ordering)
         filter_spec = RoleFilterSpecification()
         search_spec = RoleSearchSpecification(q)
 
-        total_roles = await self.role_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_roles)
-
-        role_entities = await self.role_repo.get_all_paginated(
+        role_page = await self.role_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
             search_spec,
             include=[RoleLoadOptions.PERMISSIONS, ]
         )
-        response_items = [RoleListItemResponse.model_validate(role) for role in role_entities]
+        response_items = [RoleListItemResponse.model_validate(role) for role in role_page.items]
 
         return RolePaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_roles
+            total_pages=pagination_spec.get_total_pages(role_page.total_items),
+            total_items=role_page.total_items,
+            has_next=role_page.has_next,
+            count_strategy=role_page.count_strategy
         )
 
     async def create_role(self, role_data: RoleCreate) -> RoleDetailResponse:
@@ -101,6 +108,8 @@ class RoleService:
             await self._set_role_permissions(role, role_data.permission_ids)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
 
         return await self.get_role_by_id(role_id)
 
@@ -111,6 +120,8 @@ class RoleService:
             raise EntityNotFoundError(Role, role_id)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
 
         return await self.get_role_by_id(role_id)
 
@@ -121,6 +132,8 @@ class RoleService:
             raise EntityNotFoundError(Role, role_id)
 
         await self.db.commit()
+        await self.user_data_cache.clear()
+        await self.permissions_epoch_store.bump_all()
 
         return await self.get_role_by_id(role_id)
 
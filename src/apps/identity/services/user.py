@@ -2,7 +2,9 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.identity.cache import UserDataCacheInterface
 from apps.identity.models import User
+from apps.identity.permissions_epoch import PermissionsEpochStoreInterface
 from apps.identity.repositories import (
     PermissionRepository,
     RoleRepository,
@@ -23,6 +25,7 @@ from apps.identity.specifications import (
     UserSearchSpecification
 )
 from core.exceptions.database import EntityNotFoundError, RelatedEntitiesNotFoundError
+from core.pagination import CountStrategy
 
 
 class UserService:
@@ -31,12 +34,16 @@ class UserService:
         db: AsyncSession,
         user_repo: UserRepository,
         role_repo: RoleRepository,
-        permission_repo: PermissionRepository
+        permission_repo: PermissionRepository,
+        user_data_cache: UserDataCacheInterface,
+        permissions_epoch_store: PermissionsEpochStoreInterface
     ):
         self.db = db
         self.user_repo = user_repo
         self.role_repo = role_repo
         self.permission_repo = permission_repo
+        self.user_data_cache = user_data_cache
+        self.permissions_epoch_store = permissions_epoch_store
 
     async def get_user_by_id(self, user_id: UUID) -> UserDetailResponse:
         user = await self.user_repo.get_by_id(
@@ -53,31 +60,31 @@ class UserService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> UserPaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = UserOrderingSpecification(ordering)
         filter_spec = UserFilterSpecification()
         search_spec = UserSearchSpecification(q)
 
-        total_users = await self.user_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_users)
-
-        user_entities = await self.user_repo.get_all_paginated(
+        user_page = await self.user_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
             search_spec,
             include=[UserLoadOptions.ROLES, UserLoadOptions.PERMISSIONS, ]
         )
-        response_items = [UserListItemResponse.model_validate(user) for user in user_entities]
+        response_items = [UserListItemResponse.model_validate(user) for user in user_page.items]
 
         return UserPaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_users
+            total_pages=pagination_spec.get_total_pages(user_page.total_items),
+            total_items=user_page.total_items,
+            has_next=user_page.has_next,
+            count_strategy=user_page.count_strategy
         )
 
     async def create_user(self, user_data: UserCreate) -> UserDetailResponse:
@@ -110,6 +117,8 @@ class UserService:
             await self._set_user_permissions(user, user_data.permission_ids)
 
         await self.db.commit()
+        await self.user_data_cache.invalidate(user_id)
+        await self.permissions_epoch_store.bump(user_id)
 
         return await self.get_user_by_id(user.id)
 
@@ -120,6 +129,8 @@ class UserService:
             raise EntityNotFoundError(User, user_id)
 
         await self.db.commit()
+        await self.user_data_cache.invalidate(user_id)
+        await self.permissions_epoch_store.bump(user_id)
 
         return await self.get_user_by_id(user_id)
 
@@ -130,6 +141,8 @@ class UserService:
             raise EntityNotFoundError(User, user_id)
 
         await self.db.commit()
+        await self.user_data_cache.invalidate(user_id)
+        await self.permissions_epoch_store.bump(user_id)
 
         return await self.get_user_by_id(user_id)
 
@@ -0,0 +1,38 @@
+import asyncio
+
+from apps.identity.repositories import TokenRepository
+from core.logging_config import logger
+from database.dependencies import get_postgresql_db_contextmanager
+
+
+async def purge_expired_refresh_tokens(batch_size: int) -> int:
+    """
+    Delete all expired refresh tokens in batches, returning how many were deleted.
+
+    Each batch runs in its own short transaction, so the purge never holds many row locks at once.
+    """
+    total_deleted = 0
+
+    while True:
+        async with get_postgresql_db_contextmanager() as db:
+            deleted = await TokenRepository(db).delete_expired_refresh_tokens(batch_size)
+            await db.commit()
+
+        total_deleted += deleted
+
+        if deleted < batch_size:
+            return total_deleted
+
+
+async def run_refresh_token_purge(interval_seconds: float, batch_size: int) -> None:
+    """Purge expired refresh tokens every `interval_seconds` (until cancelled)."""
+    while True:
+        try:
+            deleted = await purge_expired_refresh_tokens(batch_size)
+
+            if deleted:
+                logger.info(f"Purged {deleted} expired refresh tokens", deleted=deleted)
+        except Exception:
+            logger.exception("Failed to purge expired refresh tokens")
+
+        await asyncio.sleep(interval_seconds)
@@ -5,6 +5,7 @@ from apps.identity.schemas import UserData
 from apps.soil_laboratory.dependencies.services import get_material_source_service
 from apps.soil_laboratory.schemas.material_source import MaterialSourcePaginatedListResponse
 from apps.soil_laboratory.services.material_source import MaterialSourceService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/material-sources", tags=["material-sources"])
@@ -21,6 +22,11 @@ async def get_material_source_lookups_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -34,6 +40,7 @@ async def get_material_source_lookups_list(
     return await material_source_service.get_material_sources_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
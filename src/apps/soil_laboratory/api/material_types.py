@@ -5,6 +5,7 @@ from apps.identity.schemas import UserData
 from apps.soil_laboratory.dependencies.services import get_material_type_service
 from apps.soil_laboratory.schemas.material_type import MaterialTypePaginatedListResponse
 from apps.soil_laboratory.services.material_type import MaterialTypeService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/material-types", tags=["material-types"])
@@ -21,6 +22,11 @@ async def get_material_type_lookups_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -34,6 +40,7 @@ async def get_material_type_lookups_list(
     return await material_type_service.get_material_types_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
@@ -5,6 +5,7 @@ from apps.identity.schemas import UserData
 from apps.soil_laboratory.dependencies.services import get_material_service
 from apps.soil_laboratory.schemas.material import MaterialPaginatedListResponse
 from apps.soil_laboratory.services.material import MaterialService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/materials", tags=["materials"])
@@ -21,6 +22,11 @@ async def get_material_lookups_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -40,6 +46,7 @@ async def get_material_lookups_list(
     return await material_service.get_materials_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q,
         material_type_code__eq=material_type_code__eq
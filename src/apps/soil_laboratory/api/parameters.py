@@ -5,6 +5,7 @@ from apps.identity.schemas import UserData
 from apps.soil_laboratory.dependencies.services import get_parameter_service
 from apps.soil_laboratory.schemas.parameter import ParameterPaginatedListResponse
 from apps.soil_laboratory.services.parameter import ParameterService
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/parameters", tags=["parameters"])
@@ -21,6 +22,11 @@ async def get_parameter_lookups_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -34,6 +40,7 @@ async def get_parameter_lookups_list(
     return await parameter_service.get_parameters_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
         ordering=ordering,
         q=q
     )
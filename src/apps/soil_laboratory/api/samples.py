@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from starlette.responses import StreamingResponse
 
 from apps.identity.dependencies.auth import require_permission
@@ -8,19 +8,28 @@ from apps.identity.schemas import UserData
 from apps.soil_laboratory.dependencies.services import get_sample_report_service, get_sample_service
 from apps.soil_laboratory.schemas.sample import (
     SampleCreate,
+    SampleCursorPaginatedListResponse,
     SampleDetailResponse,
     SamplePaginatedListResponse,
     SamplesReportGenerationRequest
 )
 from apps.soil_laboratory.services.reports.sample_report import SampleReportService
 from apps.soil_laboratory.services.sample import SampleService
+from core.etag import is_etag_matched, not_modified_response, set_etag_headers
+from core.pagination import CountStrategy
 
 
 router = APIRouter(prefix="/samples", tags=["samples"])
 
 
-@router.get("/", response_model=SamplePaginatedListResponse)
+@router.get(
+    "/",
+    response_model=SamplePaginatedListResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified (`If-None-Match`)"}}
+)
 async def get_samples_list(
+    request: Request,
+    response: Response,
     # Pagination
     page_number: int = Query(1, alias="page[number]", ge=1, description="Page number"),
     page_size: int = Query(
@@ -30,6 +39,11 @@ async def get_samples_list(
         alias="page[size]",
         description="Number of items per page"
     ),
+    count_strategy: CountStrategy = Query(
+        CountStrategy.EXACT,
+        alias="page[count]",
+        description="Total items count strategy (exact | cached | estimated | none)"
+    ),
     # Ordering & Search
     ordering: str | None = Query(
         None,
@@ -62,13 +76,123 @@ async def get_samples_list(
         alias="filter[materialSourceCode][eq]",
         description="Material source code (string | comma-separated for multiple values)"
     ),
+    if_none_match: str | None = Header(None),
     # Dependencies
     sample_service: SampleService = Depends(get_sample_service),
     current_user: UserData = Depends(require_permission("samples.read"))
-) -> SamplePaginatedListResponse:
+) -> SamplePaginatedListResponse | Response:
+    # Probe the revision first, so an unchanged page is neither loaded nor serialized
+    etag = await sample_service.get_samples_list_etag(
+        query_string=request.url.query,
+        q=q,
+        material_type_id__eq=material_type_id__eq,
+        material_type_code__eq=material_type_code__eq,
+        material_id__eq=material_id__eq,
+        material_source_id__eq=material_source_id__eq,
+        material_source_code__eq=material_source_code__eq
+    )
+
+    if is_etag_matched(if_none_match, etag):
+        return not_modified_response(etag)
+
+    set_etag_headers(response, etag)
+
     return await sample_service.get_samples_paginated(
         page_number=page_number,
         page_size=page_size,
+        count_strategy=count_strategy,
+        ordering=ordering,
+        q=q,
+        material_type_id__eq=material_type_id__eq,
+        material_type_code__eq=material_type_code__eq,
+        material_id__eq=material_id__eq,
+        material_source_id__eq=material_source_id__eq,
+        material_source_code__eq=material_source_code__eq
+    )
+
+
+@router.get(
+    "/cursor",
+    response_model=SampleCursorPaginatedListResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified (`If-None-Match`)"}}
+)
+async def get_samples_cursor_list(
+    request: Request,
+    response: Response,
+    # Pagination
+    page_size: int = Query(
+        10,
+        ge=1,
+        le=20,
+        alias="page[size]",
+        description="Number of items per page"
+    ),
+    page_after: str | None = Query(
+        None,
+        alias="page[after]",
+        description="Opaque cursor (`nextCursor`) of the item after which the page starts"
+    ),
+    page_before: str | None = Query(
+        None,
+        alias="page[before]",
+        description="Opaque cursor (`previousCursor`) of the item before which the page ends"
+    ),
+    # Ordering & Search
+    ordering: str | None = Query(
+        None,
+        description="Ordering field (prefix with '-' for descending)"
+    ),
+    q: str | None = Query(None, description="Full-text search query across main searchable fields"),
+    # Filters
+    material_type_id__eq: str | None = Query(
+        None,
+        alias="filter[materialTypeId][eq]",
+        description="Material type ID (string($UUID) | comma-separated for multiple values)"
+    ),
+    material_type_code__eq: str | None = Query(
+        None,
+        alias="filter[materialTypeCode][eq]",
+        description="Material type code (string | comma-separated for multiple values)"
+    ),
+    material_id__eq: str | None = Query(
+        None,
+        alias="filter[materialId][eq]",
+        description="Material ID (string($UUID) | comma-separated for multiple values)"
+    ),
+    material_source_id__eq: str | None = Query(
+        None,
+        alias="filter[materialSourceId][eq]",
+        description="Material source ID (string($UUID) | comma-separated for multiple values)"
+    ),
+    material_source_code__eq: str | None = Query(
+        None,
+        alias="filter[materialSourceCode][eq]",
+        description="Material source code (string | comma-separated for multiple values)"
+    ),
+    if_none_match: str | None = Header(None),
+    # Dependencies
+    sample_service: SampleService = Depends(get_sample_service),
+    current_user: UserData = Depends(require_permission("samples.read"))
+) -> SampleCursorPaginatedListResponse | Response:
+    etag = await sample_service.get_samples_list_etag(
+        query_string=request.url.query,
+        q=q,
+        material_type_id__eq=material_type_id__eq,
+        material_type_code__eq=material_type_code__eq,
+        material_id__eq=material_id__eq,
+        material_source_id__eq=material_source_id__eq,
+        material_source_code__eq=material_source_code__eq
+    )
+
+    if is_etag_matched(if_none_match, etag):
+        return not_modified_response(etag)
+
+    set_etag_headers(response, etag)
+
+    return await sample_service.get_samples_cursor_paginated(
+        page_size=page_size,
+        page_after=page_after,
+        page_before=page_before,
         ordering=ordering,
         q=q,
         material_type_id__eq=material_type_id__eq,
@@ -88,13 +212,30 @@ async def create_sample(
     return await sample_service.create_sample(sample_data)
 
 
-@router.get("/{sample_id:uuid}", response_model=SampleDetailResponse)
+@router.get(
+    "/{sample_id:uuid}",
+    response_model=SampleDetailResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified (`If-None-Match`)"}}
+)
 async def get_sample(
     sample_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     sample_service: SampleService = Depends(get_sample_service),
     current_user: UserData = Depends(require_permission("samples.read"))
-) -> SampleDetailResponse:
-    return await sample_service.get_sample_by_id(sample_id)
+) -> SampleDetailResponse | Response:
+    # Probe the revision first, so an unchanged sample is neither loaded nor serialized
+    etag = await sample_service.get_sample_etag(sample_id)
+
+    if etag and is_etag_matched(if_none_match, etag):
+        return not_modified_response(etag)
+
+    sample = await sample_service.get_sample_by_id(sample_id)
+
+    if etag:
+        set_etag_headers(response, etag)
+
+    return sample
 
 
 @router.delete("/{sample_id}", response_model=SampleDetailResponse)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from apps.identity.dependencies.auth import require_permission
 from apps.identity.schemas import UserData
@@ -11,6 +11,7 @@ from apps.soil_laboratory.schemas.test_result import (
     TestResultShortResponse
 )
 from apps.soil_laboratory.services.test_result import TestResultService
+from core.etag import is_etag_matched, not_modified_response, set_etag_headers
 
 
 router = APIRouter(prefix="/test-results", tags=["test-results"])
@@ -25,13 +26,30 @@ async def create_test(
     return await test_result_service.create_test(test_result_data)
 
 
-@router.get("/{test_result_id:uuid}", response_model=TestResultDetailResponse)
+@router.get(
+    "/{test_result_id:uuid}",
+    response_model=TestResultDetailResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified (`If-None-Match`)"}}
+)
 async def get_test(
     test_result_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     test_result_service: TestResultService = Depends(get_test_result_service),
     current_user: UserData = Depends(require_permission("test_results.read"))
-) -> TestResultDetailResponse:
-    return await test_result_service.get_test_by_id(test_result_id)
+) -> TestResultDetailResponse | Response:
+    # Probe the revision first, so an unchanged test result is neither loaded nor serialized
+    etag = await test_result_service.get_test_etag(test_result_id)
+
+    if etag and is_etag_matched(if_none_match, etag):
+        return not_modified_response(etag)
+
+    test_result = await test_result_service.get_test_by_id(test_result_id)
+
+    if etag:
+        set_etag_headers(response, etag)
+
+    return test_result
 
 
 @router.delete("/{test_result_id}", response_model=TestResultShortResponse)
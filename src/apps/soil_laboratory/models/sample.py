@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.models import BaseORM, BusinessEntityMetadataMixin
@@ -18,6 +18,10 @@ if TYPE_CHECKING:
 class Sample(BaseORM, BusinessEntityMetadataMixin):
     """SQLAlchemy ORM model for Sample."""
     __tablename__ = "samples"
+    __table_args__ = (
+        # Keyset pagination over the default "-receivedAt" ordering (with the `id` tiebreaker)
+        Index("ix_samples_received_at_id", "received_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -37,7 +41,10 @@ class Sample(BaseORM, BusinessEntityMetadataMixin):
 
     material: Mapped["Material"] = safe_relationship(back_populates="samples")
     material_source: Mapped["MaterialSource"] = safe_relationship(back_populates="samples")
-    test_results: Mapped[list["TestResult"]] = safe_relationship(back_populates="sample")
+    test_results: Mapped[list["TestResult"]] = safe_relationship(
+        back_populates="sample",
+        passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return (
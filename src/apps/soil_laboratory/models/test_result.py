@@ -49,7 +49,10 @@ class TestResult(BaseORM, BusinessEntityMetadataMixin):
     #     uselist=False,
     #     viewonly=True
     # )
-    measurements: Mapped[list["Measurement"]] = safe_relationship(back_populates="test_result")
+    measurements: Mapped[list["Measurement"]] = safe_relationship(
+        back_populates="test_result",
+        passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return (
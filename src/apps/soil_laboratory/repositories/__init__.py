@@ -12,7 +12,11 @@ from apps.soil_laboratory.repositories.measurement import (
     MeasurementRepository
 )
 from apps.soil_laboratory.repositories.parameter import ParameterLoadOptions, ParameterRepository
-from apps.soil_laboratory.repositories.sample import SampleLoadOptions, SampleRepository
+from apps.soil_laboratory.repositories.sample import (
+    SampleLoadOptions,
+    SampleProjection,
+    SampleRepository
+)
 from apps.soil_laboratory.repositories.specification import (
     SpecificationLoadOptions,
     SpecificationRepository
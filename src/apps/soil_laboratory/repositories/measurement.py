@@ -6,6 +6,7 @@ from sqlalchemy.orm import Load, selectinload
 from apps.soil_laboratory.models import Measurement
 from repositories.base import (
     BaseRepository,
+    BulkCreateMixin,
     CreateMixin,
     ExistsMixin,
     HardDeleteMixin,
@@ -26,9 +27,10 @@ class MeasurementRepository(
     ReadPaginatedMixin[Measurement, MeasurementLoadOptions],
     ReadByIdMixin[Measurement, MeasurementLoadOptions],
     CreateMixin[Measurement],
+    BulkCreateMixin[Measurement],
     UpdateMixin[Measurement],
     SoftDeleteMixin[Measurement],
-    HardDeleteMixin[Measurement]
+    HardDeleteMixin[Measurement, MeasurementLoadOptions]
 ):
     _LOAD_OPTIONS_MAP: dict[MeasurementLoadOptions, Load] = {
         MeasurementLoadOptions.TEST_RESULT: selectinload(Measurement.test_result),
@@ -1,19 +1,33 @@
 from enum import Enum
+from typing import Any
+from uuid import UUID
 
+from sqlalchemy import ColumnElement, distinct, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Load, selectinload
+from sqlalchemy.orm import Load, aliased, selectinload
 
-from apps.soil_laboratory.models import Material, Sample, TestResult
+from apps.soil_laboratory.models import (
+    Material,
+    MaterialSource,
+    MaterialType,
+    Parameter,
+    Sample,
+    TestResult
+)
+from interfaces.specifications import FilterSpecificationInterface, SearchSpecificationInterface
 from repositories.base import (
     BaseRepository,
+    BulkCreateMixin,
     CreateMixin,
     ExistsMixin,
     HardDeleteMixin,
     ReadByIdMixin,
     ReadPaginatedMixin,
+    ReadProjectedMixin,
     SoftDeleteMixin,
     UpdateMixin
 )
+from repositories.projections import json_array_agg, json_object
 
 
 class SampleLoadOptions(str, Enum):
@@ -24,16 +38,93 @@ class SampleLoadOptions(str, Enum):
     TEST_RESULTS__PARAMETER = "test_results__parameter"
 
 
+class SampleProjection(str, Enum):
+    LIST_ITEM = "list_item"
+
+
+def _build_list_item_projection() -> tuple[ColumnElement, ...]:
+    """Columns of `SampleListItemResponse`, with nested objects aggregated as JSON."""
+    # Aliases keep the subqueries independent of the outer query's JOINs (ordering, filtering)
+    material = aliased(Material)
+    material_type = aliased(MaterialType)
+    material_source = aliased(MaterialSource)
+    test_result = aliased(TestResult)
+    parameter = aliased(Parameter)
+
+    material_json = (
+        select(json_object(
+            id=material.id,
+            name=material.name,
+            material_type=json_object(
+                id=material_type.id,
+                code=material_type.code,
+                name=material_type.name
+            )
+        ))
+        .join(material_type, material_type.id == material.material_type_id)
+        .where(material.id == Sample.material_id)
+        .correlate(Sample)
+        .scalar_subquery()
+    )
+    material_source_json = (
+        select(json_object(
+            id=material_source.id,
+            code=material_source.code,
+            name=material_source.name
+        ))
+        .where(material_source.id == Sample.material_source_id)
+        .correlate(Sample)
+        .scalar_subquery()
+    )
+    test_results_json = (
+        select(json_array_agg(json_object(
+            id=test_result.id,
+            parameter=json_object(
+                id=parameter.id,
+                code=parameter.code,
+                name=parameter.name,
+                units=parameter.units
+            ),
+            mean_value=test_result.mean_value,
+            variation_percentage=test_result.variation_percentage,
+            is_compliant=test_result.is_compliant
+        )))
+        .join(parameter, parameter.id == test_result.parameter_id)
+        .where(test_result.sample_id == Sample.id)
+        .correlate(Sample)
+        .scalar_subquery()
+    )
+
+    return (
+        Sample.id,
+        material_json.label("material"),
+        material_source_json.label("material_source"),
+        Sample.temperature,
+        Sample.received_at,
+        test_results_json.label("test_results"),
+        Sample.created_at,
+        Sample.created_by_id,
+        Sample.updated_at,
+        Sample.updated_by_id,
+        Sample.deleted_at
+    )
+
+
 class SampleRepository(
     BaseRepository[Sample, SampleLoadOptions],
     ExistsMixin[Sample],
     ReadPaginatedMixin[Sample, SampleLoadOptions],
+    ReadProjectedMixin[Sample, SampleProjection],
     ReadByIdMixin[Sample, SampleLoadOptions],
     CreateMixin[Sample],
+    BulkCreateMixin[Sample],
     UpdateMixin[Sample],
     SoftDeleteMixin[Sample],
-    HardDeleteMixin[Sample]
+    HardDeleteMixin[Sample, SampleLoadOptions]
 ):
+    # Sample lists are ordered by joined columns and hydrate several relationships per row
+    _DEFERRED_JOIN_PAGINATION = True
+
     _LOAD_OPTIONS_MAP: dict[SampleLoadOptions, Load] = {
         SampleLoadOptions.MATERIAL: selectinload(Sample.material),
         SampleLoadOptions.MATERIAL__MATERIAL_TYPE: (
@@ -46,5 +137,80 @@ class SampleRepository(
         ),
     }
 
+    _PROJECTIONS_MAP: dict[SampleProjection, tuple[ColumnElement, ...]] = {
+        SampleProjection.LIST_ITEM: _build_list_item_projection()
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Sample)
+
+    async def get_detail_revision(self, sample_id: UUID) -> tuple[Any, ...] | None:
+        """
+        Retrieve what identifies the revision of a sample's detail view without loading it: its
+        version, the latest update of its material, material type and material source, and the
+        count and latest update of its test results and of their parameters (`None` if it doesn't
+        exist).
+        """
+        stmt = (
+            select(
+                Sample.version,
+                Material.updated_at,
+                MaterialType.updated_at,
+                MaterialSource.updated_at,
+                func.count(TestResult.id),
+                func.max(TestResult.updated_at),
+                func.max(Parameter.updated_at)
+            )
+            .join(Material, Material.id == Sample.material_id)
+            .join(MaterialType, MaterialType.id == Material.material_type_id)
+            .join(MaterialSource, MaterialSource.id == Sample.material_source_id)
+            .outerjoin(TestResult, TestResult.sample_id == Sample.id)
+            .outerjoin(Parameter, Parameter.id == TestResult.parameter_id)
+            .where(Sample.id == sample_id)
+            .group_by(Sample.id, Material.id, MaterialType.id, MaterialSource.id)
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+
+        return tuple(row) if row else None
+
+    async def get_list_revision(
+        self,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None
+    ) -> tuple[Any, ...]:
+        """
+        Retrieve what identifies the revision of the matching samples' lists without loading them:
+        the count and latest update of the samples and of their test results, and the latest update
+        of the embedded materials, material types, material sources and parameters.
+        """
+        stmt = self._build_filtered_stmt(
+            select(
+                func.count(distinct(Sample.id)),
+                func.max(Sample.updated_at),
+                func.max(Material.updated_at),
+                func.max(MaterialType.updated_at),
+                func.max(MaterialSource.updated_at),
+                func.count(TestResult.id),
+                func.max(TestResult.updated_at),
+                func.max(Parameter.updated_at)
+            ).select_from(Sample),
+            filter_spec,
+            search_spec
+        )
+
+        # Join the embedded entities the specifications didn't already need
+        planned_join_paths = self._plan_join_paths(filter_spec, search_spec)
+
+        for path in (Material, MaterialType, MaterialSource):
+            if path not in planned_join_paths:
+                stmt = stmt.join(path)
+
+        stmt = (
+            stmt
+            .outerjoin(TestResult, TestResult.sample_id == Sample.id)
+            .outerjoin(Parameter, Parameter.id == TestResult.parameter_id)
+        )
+        result = await self.db.execute(stmt)
+
+        return tuple(result.one())
@@ -1,9 +1,20 @@
 from enum import Enum
+from typing import Any
+from uuid import UUID
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Load, selectinload
 
-from apps.soil_laboratory.models import Material, Sample, TestResult
+from apps.soil_laboratory.models import (
+    Material,
+    MaterialSource,
+    MaterialType,
+    Measurement,
+    Parameter,
+    Sample,
+    TestResult
+)
 from repositories.base import (
     BaseRepository,
     CreateMixin,
@@ -32,7 +43,7 @@ class TestResultRepository(
     CreateMixin[TestResult],
     UpdateMixin[TestResult],
     SoftDeleteMixin[TestResult],
-    HardDeleteMixin[TestResult]
+    HardDeleteMixin[TestResult, TestResultLoadOptions]
 ):
     _LOAD_OPTIONS_MAP: dict[TestResultLoadOptions, Load] = {
         TestResultLoadOptions.SAMPLE: selectinload(TestResult.sample),
@@ -50,3 +61,42 @@ class TestResultRepository(
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, TestResult)
+
+    async def get_detail_revision(self, test_result_id: UUID) -> tuple[Any, ...] | None:
+        """
+        Retrieve what identifies the revision of a test result's detail view without loading it:
+        its version, its sample's version, the latest update of its parameter and of the sample's
+        material, material type and material source, and the count and latest update of its
+        measurements (`None` if it doesn't exist).
+        """
+        stmt = (
+            select(
+                TestResult.version,
+                Sample.version,
+                Parameter.updated_at,
+                Material.updated_at,
+                MaterialType.updated_at,
+                MaterialSource.updated_at,
+                func.count(Measurement.id),
+                func.max(Measurement.updated_at)
+            )
+            .join(Sample, Sample.id == TestResult.sample_id)
+            .join(Parameter, Parameter.id == TestResult.parameter_id)
+            .join(Material, Material.id == Sample.material_id)
+            .join(MaterialType, MaterialType.id == Material.material_type_id)
+            .join(MaterialSource, MaterialSource.id == Sample.material_source_id)
+            .outerjoin(Measurement, Measurement.test_result_id == TestResult.id)
+            .where(TestResult.id == test_result_id)
+            .group_by(
+                TestResult.id,
+                Sample.id,
+                Parameter.id,
+                Material.id,
+                MaterialType.id,
+                MaterialSource.id
+            )
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+
+        return tuple(row) if row else None
@@ -5,7 +5,13 @@ from uuid import UUID
 from pydantic import Field, field_validator
 
 from apps.soil_laboratory.dto.sample import SampleCreateDTO, SampleUpdateDTO
-from schemas.base import InputSchemaBase, PaginatedListResponseBase, ResponseSchemaBase, SchemaBase
+from schemas.base import (
+    CursorPaginatedListResponseBase,
+    InputSchemaBase,
+    PaginatedListResponseBase,
+    ResponseSchemaBase,
+    SchemaBase
+)
 from schemas.mixins import BusinessEntitySchemaMetadataMixin
 
 
@@ -89,6 +95,10 @@ class SamplePaginatedListResponse(PaginatedListResponseBase[SampleListItemRespon
     pass
 
 
+class SampleCursorPaginatedListResponse(CursorPaginatedListResponseBase[SampleListItemResponse]):
+    pass
+
+
 class SamplesReportGenerationRequest(SchemaBase):
     date_from: date | None = None
     date_to: date | None = None
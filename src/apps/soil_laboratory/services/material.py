@@ -16,6 +16,7 @@ from apps.soil_laboratory.specifications import (
     PaginationSpecification
 )
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
 
 
 class MaterialService:
@@ -38,19 +39,17 @@ class MaterialService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None,
         material_type_code__eq: str | None = None
     ) -> MaterialPaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = MaterialOrderingSpecification(ordering)
         filter_spec = MaterialFilterSpecification(material_type_code__eq=material_type_code__eq)
         search_spec = MaterialSearchSpecification(q)
 
-        total_materials = await self.material_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_materials)
-
-        material_entities = await self.material_repo.get_all_paginated(
+        material_page = await self.material_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
@@ -59,12 +58,14 @@ class MaterialService:
         )
         response_items = [
             MaterialListItemResponse.model_validate(material)
-            for material in material_entities
+            for material in material_page.items
         ]
 
         return MaterialPaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_materials
+            total_pages=pagination_spec.get_total_pages(material_page.total_items),
+            total_items=material_page.total_items,
+            has_next=material_page.has_next,
+            count_strategy=material_page.count_strategy
         )
@@ -16,6 +16,7 @@ from apps.soil_laboratory.specifications import (
     PaginationSpecification
 )
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
 
 
 class MaterialSourceService:
@@ -38,18 +39,16 @@ class MaterialSourceService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> MaterialSourcePaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = MaterialSourceOrderingSpecification(ordering)
         filter_spec = MaterialSourceFilterSpecification()
         search_spec = MaterialSourceSearchSpecification(q)
 
-        total_material_sources = await self.material_source_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_material_sources)
-
-        material_source_entities = await self.material_source_repo.get_all_paginated(
+        material_source_page = await self.material_source_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
@@ -57,12 +56,14 @@ class MaterialSourceService:
         )
         response_items = [
             MaterialSourceListItemResponse.model_validate(material_source)
-            for material_source in material_source_entities
+            for material_source in material_source_page.items
         ]
 
         return MaterialSourcePaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_material_sources
+            total_pages=pagination_spec.get_total_pages(material_source_page.total_items),
+            total_items=material_source_page.total_items,
+            has_next=material_source_page.has_next,
+            count_strategy=material_source_page.count_strategy
         )
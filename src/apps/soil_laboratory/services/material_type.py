@@ -16,6 +16,7 @@ from apps.soil_laboratory.specifications import (
     PaginationSpecification
 )
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
 
 
 class MaterialTypeService:
@@ -35,18 +36,16 @@ class MaterialTypeService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> MaterialTypePaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = MaterialTypeOrderingSpecification(ordering)
         filter_spec = MaterialTypeFilterSpecification()
         search_spec = MaterialTypeSearchSpecification(q)
 
-        total_material_types = await self.material_type_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_material_types)
-
-        material_type_entities = await self.material_type_repo.get_all_paginated(
+        material_type_page = await self.material_type_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
@@ -54,12 +53,14 @@ class MaterialTypeService:
         )
         response_items = [
             MaterialTypeListItemResponse.model_validate(material_type)
-            for material_type in material_type_entities
+            for material_type in material_type_page.items
         ]
 
         return MaterialTypePaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_material_types
+            total_pages=pagination_spec.get_total_pages(material_type_page.total_items),
+            total_items=material_type_page.total_items,
+            has_next=material_type_page.has_next,
+            count_strategy=material_type_page.count_strategy
         )
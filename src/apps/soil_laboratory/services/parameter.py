@@ -16,6 +16,7 @@ from apps.soil_laboratory.specifications import (
     ParameterSearchSpecification
 )
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
 
 
 class ParameterService:
@@ -35,18 +36,16 @@ class ParameterService:
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None
     ) -> ParameterPaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = ParameterOrderingSpecification(ordering)
         filter_spec = ParameterFilterSpecification()
         search_spec = ParameterSearchSpecification(q)
 
-        total_parameters = await self.parameter_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_parameters)
-
-        parameter_entities = await self.parameter_repo.get_all_paginated(
+        parameter_page = await self.parameter_repo.get_all_paginated_with_count(
             pagination_spec,
             ordering_spec,
             filter_spec,
@@ -54,12 +53,14 @@ class ParameterService:
         )
         response_items = [
             ParameterListItemResponse.model_validate(parameter)
-            for parameter in parameter_entities
+            for parameter in parameter_page.items
         ]
 
         return ParameterPaginatedListResponse(
             data=response_items,
             page=page_number,
-            total_pages=total_pages,
-            total_items=total_parameters
+            total_pages=pagination_spec.get_total_pages(parameter_page.total_items),
+            total_items=parameter_page.total_items,
+            has_next=parameter_page.has_next,
+            count_strategy=parameter_page.count_strategy
         )
@@ -3,20 +3,29 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.soil_laboratory.models import Sample
-from apps.soil_laboratory.repositories.sample import SampleLoadOptions, SampleRepository
+from apps.soil_laboratory.repositories.sample import (
+    SampleLoadOptions,
+    SampleProjection,
+    SampleRepository
+)
 from apps.soil_laboratory.schemas.sample import (
     SampleCreate,
+    SampleCursorPaginatedListResponse,
     SampleDetailResponse,
     SampleListItemResponse,
     SamplePaginatedListResponse
 )
 from apps.soil_laboratory.specifications import (
+    CursorPaginationSpecification,
     PaginationSpecification,
     SampleFilterSpecification,
     SampleOrderingSpecification,
     SampleSearchSpecification
 )
+from core.etag import make_etag
 from core.exceptions.database import EntityNotFoundError
+from core.pagination import CountStrategy
+from schemas.utils import get_type_adapter
 
 
 class SampleService:
@@ -39,10 +48,44 @@ class SampleService:
 
         return SampleDetailResponse.model_validate(sample)
 
+    async def get_sample_etag(self, sample_id: UUID) -> str | None:
+        """Get the ETag of the sample's detail view (`None` if it doesn't exist)."""
+        revision = await self.sample_repo.get_detail_revision(sample_id)
+
+        return make_etag("sample", sample_id, *revision) if revision else None
+
+    async def get_samples_list_etag(
+        self,
+        query_string: str,
+        q: str | None = None,
+        material_type_id__eq: str | None = None,
+        material_type_code__eq: str | None = None,
+        material_id__eq: str | None = None,
+        material_source_id__eq: str | None = None,
+        material_source_code__eq: str | None = None
+    ) -> str:
+        """
+        Get the ETag of a samples list page, identified by the request's `query_string` (pagination
+        including the cursor, count strategy, ordering, search and filters).
+        """
+        filter_spec = SampleFilterSpecification(
+            material_type_id__eq=material_type_id__eq,
+            material_type_code__eq=material_type_code__eq,
+            material_id__eq=material_id__eq,
+            material_source_id__eq=material_source_id__eq,
+            material_source_code__eq=material_source_code__eq
+        )
+        search_spec = SampleSearchSpecification(q)
+
+        revision = await self.sample_repo.get_list_revision(filter_spec, search_spec)
+
+        return make_etag("samples", query_string, *revision)
+
     async def get_samples_paginated(
         self,
         page_number: int,
         page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
         ordering: str | None = None,
         q: str | None = None,
         material_type_id__eq: str | None = None,
@@ -51,7 +94,7 @@ class SampleService:
         material_source_id__eq: str | None = None,
         material_source_code__eq: str | None = None
     ) -> SamplePaginatedListResponse:
-        pagination_spec = PaginationSpecification(page_number, page_size)
+        pagination_spec = PaginationSpecification(page_number, page_size, count_strategy)
         ordering_spec = SampleOrderingSpecification(ordering)
         filter_spec = SampleFilterSpecification(
             material_type_id__eq=material_type_id__eq,
@@ -62,13 +105,54 @@ class SampleService:
         )
         search_spec = SampleSearchSpecification(q)
 
-        total_samples = await self.sample_repo.get_count(filter_spec, search_spec)
-        total_pages = pagination_spec.get_total_pages(total_samples)
-
-        sample_entities = await self.sample_repo.get_all_paginated(
+        sample_page = await self.sample_repo.get_all_projected_paginated_with_count(
+            SampleProjection.LIST_ITEM,
             pagination_spec,
             ordering_spec,
             filter_spec,
+            search_spec
+        )
+        response_items = get_type_adapter(list[SampleListItemResponse]).validate_python(
+            sample_page.items
+        )
+
+        return SamplePaginatedListResponse(
+            data=response_items,
+            page=page_number,
+            total_pages=pagination_spec.get_total_pages(sample_page.total_items),
+            total_items=sample_page.total_items,
+            has_next=sample_page.has_next,
+            count_strategy=sample_page.count_strategy
+        )
+
+    async def get_samples_cursor_paginated(
+        self,
+        page_size: int,
+        page_after: str | None = None,
+        page_before: str | None = None,
+        ordering: str | None = None,
+        q: str | None = None,
+        material_type_id__eq: str | None = None,
+        material_type_code__eq: str | None = None,
+        material_id__eq: str | None = None,
+        material_source_id__eq: str | None = None,
+        material_source_code__eq: str | None = None
+    ) -> SampleCursorPaginatedListResponse:
+        cursor_spec = CursorPaginationSpecification(page_size, page_after, page_before)
+        ordering_spec = SampleOrderingSpecification(ordering)
+        filter_spec = SampleFilterSpecification(
+            material_type_id__eq=material_type_id__eq,
+            material_type_code__eq=material_type_code__eq,
+            material_id__eq=material_id__eq,
+            material_source_id__eq=material_source_id__eq,
+            material_source_code__eq=material_source_code__eq
+        )
+        search_spec = SampleSearchSpecification(q)
+
+        sample_page = await self.sample_repo.get_all_cursor_paginated(
+            cursor_spec,
+            ordering_spec,
+            filter_spec,
             search_spec,
             include=[
                 SampleLoadOptions.MATERIAL__MATERIAL_TYPE,
@@ -78,14 +162,13 @@ class SampleService:
         )
         response_items = [
             SampleListItemResponse.model_validate(sample)
-            for sample in sample_entities
+            for sample in sample_page.items
         ]
 
-        return SamplePaginatedListResponse(
+        return SampleCursorPaginatedListResponse(
             data=response_items,
-            page=page_number,
-            total_pages=total_pages,
-            total_items=total_samples
+            next_cursor=sample_page.next_cursor,
+            previous_cursor=sample_page.previous_cursor
         )
 
     async def create_sample(self, sample_data: SampleCreate) -> SampleDetailResponse:
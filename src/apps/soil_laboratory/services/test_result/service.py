@@ -22,6 +22,7 @@ from apps.soil_laboratory.schemas.test_result import (
 from apps.soil_laboratory.services.test_result.strategies import (
     resolve_strategies_and_get_test_result_create_dto
 )
+from core.etag import make_etag
 from core.exceptions.database import EntityNotFoundError
 
 
@@ -58,6 +59,12 @@ class TestResultService:
 
         return TestResultDetailResponse.model_validate(test)
 
+    async def get_test_etag(self, test_id: UUID) -> str | None:
+        """Get the ETag of the test result's detail view (`None` if it doesn't exist)."""
+        revision = await self.test_result_repo.get_detail_revision(test_id)
+
+        return make_etag("test_result", test_id, *revision) if revision else None
+
     async def create_test(self, test_result_data: TestResultCreate) -> TestResultDetailResponse:
         sample: Sample = await self.sample_repo.get_by_id(
             test_result_data.sample_id,
@@ -125,11 +132,16 @@ class TestResultService:
     #     return TestDetailResponse.model_validate(test)
 
     async def delete_test(self, test_id: UUID) -> TestResultShortResponse:
-        deleted_test = await self.test_result_repo.hard_delete(test_id)
+        # The response needs the parameter: it's loaded before its test result is gone
+        deleted_test = await self.test_result_repo.get_by_id(
+            test_id,
+            include=[TestResultLoadOptions.PARAMETER]
+        )
 
         if not deleted_test:
             raise EntityNotFoundError(TestResult, test_id)
 
+        await self.test_result_repo.hard_delete(test_id)
         await self.db.commit()
 
         return TestResultShortResponse.model_validate(deleted_test)
@@ -21,4 +21,7 @@ from apps.soil_laboratory.specifications.search.material_source import (
 from apps.soil_laboratory.specifications.search.material_type import MaterialTypeSearchSpecification
 from apps.soil_laboratory.specifications.search.parameter import ParameterSearchSpecification
 from apps.soil_laboratory.specifications.search.sample import SampleSearchSpecification
-from specifications.pagination import PaginationSpecification  # noqa: F401
+from specifications.pagination import (  # noqa: F401
+    CursorPaginationSpecification,
+    PaginationSpecification
+)
@@ -26,6 +26,8 @@ class Settings(BaseSettings):
     # Application
     ENVIRONMENT: Literal["local", "testing", "staging", "production"] = "local"
     APP_NAME: str = "soil_laboratory"
+    # Worker processes serving the application (as read by uvicorn and gunicorn)
+    WEB_CONCURRENCY: int = 1
 
     BASE_DIR: Path = BASE_DIR
 
@@ -33,9 +35,22 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY_ACCESS: str
     JWT_SECRET_KEY_REFRESH: str
     JWT_ALGORITHM: str = "HS256"
+    # Use the hmac/hashlib-based JWT manager for HS256/HS384/HS512 instead of python-jose
+    JWT_FAST_HMAC_MANAGER: bool = True
 
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Periodic deletion of expired refresh tokens (0 disables)
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: float = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # Embed roles and permissions into access tokens, so permission checks need no database lookup
+    # (with several workers, requires USER_DATA_CACHE_BACKEND=redis to share revocations)
+    JWT_EMBED_AUTHORIZATION_CLAIMS: bool = False
+    # Verified access tokens kept until they expire, so repeated tokens skip decoding (0 disables)
+    JWT_VERIFIED_TOKEN_CACHE_SIZE: int = 4096
+
+    # Password hashing (bcrypt) threads per worker process, further calls queue for a free thread
+    PASSWORD_HASHING_MAX_WORKERS: int = 2
 
     # PostgreSQL
     POSTGRES_HOST: str
@@ -64,6 +79,55 @@ class Settings(BaseSettings):
             f"{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    # PostgreSQL read replica (optional; same database, user and password as the primary)
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None  # Defaults to POSTGRES_PORT
+    # How long a user's reads stay on the primary after they committed a write (tracked per worker
+    # process: with several workers, a user's next request may reach a worker unaware of the write)
+    POSTGRES_REPLICA_READ_YOUR_WRITES_SECONDS: float = 5
+
+    # noinspection PyPep8Naming
+    @computed_field
+    @property
+    def ASYNC_POSTGRES_REPLICA_DATABASE_URL(self) -> str | None:
+        """Data Source Name for async PostgreSQL read replica connection (if configured)."""
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
+            f"{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT}/"
+            f"{self.POSTGRES_DB}"
+        )
+
+    # PostgreSQL connection pool (sized per worker process)
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_POOL_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT_SECONDS: float = 30
+    POSTGRES_POOL_RECYCLE_SECONDS: int = 1800  # -1 disables recycling
+    POSTGRES_POOL_PRE_PING: bool = True
+
+    # asyncpg statement caches (per connection)
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Disables both caches and uses unique statement names (required by transaction-mode pgbouncer)
+    POSTGRES_PGBOUNCER_TRANSACTION_MODE: bool = False
+
+    # Pagination
+    COUNT_ESTIMATE_THRESHOLD: int = 100_000
+    COUNT_CACHE_TTL_SECONDS: int = 60
+    COUNT_CACHE_MAX_SIZE: int = 1024
+
+    # Authenticated user data cache. The memory backend is per worker process: with several workers,
+    # a user's or a role's change reaches the other workers only when their entries expire (use the
+    # redis backend to share invalidations)
+    USER_DATA_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    USER_DATA_CACHE_TTL_SECONDS: int = 30
+    USER_DATA_CACHE_MAX_SIZE: int = 10_000  # In-memory backend only
+    # Also stores the permissions epochs, which must not be evicted (use a `volatile-*` or
+    # `noeviction` maxmemory-policy)
+    REDIS_URL: str = "redis://localhost:6379/0"
+
     # pgAdmin
     # PGADMIN_DEFAULT_EMAIL: str
     # PGADMIN_DEFAULT_PASSWORD: str
@@ -75,6 +139,29 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "info"
+    LOG_ASYNC_SINK: bool = True  # Write logs in batches from a background thread
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.5
+    LOG_QUEUE_DROP_POLICY: Literal["drop_newest", "drop_oldest", "block"] = "drop_oldest"
+    # Request lifecycle logs: failed and slow requests are always logged, others are sampled
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0
+    LOG_REQUEST_ROUTE_SAMPLE_RATES: dict[str, float] = {}  # Path prefix -> sample rate
+    LOG_REQUEST_SLOW_THRESHOLD_MS: float = 1000
+    LOG_REQUEST_MAX_LINES_PER_SECOND: float = 0  # 0 = unlimited
+    LOG_REQUEST_SUPPRESSED_SUMMARY_INTERVAL_SECONDS: float = 60  # 0 = only on shutdown
+
+    # Response compression (media type prefixes, DOCX is a ZIP archive already)
+    GZIP_ENABLED: bool = True
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESSION_LEVEL: int = 6
+    GZIP_CONTENT_TYPES: list[str] = ["application/json", "text/"]
+
+    # Metrics
+    METRICS_ENABLED: bool = True
+    # Directory shared by the worker processes for their metrics snapshots (multiprocess mode)
+    METRICS_MULTIPROCESS_DIR: str | None = None
+    METRICS_SNAPSHOT_INTERVAL_SECONDS: float = 5
 
     # Testing
     PATH_TO_TESTING_DB: str = ":memory:"
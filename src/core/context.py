@@ -1,58 +1,81 @@
 from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Union
 
 
 if TYPE_CHECKING:
     from apps.identity.schemas import UserData
 
-# Context variable for correlation ID to trace logs through requests
-_correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
-# Context variable for request path
-_request_path_var: ContextVar[str | None] = ContextVar("request_path", default=None)
+@dataclass(slots=True, frozen=True)
+class RequestContext:
+    """
+    Snapshot of the request-scoped context.
 
-# Context variable for request method
-_request_method_var: ContextVar[str | None] = ContextVar("request_method", default=None)
+    Attributes:
+        correlation_id: Correlation ID to trace logs through requests.
+        request_path: Request path.
+        request_method: Request method.
+        current_user: Authenticated user data.
+    """
+    correlation_id: str | None = None
+    request_path: str | None = None
+    request_method: str | None = None
+    current_user: Union["UserData", None] = None
 
-# Context variable for authenticated user data
-_current_user_var: ContextVar[Union["UserData", None]] = (ContextVar("current_user", default=None))
+
+# Context variable holding the whole request context, so it can be read in a single lookup
+# (e.g., once per log event). Updates replace the snapshot.
+_request_context_var: ContextVar[RequestContext] = ContextVar(
+    "request_context",
+    default=RequestContext()
+)
+
+
+def get_request_context() -> RequestContext:
+    """Get the request context snapshot."""
+    return _request_context_var.get()
+
+
+def _update_request_context(**changes) -> None:
+    _request_context_var.set(replace(_request_context_var.get(), **changes))
 
 
 def get_correlation_id() -> str:
     """Get correlation id from context."""
-    return _correlation_id_var.get()
+    return _request_context_var.get().correlation_id
 
 
 def set_correlation_id(correlation_id: str) -> None:
     """Set correlation id to context."""
-    _correlation_id_var.set(correlation_id)
+    _update_request_context(correlation_id=correlation_id)
 
 
 def get_request_path() -> str:
     """Get request path from context."""
-    return _request_path_var.get()
+    return _request_context_var.get().request_path
 
 
 def set_request_path(request_path: str) -> None:
     """Set request path to context."""
-    _request_path_var.set(request_path)
+    _update_request_context(request_path=request_path)
 
 
 def get_request_method() -> str:
     """Get request method from context."""
-    return _request_method_var.get()
+    return _request_context_var.get().request_method
 
 
 def set_request_method(request_method: str) -> None:
     """Set request method to context."""
-    _request_method_var.set(request_method)
+    _update_request_context(request_method=request_method)
 
 
 def get_current_user() -> Union["UserData", None]:
     """Get current authenticated user from context."""
-    return _current_user_var.get()
+    return _request_context_var.get().current_user
 
 
 def set_current_user(user_data: "UserData") -> None:
     """Set current authenticated user to context."""
-    _current_user_var.set(user_data)
+    _update_request_context(current_user=user_data)
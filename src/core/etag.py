@@ -0,0 +1,45 @@
+import hashlib
+from typing import Any
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the parts identifying a representation's revision."""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:32]
+
+    return f'"{digest}"'
+
+
+def is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an `If-None-Match` header value matches the ETag (weak comparison, as required for
+    `If-None-Match`, so ETags weakened by the compression still match).
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """Set the ETag of a response, which clients should revalidate before reusing."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build the `304 Not Modified` response to a conditional request matching the ETag."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag_headers(response, etag)
+
+    return response
+
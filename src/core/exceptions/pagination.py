@@ -0,0 +1,7 @@
+from core.exceptions.base import ClientError
+
+
+class InvalidCursorError(ClientError):
+    """Raise when a pagination cursor is malformed or does not match the requested ordering."""
+    status_code = 400
+    default_message = "Invalid pagination cursor"
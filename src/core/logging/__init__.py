@@ -1,3 +1,5 @@
 from core.logging.interfaces import AppLoggerInterface
+from core.logging.sampling import RequestLogSampler, SuppressedRequestLogs
 from core.logging.structlog.config import configure_logging as configure_structlog
+from core.logging.structlog.config import get_batching_writer, shutdown_logging
 from core.logging.structlog.structlog_logger import StructlogLogger
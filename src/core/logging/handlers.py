@@ -0,0 +1,162 @@
+import logging
+import sys
+import threading
+from collections import deque
+from typing import BinaryIO, Literal
+
+
+DropPolicy = Literal["drop_newest", "drop_oldest", "block"]
+
+
+class BatchingWriter:
+    """
+    File-like writer that buffers chunks of bytes and writes them to a binary stream in batches from
+    a background thread, so the writing call never waits for the stream (e.g., stdout backpressure).
+
+    The buffer is bounded by `max_queue_size` chunks. When it is full, `drop_policy` decides what
+    happens to a new chunk: `drop_newest` discards it, `drop_oldest` discards the oldest buffered
+    chunk, and `block` waits for the writer thread to make room (back to synchronous behaviour).
+    Discarded chunks are counted in `dropped`.
+
+    Batches the stream fails to accept are lost and counted in `write_errors`. Since logging can't
+    report its own failures, the first one is written to stderr, and `close` writes the counts of
+    lost chunks and failed writes there as well.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 0.5,
+        drop_policy: DropPolicy = "drop_oldest"
+    ):
+        self._stream = stream
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._drop_policy = drop_policy
+
+        self._buffer: deque[bytes] = deque()
+        self._condition = threading.Condition()
+        self._writing = False
+        self._closed = False
+        self.dropped = 0
+        self.write_errors = 0
+
+        self._writer_thread = threading.Thread(
+            target=self._run_writer,
+            name="log-batch-writer",
+            daemon=True
+        )
+        self._writer_thread.start()
+
+    def write(self, data: bytes) -> None:
+        with self._condition:
+            if self._closed:
+                return
+
+            if len(self._buffer) >= self._max_queue_size:
+                if self._drop_policy == "drop_newest":
+                    self.dropped += 1
+                    return
+
+                if self._drop_policy == "drop_oldest":
+                    self._buffer.popleft()
+                    self.dropped += 1
+                else:
+                    self._condition.wait_for(
+                        lambda: len(self._buffer) < self._max_queue_size or self._closed
+                    )
+
+            self._buffer.append(data)
+
+            if len(self._buffer) >= self._batch_size:
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """No-op: buffered chunks are written by the writer thread (use `drain` to wait for it)."""
+
+    def drain(self) -> None:
+        """Wait until every buffered chunk has been written."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not (self._buffer or self._writing) or not self._writer_thread.is_alive(),
+                timeout=5
+            )
+
+    def close(self) -> None:
+        """Write the remaining chunks and stop the writer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        self._writer_thread.join(timeout=5)
+
+        if self.dropped or self.write_errors:
+            _report(
+                f"Log writer: {self.dropped} log events dropped (queue full), "
+                f"{self.write_errors} batch writes failed"
+            )
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._buffer) >= self._batch_size or self._closed,
+                    timeout=self._flush_interval_seconds
+                )
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(len(self._buffer), self._batch_size))
+                ]
+                self._writing = bool(batch)
+                # Wake up blocked writes (the buffer has room again)
+                self._condition.notify_all()
+
+                if not batch and self._closed:
+                    return
+
+            if batch:
+                try:
+                    self._stream.write(b"".join(batch))
+                    self._stream.flush()
+                except Exception as e:
+                    self.write_errors += 1
+
+                    if self.write_errors == 1:
+                        _report(
+                            f"Log writer failed to write {len(batch)} log events "
+                            f"(further failures are only counted): {e!r}"
+                        )
+                finally:
+                    with self._condition:
+                        self._writing = False
+                        self._condition.notify_all()
+
+
+def _report(message: str) -> None:
+    """Write a message about the log writer itself to stderr (bypassing logging)."""
+    try:
+        sys.stderr.write(message + "\n")
+        sys.stderr.flush()
+    except Exception:
+        pass
+
+
+class BatchingStreamHandler(logging.Handler):
+    """Logging handler that formats records and hands them to a `BatchingWriter`."""
+
+    def __init__(self, writer: BatchingWriter, encoding: str = "utf-8"):
+        super().__init__()
+        self._writer = writer
+        self._encoding = encoding
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._writer.write((self.format(record) + "\n").encode(self._encoding))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._writer.drain()
@@ -0,0 +1,116 @@
+import random
+import time
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class SuppressedRequestLogs:
+    """
+    Counts of request lifecycle log lines suppressed since the previous summary.
+
+    Attributes:
+        sampled_out: Lines of requests that were not sampled.
+        rate_limited: Lines of sampled requests dropped by the lines-per-second cap.
+    """
+    sampled_out: int
+    rate_limited: int
+
+
+class RequestLogSampler:
+    """
+    Decides which request lifecycle log lines (`request_start` and `request_end`) are written.
+
+    Failed (status code >= 400) and slow (`slow_threshold_ms` or more) requests are always logged.
+    Other requests are sampled at `sample_rate`, or at the rate of the longest matching path prefix
+    in `route_sample_rates`. The decision is taken when the request starts, so both lines of a
+    request are kept or dropped together. Lines of sampled requests are additionally capped at
+    `max_lines_per_second` (0 means unlimited) by a token bucket.
+
+    The counts of suppressed lines are collected with `pop_suppressed` (see
+    `run_suppressed_request_logs_summary`).
+
+    Not thread-safe, meant to be used from the event loop.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 1000,
+        route_sample_rates: dict[str, float] | None = None,
+        max_lines_per_second: float = 0
+    ):
+        self._sample_rate = sample_rate
+        self._slow_threshold_ms = slow_threshold_ms
+        self._route_sample_rates = sorted(
+            (route_sample_rates or {}).items(),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self._max_lines_per_second = max_lines_per_second
+
+        self._tokens = max_lines_per_second
+        self._refilled_at = time.monotonic()
+        self._sampled_out = 0
+        self._rate_limited = 0
+
+    def sample_request(self, path: str) -> bool:
+        """Decide whether the lines of a (fast and successful) request to `path` are kept."""
+        sample_rate = next(
+            (rate for prefix, rate in self._route_sample_rates if path.startswith(prefix)),
+            self._sample_rate
+        )
+
+        return sample_rate >= 1 or random.random() < sample_rate
+
+    def should_log_start(self, sampled: bool) -> bool:
+        if not sampled:
+            self._sampled_out += 1
+            return False
+
+        return self._take_token()
+
+    def should_log_end(self, sampled: bool, status_code: int, duration_ms: float) -> bool:
+        if status_code >= 400 or duration_ms >= self._slow_threshold_ms:
+            return True
+
+        if not sampled:
+            self._sampled_out += 1
+            return False
+
+        return self._take_token()
+
+    def pop_suppressed(self) -> SuppressedRequestLogs | None:
+        """
+        Returns the counts of lines suppressed since the previous call (`None` if nothing was
+        suppressed), and resets them.
+        """
+        if not (self._sampled_out or self._rate_limited):
+            return None
+
+        suppressed = SuppressedRequestLogs(
+            sampled_out=self._sampled_out,
+            rate_limited=self._rate_limited
+        )
+        self._sampled_out = 0
+        self._rate_limited = 0
+
+        return suppressed
+
+    def _take_token(self) -> bool:
+        if self._max_lines_per_second <= 0:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(
+            self._max_lines_per_second,
+            self._tokens + (now - self._refilled_at) * self._max_lines_per_second
+        )
+        self._refilled_at = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        self._rate_limited += 1
+
+        return False
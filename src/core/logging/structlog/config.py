@@ -1,53 +1,139 @@
+import json
 import logging
 import sys
-from typing import Any
+from typing import Any, BinaryIO
 
 import structlog
 
 import core.context as context
+from core.logging.handlers import BatchingStreamHandler, BatchingWriter, DropPolicy
 
 
 def add_context_data(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Structlog processor to add context data from contextvars."""
-    event_dict["correlation_id"] = context.get_correlation_id()
+    request_context = context.get_request_context()
 
-    event_dict["request_path"] = context.get_request_path()
-    event_dict["request_method"] = context.get_request_method()
+    event_dict["correlation_id"] = request_context.correlation_id
 
-    current_user = context.get_current_user()
+    event_dict["request_path"] = request_context.request_path
+    event_dict["request_method"] = request_context.request_method
+
+    current_user = request_context.current_user
     event_dict["user_id"] = current_user.id if current_user else None
 
     return event_dict
 
 
-def configure_logging(log_level: str, environment: str) -> None:
+def _json_dumps_bytes(obj: Any, **kwargs) -> bytes:
+    return json.dumps(obj, **kwargs).encode()
+
+
+class _NamedBytesLogger(structlog.BytesLogger):
+    """`BytesLogger` that keeps the name it was created with (for `add_logger_name`)."""
+
+    def __init__(self, file: BinaryIO, name: str | None = None):
+        super().__init__(file)
+        self.name = name
+
+
+class _NamedBytesLoggerFactory:
+    def __init__(self, file: BinaryIO):
+        self._file = file
+
+    def __call__(self, *args: Any) -> _NamedBytesLogger:
+        return _NamedBytesLogger(self._file, args[0] if args else None)
+
+
+# Batching writer shared by structlog and the root logger's handler (if the async sink is enabled)
+_batching_writer: BatchingWriter | None = None
+
+
+def configure_logging(
+    log_level: str,
+    environment: str,
+    async_sink: bool = False,
+    queue_max_size: int = 10_000,
+    batch_size: int = 256,
+    flush_interval_seconds: float = 0.5,
+    drop_policy: DropPolicy = "drop_oldest"
+) -> None:
+    """
+    Configure structlog and the standard library's root logger.
+
+    In production, structlog renders events to JSON bytes and writes them to stdout itself, without
+    going through the standard library's `logging` (which is only used by third-party libraries).
+    Otherwise, events are rendered for the console and passed on to `logging`.
+
+    With `async_sink`, rendered events are buffered and written to stdout in batches by a background
+    thread (see `BatchingWriter`); call `shutdown_logging` on shutdown to write out the rest.
+    """
+    global _batching_writer
+
+    output = sys.stdout.buffer
+    _batching_writer = (
+        BatchingWriter(
+            output,
+            max_queue_size=queue_max_size,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+            drop_policy=drop_policy
+        )
+        if async_sink
+        else None
+    )
+
     shared_processors = [
-        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        add_context_data
+        add_context_data,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info
     ]
 
-    renderer_processor = (
-        structlog.processors.JSONRenderer()
-        if environment == "production"
-        else structlog.dev.ConsoleRenderer()
-    )
-
-    structlog.configure(
-        processors=[
-            *shared_processors,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            renderer_processor
-        ],
-        wrapper_class=structlog.stdlib.BoundLogger or None,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+    if environment == "production":
+        structlog.configure(
+            processors=[
+                *shared_processors,
+                structlog.processors.JSONRenderer(serializer=_json_dumps_bytes)
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(
+                logging.getLevelName(log_level.upper())
+            ),
+            logger_factory=_NamedBytesLoggerFactory(_batching_writer or output),
+            cache_logger_on_first_use=True,
+        )
+    else:
+        structlog.configure(
+            processors=[
+                structlog.contextvars.merge_contextvars,
+                *shared_processors,
+                structlog.dev.ConsoleRenderer()
+            ],
+            wrapper_class=structlog.stdlib.BoundLogger,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
 
     root_logger = logging.getLogger()
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = (
+        BatchingStreamHandler(_batching_writer)
+        if _batching_writer
+        else logging.StreamHandler(sys.stdout)
+    )
     root_logger.addHandler(console_handler)
     root_logger.setLevel(log_level.upper())
+
+
+def get_batching_writer() -> BatchingWriter | None:
+    """Get the async sink's batching writer (`None` if the async sink is disabled)."""
+    return _batching_writer
+
+
+def shutdown_logging() -> None:
+    """Flush the root logger's handlers and write out the events buffered by the async sink."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+    if _batching_writer:
+        _batching_writer.close()
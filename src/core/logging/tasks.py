@@ -0,0 +1,27 @@
+import asyncio
+
+from core.logging.interfaces import AppLoggerInterface
+from core.logging.sampling import RequestLogSampler
+
+
+async def run_suppressed_request_logs_summary(
+    sampler: RequestLogSampler,
+    logger: AppLoggerInterface,
+    interval_seconds: float
+) -> None:
+    """Log the counts of suppressed request lines every `interval_seconds` (until cancelled)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        log_suppressed_request_logs(sampler, logger)
+
+
+def log_suppressed_request_logs(sampler: RequestLogSampler, logger: AppLoggerInterface) -> None:
+    """Log the counts of request lines suppressed since the previous summary, if any."""
+    if suppressed := sampler.pop_suppressed():
+        logger.info(
+            f"Request logs suppressed: {suppressed.sampled_out} sampled out, "
+            f"{suppressed.rate_limited} rate limited",
+            sampled_out=suppressed.sampled_out,
+            rate_limited=suppressed.rate_limited
+        )
@@ -1,11 +1,33 @@
 from typing import Final
 
-from core.logging import AppLoggerInterface, StructlogLogger, configure_structlog
+from core.logging import (
+    AppLoggerInterface,
+    RequestLogSampler,
+    StructlogLogger,
+    configure_structlog,
+    shutdown_logging
+)
 from core.config import settings
 
 
 # Configure StructlogLogger
-configure_structlog(log_level=settings.LOG_LEVEL, environment=settings.ENVIRONMENT)
+configure_structlog(
+    log_level=settings.LOG_LEVEL,
+    environment=settings.ENVIRONMENT,
+    async_sink=settings.LOG_ASYNC_SINK,
+    queue_max_size=settings.LOG_QUEUE_MAX_SIZE,
+    batch_size=settings.LOG_BATCH_SIZE,
+    flush_interval_seconds=settings.LOG_FLUSH_INTERVAL_SECONDS,
+    drop_policy=settings.LOG_QUEUE_DROP_POLICY
+)
 
 # # Global logger instance
 logger: Final[AppLoggerInterface] = StructlogLogger(settings.APP_NAME)
+
+# Request lifecycle logs sampler
+request_log_sampler: Final[RequestLogSampler] = RequestLogSampler(
+    sample_rate=settings.LOG_REQUEST_SAMPLE_RATE,
+    slow_threshold_ms=settings.LOG_REQUEST_SLOW_THRESHOLD_MS,
+    route_sample_rates=settings.LOG_REQUEST_ROUTE_SAMPLE_RATES,
+    max_lines_per_second=settings.LOG_REQUEST_MAX_LINES_PER_SECOND
+)
@@ -0,0 +1,3 @@
+from core.metrics.http import HTTPMetrics
+from core.metrics.queries import QueryStats, instrument_query_stats, start_query_stats
+from core.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+
+from core.metrics.dependencies import metrics_registry
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(
+        content=metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,40 @@
+from core.logging.handlers import BatchingWriter
+from core.metrics.registry import MetricsRegistry
+from core.security.token_cache import VerifiedTokenCache
+
+
+def register_token_cache_metrics(
+    registry: MetricsRegistry,
+    token_cache: VerifiedTokenCache
+) -> None:
+    """Expose the verified access token cache's stats."""
+    size = registry.gauge("auth_token_cache_size", "Number of cached verified access tokens.")
+    hit_ratio = registry.gauge(
+        "auth_token_cache_hit_ratio",
+        "Share of access token verifications answered from the cache (since process start)."
+    )
+
+    def collect() -> None:
+        stats = token_cache.get_stats()
+        size.set(stats.size)
+        hit_ratio.set(stats.hit_ratio)
+
+    registry.add_collect_hook(collect)
+
+
+def register_log_sink_metrics(registry: MetricsRegistry, writer: BatchingWriter) -> None:
+    """Expose the log events lost by the async log sink."""
+    dropped = registry.counter(
+        "log_events_dropped_total",
+        "Log events discarded because the async sink's queue was full."
+    )
+    write_errors = registry.counter(
+        "log_write_errors_total",
+        "Batches of log events the async sink failed to write."
+    )
+
+    def collect() -> None:
+        dropped.inc_to_total(writer.dropped)
+        write_errors.inc_to_total(writer.write_errors)
+
+    registry.add_collect_hook(collect)
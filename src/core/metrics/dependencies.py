@@ -0,0 +1,12 @@
+from typing import Final
+
+from core.config import settings
+from core.metrics.http import HTTPMetrics
+from core.metrics.registry import MetricsRegistry
+
+
+# Global metrics registry and HTTP request metrics instances
+metrics_registry: Final[MetricsRegistry] = MetricsRegistry(
+    multiprocess_dir=settings.METRICS_MULTIPROCESS_DIR
+)
+http_metrics: Final[HTTPMetrics] = HTTPMetrics(metrics_registry)
@@ -0,0 +1,42 @@
+from core.metrics.queries import QueryStats
+from core.metrics.registry import MetricsRegistry
+
+
+class HTTPMetrics:
+    """HTTP request metrics (recorded by `MetricsMiddleware`), labelled by route template."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.requests = registry.counter(
+            "http_requests_total",
+            "Number of HTTP requests.",
+            ("method", "route", "status")
+        )
+        self.request_duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request duration (including the response body).",
+            ("method", "route")
+        )
+        self.db_queries = registry.histogram(
+            "http_request_db_queries",
+            "Number of database queries per HTTP request.",
+            ("method", "route"),
+            buckets=(0, 1, 2, 5, 10, 20, 50, 100)
+        )
+        self.db_query_duration = registry.histogram(
+            "http_request_db_query_duration_seconds",
+            "Total database query time per HTTP request.",
+            ("method", "route")
+        )
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_seconds: float,
+        query_stats: QueryStats
+    ) -> None:
+        self.requests.inc((method, route, str(status_code)))
+        self.request_duration.observe(duration_seconds, (method, route))
+        self.db_queries.observe(query_stats.count, (method, route))
+        self.db_query_duration.observe(query_stats.duration_seconds, (method, route))
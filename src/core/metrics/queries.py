@@ -0,0 +1,59 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """
+    Database queries executed while handling a request.
+
+    Attributes:
+        count: Number of executed statements.
+        duration_seconds: Total execution time.
+    """
+    count: int = 0
+    duration_seconds: float = 0.0
+
+
+# Context variable for the query stats of the current request (the object is mutated in place, so
+# updates made from the greenlets SQLAlchemy runs the statements in are seen by the request)
+_query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    """Start collecting query stats for the current request."""
+    query_stats = QueryStats()
+    _query_stats_var.set(query_stats)
+
+    return query_stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started_at = conn.info["query_started_at"].pop()
+    query_stats = _query_stats_var.get()
+
+    if query_stats is not None:
+        query_stats.count += 1
+        query_stats.duration_seconds += time.perf_counter() - started_at
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+
+    # The failed statement never reaches `after_cursor_execute`
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_query_stats(engine: Engine) -> None:
+    """Record the statements executed by the engine in the current request's query stats."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,314 @@
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Final, Iterable, TypeVar
+
+
+DEFAULT_BUCKETS: Final[tuple[float, ...]] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+
+
+class Metric(ABC):
+    """Base class of metrics: a named family of values, one per combination of label values."""
+    type: str
+
+    def __init__(self, name: str, documentation: str, label_names: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def dump(self) -> dict[str, Any]:
+        """Returns the metric's definition and values in a JSON-serializable form."""
+        return {
+            "type": self.type,
+            "documentation": self.documentation,
+            "label_names": list(self.label_names),
+            "values": self._dump_values()
+        }
+
+    @abstractmethod
+    def _dump_values(self) -> list[list[Any]]:
+        """Returns the values as `[label values, *value]` lists."""
+        ...
+
+
+class Counter(Metric):
+    """Monotonically increasing value (e.g., number of requests)."""
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Iterable[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        # Last totals passed to `inc_to_total`, per label values
+        self._source_totals: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...] = (), amount: float = 1) -> None:
+        self._values[labels] += amount
+
+    def inc_to_total(self, total: float, labels: tuple[str, ...] = ()) -> None:
+        """
+        Increase the value by the change of a total counted elsewhere (e.g., read by a collect
+        hook) since the previous call. A total lower than the previous one means its source was
+        reset (e.g., a recreated connection pool), so it's added as a whole.
+        """
+        previous_total = self._source_totals.get(labels, 0)
+        self.inc(labels, total - previous_total if total >= previous_total else total)
+        self._source_totals[labels] = total
+
+    def _dump_values(self) -> list[list[Any]]:
+        return [[list(labels), value] for labels, value in self._values.items()]
+
+
+class Gauge(Metric):
+    """Value that can go up and down (e.g., connections in use)."""
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Iterable[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, labels: tuple[str, ...] = ()) -> None:
+        self._values[labels] = value
+
+    def _dump_values(self) -> list[list[Any]]:
+        return [[list(labels), value] for labels, value in self._values.items()]
+
+
+class Histogram(Metric):
+    """Distribution of observed values (e.g., request durations) over fixed buckets."""
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: (non-cumulative) bucket counts (the last one is "+Inf") and the sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, labels: tuple[str, ...] = ()) -> None:
+        entry = self._values.get(labels)
+
+        if entry is None:
+            entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1][0] += value
+
+    def dump(self) -> dict[str, Any]:
+        return {**super().dump(), "buckets": list(self.buckets)}
+
+    def _dump_values(self) -> list[list[Any]]:
+        return [
+            [list(labels), list(counts), total[0]]
+            for labels, (counts, total) in self._values.items()
+        ]
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """
+    In-process registry of metrics rendered in the Prometheus text exposition format.
+
+    Collect hooks run before every render (or snapshot) to update metrics whose values are read
+    from elsewhere (e.g., connection pool gauges).
+
+    With a `multiprocess_dir`, every worker process writes snapshots of its metrics to a file in
+    that directory (`write_snapshot`) and a render merges the snapshots of all workers: counters and
+    histograms are summed, gauges are reported per live process (with a `pid` label). The directory
+    should be emptied before the workers start.
+    """
+
+    def __init__(self, multiprocess_dir: str | None = None):
+        self._metrics: dict[str, Metric] = {}
+        self._collect_hooks: list[Callable[[], None]] = []
+        self._multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+
+        if self._multiprocess_dir:
+            self._multiprocess_dir.mkdir(parents=True, exist_ok=True)
+
+    def register(self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def add_collect_hook(self, hook: Callable[[], None]) -> None:
+        self._collect_hooks.append(hook)
+
+    def dump(self) -> dict[str, dict[str, Any]]:
+        """Runs the collect hooks and returns all metrics in a JSON-serializable form."""
+        for hook in self._collect_hooks:
+            hook()
+
+        return {name: metric.dump() for name, metric in self._metrics.items()}
+
+    def write_snapshot(self, live: bool = True) -> None:
+        """
+        Writes the snapshot of this process' metrics to the multiprocess directory (no-op without
+        one). The final snapshot of a stopping process is written with `live=False`, so only its
+        counters and histograms are kept.
+        """
+        if not self._multiprocess_dir:
+            return
+
+        path = self._multiprocess_dir / f"metrics_{os.getpid()}.json"
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(
+            json.dumps({"pid": os.getpid(), "live": live, "metrics": self.dump()})
+        )
+        # Atomic replace, so readers never see a partially written snapshot
+        os.replace(temporary_path, path)
+
+    def render(self) -> str:
+        """Renders the metrics (of all worker processes in multiprocess mode)."""
+        if not self._multiprocess_dir:
+            return _render(self.dump())
+
+        self.write_snapshot()
+
+        return _render(_merge_snapshots(self._read_snapshots()))
+
+    def _read_snapshots(self) -> list[dict[str, Any]]:
+        snapshots = []
+
+        for path in self._multiprocess_dir.glob("metrics_*.json"):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                # Removed or being replaced concurrently
+                continue
+
+        return snapshots
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _merge_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {}
+
+    for snapshot in snapshots:
+        is_live = snapshot["live"] and _is_process_alive(snapshot["pid"])
+
+        for name, metric in snapshot["metrics"].items():
+            merged_metric = merged.setdefault(name, {**metric, "values": {}})
+            values = merged_metric["values"]
+
+            if metric["type"] == "gauge":
+                if not is_live:
+                    continue
+
+                merged_metric["label_names"] = [*metric["label_names"], "pid"]
+
+                for labels, value in metric["values"]:
+                    values[(*labels, str(snapshot["pid"]))] = value
+            elif metric["type"] == "counter":
+                for labels, value in metric["values"]:
+                    values[tuple(labels)] = values.get(tuple(labels), 0) + value
+            else:
+                for labels, counts, total in metric["values"]:
+                    merged_counts, merged_total = values.get(
+                        tuple(labels),
+                        ([0] * len(counts), 0.0)
+                    )
+                    values[tuple(labels)] = (
+                        [a + b for a, b in zip(merged_counts, counts)],
+                        merged_total + total
+                    )
+
+    for metric in merged.values():
+        metric["values"] = [
+            [list(labels), *value] if isinstance(value, tuple) else [list(labels), value]
+            for labels, value in metric["values"].items()
+        ]
+
+    return merged
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"')
+
+
+def _format_labels(label_names: Iterable[str], label_values: Iterable[Any]) -> str:
+    pairs = [
+        f'{name}="{_escape_label_value(str(value))}"'
+        for name, value in zip(label_names, label_values)
+    ]
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+def _render(metrics: dict[str, dict[str, Any]]) -> str:
+    lines = []
+
+    for name, metric in metrics.items():
+        label_names = metric["label_names"]
+        lines.append(f"# HELP {name} {metric['documentation']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+
+        if metric["type"] != "histogram":
+            for labels, value in metric["values"]:
+                lines.append(f"{name}{_format_labels(label_names, labels)} {_format_value(value)}")
+
+            continue
+
+        bucket_label_names = [*label_names, "le"]
+        bucket_bounds = [*metric["buckets"], math.inf]
+
+        for labels, counts, total in metric["values"]:
+            cumulative_count = 0
+
+            for bound, count in zip(bucket_bounds, counts):
+                cumulative_count += count
+                bucket_labels = _format_labels(bucket_label_names, [*labels, _format_value(bound)])
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative_count}")
+
+            formatted_labels = _format_labels(label_names, labels)
+            lines.append(f"{name}_sum{formatted_labels} {_format_value(total)}")
+            lines.append(f"{name}_count{formatted_labels} {cumulative_count}")
+
+    return "\n".join(lines) + "\n"
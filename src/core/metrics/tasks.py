@@ -0,0 +1,15 @@
+import asyncio
+
+from core.logging_config import logger
+from core.metrics.registry import MetricsRegistry
+
+
+async def run_metrics_snapshot_writer(registry: MetricsRegistry, interval_seconds: float) -> None:
+    """Write the process' metrics snapshot every `interval_seconds` (until cancelled)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            registry.write_snapshot()
+        except Exception:
+            logger.exception("Failed to write metrics snapshot")
@@ -1,3 +1,5 @@
+from core.middleware.compression import GZipMiddleware
 from core.middleware.error_handling import ErrorHandlingMiddleware
 from core.middleware.jwt_authentication import JWTAuthenticationMiddleware
+from core.middleware.metrics import MetricsMiddleware
 from core.middleware.request_logging import RequestLoggingMiddleware
@@ -0,0 +1,128 @@
+import gzip
+import zlib
+from typing import Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether the `Accept-Encoding` header value allows gzip (with a non-zero quality)."""
+    qualities: dict[str, float] = {}
+
+    for coding in accept_encoding.split(","):
+        name, _, parameters = coding.partition(";")
+        quality = parameters.strip().removeprefix("q=")
+
+        try:
+            qualities[name.strip().lower()] = float(quality) if quality else 1.0
+        except ValueError:
+            continue
+
+    return qualities.get("gzip", qualities.get("*", 0)) > 0
+
+
+class GZipMiddleware:
+    """
+    Middleware compressing responses with gzip for clients that accept it.
+
+    Only responses whose media type starts with one of `content_types` (and which are not already
+    encoded) are compressed. A response sent as a single body message (e.g., JSON) is compressed as
+    a whole if it's at least `minimum_size` bytes. A streamed response (e.g., `StreamingResponse`)
+    is compressed chunk by chunk and every chunk is flushed right away, so it's never buffered.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compression_level: int = 6,
+        content_types: Iterable[str] = ("application/json", "text/")
+    ):
+        self.app = app
+        self._minimum_size = minimum_size
+        self._compression_level = compression_level
+        self._content_types = tuple(content_types)
+
+    def _is_compressible(self, headers: Headers) -> bool:
+        if "Content-Encoding" in headers or "Content-Range" in headers:
+            return False
+
+        media_type = headers.get("Content-Type", "").partition(";")[0].strip().lower()
+
+        return media_type.startswith(self._content_types)
+
+    @staticmethod
+    def _set_encoding_headers(start_message: Message) -> MutableHeaders:
+        headers = MutableHeaders(scope=start_message)
+        headers["Content-Encoding"] = "gzip"
+        headers.add_vary_header("Accept-Encoding")
+
+        # The compressed representation differs byte by byte from the original one
+        etag = headers.get("ETag")
+
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _accepts_gzip(
+            Headers(scope=scope).get("Accept-Encoding", "")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                if self._is_compressible(Headers(raw=message["headers"])):
+                    # Hold the headers back until the first body message shows the response's kind
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body:
+                    if len(body) >= self._minimum_size:
+                        body = gzip.compress(body, compresslevel=self._compression_level, mtime=0)
+                        headers = self._set_encoding_headers(start_message)
+                        headers["Content-Length"] = str(len(body))
+                        message = {**message, "body": body}
+
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                # Streamed response: its length is unknown, so compress it on the fly
+                compressor = zlib.compressobj(
+                    self._compression_level,
+                    zlib.DEFLATED,
+                    16 + zlib.MAX_WBITS  # gzip container
+                )
+                headers = self._set_encoding_headers(start_message)
+                del headers["Content-Length"]
+                await send(start_message)
+
+            body = compressor.compress(body) + compressor.flush(
+                zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+            )
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,47 +1,69 @@
 import traceback
 
-from fastapi import Request, Response, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.exceptions import AppException
 from core.logging import AppLoggerInterface
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """
     Centralized error handling middleware.
 
     Intercepts all exceptions, provides structured error responses, and ensures consistent logging.
+    Exceptions raised after the response has started (e.g., while streaming its body) are logged and
+    re-raised, since the response can no longer be replaced.
     """
 
     def __init__(self, app: ASGIApp, logger: AppLoggerInterface):
-        super().__init__(app)
+        self.app = app
         self._logger = logger
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
 
         except AppException as e:
             # Handle known application exceptions with specific error codes and messages
-            self._logger.request_error(e, request)
+            self._logger.request_error(e, Request(scope))
+
+            if response_started:
+                raise
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=e.status_code,
                 content={"detail": e.message, "exception": traceback.format_exc()},
             )
+            await response(scope, receive, send)
 
         except Exception as e:
             # Handle unexpected system exceptions with generic error response
-            self._logger.request_unexpected_error(e, request)
+            self._logger.request_unexpected_error(e, Request(scope))
+
+            if response_started:
+                raise
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "detail": "Internal Server Error. Please contact support.",
                     "exception": traceback.format_exc()
                 }
             )
+            await response(scope, receive, send)
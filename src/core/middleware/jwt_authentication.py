@@ -1,15 +1,22 @@
 from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from core.security.interfaces import JWTManagerInterface
+from core.security.token_cache import VerifiedTokenCache
 
 
-class JWTAuthenticationMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, jwt_manager: JWTManagerInterface):
-        super().__init__(app)
+class JWTAuthenticationMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        jwt_manager: JWTManagerInterface,
+        token_cache: VerifiedTokenCache | None = None
+    ):
+        self.app = app
         self.jwt_manager = jwt_manager
-        self.exclude_paths = ["/auth", "/health", "/docs", "/openapi.json"]
+        self.token_cache = token_cache
+        self.exclude_paths = ["/auth", "/health", "/metrics", "/docs", "/openapi.json"]
 
     @staticmethod
     def _extract_endpoint_path(full_path: str) -> str:
@@ -20,44 +27,54 @@ class JWTAuthenticationMiddleware(BaseHTTPMiddleware):
 
         return full_path
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         original_path = request.url.path
         endpoint_path = self._extract_endpoint_path(original_path)
 
         # Skip authentication for excluded paths
         if any(endpoint_path.startswith(excluded) for excluded in self.exclude_paths):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get authorization header
         authorization_header = request.headers.get("Authorization")
 
         if not authorization_header:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": "Authorization header is missing"}
             )
+            await response(scope, receive, send)
+            return
 
         scheme, _, token = authorization_header.partition(" ")
 
         if scheme != "Bearer" or not token:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": "Invalid Authorization header format. Expected 'Bearer <token>'"}
             )
+            await response(scope, receive, send)
+            return
+
+        # Decode and validate JWT token (unless it has already been verified and has not expired)
+        payload = self.token_cache.get(token) if self.token_cache else None
 
-        # Decode and validate JWT token
-        payload = self.jwt_manager.decode_access_token(token)
+        if payload is None:
+            payload = self.jwt_manager.decode_access_token(token)
 
-        # Extract user data from JWT payload
-        user_data = {
-            "user_id": payload.get("sub"),
-            "email": payload.get("email")
-        }
-        print(user_data)
+            if self.token_cache:
+                self.token_cache.set(token, payload)
 
-        # Add user data to request state
+        # Add user data to request state (shared with the endpoint's request through the scope)
         request.state.user_id = payload.get("sub")
         request.state.user_email = payload.get("email")
+        request.state.access_token_payload = payload
 
         # Continue to the next middleware or endpoint
-        return await call_next(request)
+        await self.app(scope, receive, send)
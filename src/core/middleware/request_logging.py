@@ -1,23 +1,39 @@
 import time
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import core.context as context
-from core.logging import AppLoggerInterface
+from core.logging import AppLoggerInterface, RequestLogSampler
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging incoming HTTP requests and their processing time."""
+class RequestLoggingMiddleware:
+    """
+    Middleware for logging incoming HTTP requests and their processing time.
 
-    def __init__(self, app: ASGIApp, logger: AppLoggerInterface):
-        super().__init__(app)
+    If a `sampler` is given, only the lines it selects are logged (the counts of suppressed lines
+    are summarized by `run_suppressed_request_logs_summary`).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: AppLoggerInterface,
+        sampler: RequestLogSampler | None = None
+    ):
+        self.app = app
         self._logger = logger
+        self._sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Get from headers or generate a correlation ID for tracing this request
         correlation_id = request.headers.get("Correlation-Id", str(uuid.uuid4()))
         # Set correlation ID as ContextVar
@@ -27,20 +43,35 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         context.set_request_path(request.url.path)
 
         start_time = time.perf_counter()
+        status_code = 500
+
+        sampled = self._sampler.sample_request(request.url.path) if self._sampler else True
 
         # Log request start
-        self._logger.request_start(request)
+        if not self._sampler or self._sampler.should_log_start(sampled):
+            self._logger.request_start(request)
 
-        # Process the request
-        response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
 
-        # Measure processing time
-        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add debug headers to response
+                MutableHeaders(scope=message)["Correlation-Id"] = correlation_id
 
-        # Add debug headers to response
-        response.headers["Correlation-Id"] = correlation_id
+            await send(message)
 
-        # Log request end
-        self._logger.request_end(request, response.status_code, duration_ms)
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Measure processing time (including the response body)
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
-        return response
+            # Log request end
+            if not self._sampler or self._sampler.should_log_end(
+                sampled,
+                status_code,
+                duration_ms
+            ):
+                self._logger.request_end(request, status_code, duration_ms)
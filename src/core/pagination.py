@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class CountStrategy(str, Enum):
+    """
+    Strategy used to produce the total items count of a paginated list.
+
+    Attributes:
+        EXACT: Exact `COUNT(*)` of the filtered set, computed in the page query.
+        CACHED: Exact count, cached per filter signature and invalidated on committed writes.
+        ESTIMATED: PostgreSQL planner estimate; an exact count is used below a size threshold.
+        NONE: No count at all; only `has_next` is reported.
+    """
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
@@ -1,5 +1,9 @@
+from typing import Final
+
 from core.config import settings
+from core.security.hmac_token_manager import HMAC_ALGORITHMS, HMACJWTManager
 from core.security.interfaces import JWTManagerInterface
+from core.security.token_cache import VerifiedTokenCache
 from core.security.token_manager import JWTManager
 
 
@@ -8,8 +12,18 @@ def get_jwt_manager() -> JWTManagerInterface:
     Get JWT manager instance
 
     Returns:
-        JWTManager instance configured with settings
+        JWTManager instance configured with settings (the specialized `HMACJWTManager` for HMAC
+        algorithms, unless disabled)
     """
+    if settings.JWT_FAST_HMAC_MANAGER and settings.JWT_ALGORITHM in HMAC_ALGORITHMS:
+        return HMACJWTManager(
+            access_secret_key=settings.JWT_SECRET_KEY_ACCESS,
+            refresh_secret_key=settings.JWT_SECRET_KEY_REFRESH,
+            algorithm=settings.JWT_ALGORITHM,
+            access_expire_minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+            refresh_expire_days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+        )
+
     return JWTManager(
         access_secret_key=settings.JWT_SECRET_KEY_ACCESS,
         refresh_secret_key=settings.JWT_SECRET_KEY_REFRESH,
@@ -17,3 +31,9 @@ def get_jwt_manager() -> JWTManagerInterface:
         access_expire_minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
         refresh_expire_days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
     )
+
+
+# Global verified access token cache instance
+verified_token_cache: Final[VerifiedTokenCache] = VerifiedTokenCache(
+    max_size=settings.JWT_VERIFIED_TOKEN_CACHE_SIZE
+)
@@ -91,6 +91,6 @@ class EmptyTokenError(TokenError):
     default_message = "Token is empty or None"
 
 
-class TokenSignatureError(TokenError):
-    """Exception raised when token signature is invalid"""
+class TokenSignatureError(InvalidTokenError):
+    """Exception raised when token signature is invalid (a kind of invalid token)"""
     default_message = "Token signature is invalid"
@@ -0,0 +1,226 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Final
+
+from core.security.exceptions import (
+    EmptyTokenError,
+    ExpiredTokenError,
+    InvalidTokenError,
+    InvalidTokenTypeError,
+    TokenCreationError,
+    TokenSignatureError,
+    TokenVerificationError
+)
+from core.security.interfaces import JWTManagerInterface
+
+
+# Supported algorithms and their digests
+HMAC_ALGORITHMS: Final[dict[str, Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512
+}
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _json_encode(data: dict[str, Any], sort_keys: bool = False) -> bytes:
+    return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys).encode()
+
+
+class HMACJWTManager(JWTManagerInterface):
+    """
+    A JWT manager specialized for HMAC algorithms (HS256, HS384 and HS512), built directly on
+    `hmac`/`hashlib`.
+
+    Tokens are byte-for-byte identical to those produced by `JWTManager` (python-jose) and either
+    implementation accepts the other's tokens. Claims (`exp`, `iat`, `nbf`, `aud`, `sub`, `jti`)
+    are validated by the same rules and reported with the same exceptions. A signature mismatch
+    raises `TokenSignatureError`, a subclass of the `InvalidTokenError` python-jose reports it as,
+    so handlers of either implementation's errors work with both.
+    """
+
+    def __init__(
+        self,
+        access_secret_key: str,
+        refresh_secret_key: str,
+        algorithm: str,
+        access_expire_minutes: int,
+        refresh_expire_days: int
+    ):
+        """
+        Initialize JWT manager with configuration.
+
+        Args:
+            access_secret_key: Secret key for access tokens
+            refresh_secret_key: Secret key for refresh tokens
+            algorithm: JWT signing algorithm (one of `HMAC_ALGORITHMS`)
+            access_expire_minutes: Access token expiration time in minutes
+            refresh_expire_days: Refresh token expiration time in days
+        """
+        if algorithm not in HMAC_ALGORITHMS:
+            raise ValueError(f"Unsupported HMAC algorithm: '{algorithm}'")
+
+        self._access_secret_key = access_secret_key.encode()
+        self._refresh_secret_key = refresh_secret_key.encode()
+        self._algorithm = algorithm
+        self._digest = HMAC_ALGORITHMS[algorithm]
+        self._access_expire_minutes = access_expire_minutes
+        self._refresh_expire_minutes = 60 * 24 * refresh_expire_days
+        self._encoded_header = _b64url_encode(
+            _json_encode({"alg": algorithm, "typ": "JWT"}, sort_keys=True)
+        )
+
+    def create_access_token(self, data: dict[str, Any]) -> str:
+        """Create a new access token."""
+        return self._create_token(
+            data,
+            self._access_secret_key,
+            self._access_expire_minutes,
+            "access"
+        )
+
+    def create_refresh_token(self, data: dict[str, Any]) -> str:
+        """Create a new refresh token."""
+        return self._create_token(
+            data,
+            self._refresh_secret_key,
+            self._refresh_expire_minutes,
+            "refresh"
+        )
+
+    def decode_access_token(self, token: str) -> dict[str, Any]:
+        """Verify and decode an access token."""
+        if not token or not token.strip():
+            raise EmptyTokenError()
+
+        return self._decode_token(token, self._access_secret_key, "access")
+
+    def decode_refresh_token(self, token: str) -> dict[str, Any]:
+        """Verify and decode a refresh token."""
+        if not token or not token.strip():
+            raise EmptyTokenError("Token is empty or None")
+
+        return self._decode_token(token, self._refresh_secret_key, "refresh")
+
+    def verify_access_token(self, token: str) -> None:
+        """Verify an access token and raise an error if it's invalid or expired."""
+        self.decode_access_token(token)
+
+    def verify_refresh_token(self, token: str) -> None:
+        """Verify a refresh token and raise an error if it's invalid or expired."""
+        self.decode_refresh_token(token)
+
+    def get_token_expiration(self, token: str) -> datetime:
+        """Get the expiration time of a token."""
+        if not token or not token.strip():
+            raise EmptyTokenError("Token is empty or None")
+
+        try:
+            _, payload, _, _ = self._split_token(token)
+        except ValueError as e:
+            raise InvalidTokenError("Invalid token format", e)
+
+        exp_timestamp = payload.get("exp")
+
+        if not exp_timestamp:
+            raise TokenVerificationError("Token doesn't contain expiration information")
+
+        return datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
+
+    def _create_token(
+        self,
+        data: dict[str, Any],
+        secret_key: bytes,
+        expire_minutes: int,
+        token_type: str
+    ) -> str:
+        try:
+            to_encode = data.copy()
+            issued_at = datetime.now(timezone.utc)
+            expires_at = issued_at + timedelta(minutes=expire_minutes)
+            to_encode.update({"exp": expires_at, "iat": issued_at, "type": token_type})
+
+            for time_claim in ("exp", "iat", "nbf"):
+                if isinstance(to_encode.get(time_claim), datetime):
+                    to_encode[time_claim] = int(to_encode[time_claim].timestamp())
+
+            signing_input = self._encoded_header + b"." + _b64url_encode(_json_encode(to_encode))
+        except Exception as e:
+            raise TokenCreationError(f"Failed to create {token_type} token: {str(e)}", e)
+
+        signature = hmac.new(secret_key, signing_input, self._digest).digest()
+
+        return (signing_input + b"." + _b64url_encode(signature)).decode()
+
+    def _decode_token(self, token: str, secret_key: bytes, token_type: str) -> dict[str, Any]:
+        try:
+            header, payload, signing_input, signature = self._split_token(token)
+        except ValueError as e:
+            raise InvalidTokenError("Invalid token format", e)
+
+        if header.get("alg") != self._algorithm:
+            raise InvalidTokenError("Invalid token format")
+
+        expected_signature = hmac.new(secret_key, signing_input, self._digest).digest()
+
+        if not hmac.compare_digest(signature, expected_signature):
+            raise TokenSignatureError("Invalid token signature")
+
+        self._validate_claims(payload, token_type)
+
+        if payload.get("type") != token_type:
+            raise InvalidTokenTypeError(f"Token type must be '{token_type}'")
+
+        return payload
+
+    @staticmethod
+    def _split_token(token: str) -> tuple[dict[str, Any], dict[str, Any], bytes, bytes]:
+        """Split a token into its header, payload, signing input and signature (unverified)."""
+        try:
+            signing_input, encoded_signature = token.encode().rsplit(b".", 1)
+            encoded_header, encoded_payload = signing_input.split(b".", 1)
+            header = json.loads(_b64url_decode(encoded_header))
+            payload = json.loads(_b64url_decode(encoded_payload))
+            signature = _b64url_decode(encoded_signature)
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError("Malformed token") from e
+
+        if not isinstance(header, dict) or not isinstance(payload, dict):
+            raise ValueError("Token header and payload must be JSON objects")
+
+        return header, payload, signing_input, signature
+
+    @staticmethod
+    def _validate_claims(payload: dict[str, Any], token_type: str) -> None:
+        """Validate the registered claims the same way python-jose does (no leeway)."""
+        now = int(time.time())
+
+        for time_claim in ("iat", "nbf", "exp"):
+            if time_claim in payload and not isinstance(payload[time_claim], int):
+                raise InvalidTokenError("Invalid token claims")
+
+        if "nbf" in payload and payload["nbf"] > now:
+            raise InvalidTokenError("Invalid token claims")
+
+        if "exp" in payload and payload["exp"] < now:
+            raise ExpiredTokenError(f"{token_type.capitalize()} token has expired")
+
+        # No audience is expected, so a token restricted to one is rejected
+        if "aud" in payload:
+            raise InvalidTokenError("Invalid token claims")
+
+        for string_claim in ("sub", "jti"):
+            if string_claim in payload and not isinstance(payload[string_claim], str):
+                raise InvalidTokenError("Invalid token claims")
@@ -1,5 +1,11 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
+
 from passlib.context import CryptContext
 
+from core.config import settings
+
 
 pwd_context = CryptContext(
     schemes=["bcrypt"],
@@ -7,6 +13,13 @@ pwd_context = CryptContext(
     deprecated="auto"
 )
 
+# Bounded pool for bcrypt, which releases the GIL while hashing: calls beyond its size queue here
+# instead of blocking the event loop
+_password_executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+    thread_name_prefix="password-hashing"
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -26,3 +39,25 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     match, and False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a plain-text password in the password hashing pool, without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain-text password in the password hashing pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor,
+        verify_password,
+        plain_password,
+        hashed_password
+    )
+
+
+def shutdown_password_executor() -> None:
+    """Shut the password hashing pool down (on application shutdown), dropping queued calls."""
+    _password_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,95 @@
+import calendar
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class TokenCacheStats:
+    """
+    Snapshot of a verified token cache's state.
+
+    Attributes:
+        size: Number of cached tokens.
+        hits: Lookups answered from the cache.
+        misses: Lookups that required a full decode (absent or expired tokens).
+    """
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified (decoded and validated) token payloads.
+
+    Entries are keyed by the SHA-256 digest of the token and held until the token's `exp`. Expiry is
+    enforced the same way `python-jose` does it (whole seconds, no leeway), so a cached token is
+    served exactly as long as a full decode would accept it.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], int]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    @staticmethod
+    def _get_now() -> int:
+        return calendar.timegm(datetime.now(tz=timezone.utc).utctimetuple())
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Returns the cached payload of the token, or `None` if absent or expired."""
+        key = self._get_key(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            payload, expires_at = entry
+
+            if expires_at < self._get_now():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        """Stores the verified payload until the token's `exp` (skips tokens without `exp`)."""
+        expires_at = payload.get("exp")
+
+        if not isinstance(expires_at, int) or self._max_size <= 0:
+            return
+
+        key = self._get_key(token)
+
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> TokenCacheStats:
+        with self._lock:
+            return TokenCacheStats(size=len(self._entries), hits=self._hits, misses=self._misses)
@@ -10,6 +10,7 @@ from core.security.exceptions import (
     InvalidTokenError,
     InvalidTokenTypeError,
     TokenCreationError,
+    TokenError,
     TokenSignatureError,
     TokenVerificationError
 )
@@ -85,6 +86,8 @@ class JWTManager(JWTManagerInterface):
             raise InvalidTokenError("Invalid token claims", e)
         except JWTError as e:
             raise InvalidTokenError("Invalid token format", e)
+        except TokenError:
+            raise
         except Exception as e:
             raise TokenVerificationError(f"Failed to verify access token: {str(e)}", e)
 
@@ -108,6 +111,8 @@ class JWTManager(JWTManagerInterface):
             raise InvalidTokenError("Invalid token claims", e)
         except JWTError as e:
             raise InvalidTokenError("Invalid token format", e)
+        except TokenError:
+            raise
         except Exception as e:
             raise TokenVerificationError(f"Failed to verify refresh token: {str(e)}", e)
 
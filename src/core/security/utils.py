@@ -1,6 +1,12 @@
+import hashlib
 import secrets
 
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate a secure random token."""
     return secrets.token_urlsafe(length)
+
+
+def hash_token(token: str) -> bytes:
+    """Return the SHA-256 digest of a token (stored and looked up instead of the token)."""
+    return hashlib.sha256(token.encode()).digest()
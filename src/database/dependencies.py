@@ -1,19 +1,30 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Final
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.session import async_postgresql_session_factory
 
 
-async def get_postgresql_db_session() -> AsyncGenerator[AsyncSession, None]:
+# Requests served by read-only service methods (`get_*`, `get_*_paginated`)
+_READ_ONLY_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_postgresql_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Yield a new asynchronous database session.
 
-    Used as a FastAPI dependency to inject an AsyncSession into request handlers. The session is
-    automatically closed when the request is completed.
+    Used as a FastAPI dependency to inject an AsyncSession into request handlers. Reads of read-only
+    requests go to the read replica (if configured), unless the user committed a write within the
+    read-your-writes window; everything else goes to the primary. The session is automatically
+    closed when the request is completed.
     """
     async with async_postgresql_session_factory() as session:
+        session.sync_session.configure_routing(
+            read_only=request.method in _READ_ONLY_METHODS,
+            read_your_writes_key=getattr(request.state, "user_id", None)
+        )
         yield session
 
 
@@ -0,0 +1,38 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.metrics import MetricsRegistry
+from database.pool import get_pool_stats
+
+
+def register_pool_metrics(registry: MetricsRegistry, engines: dict[str, AsyncEngine]) -> None:
+    """Expose the connection pool stats of the engines (labelled by the keys of `engines`)."""
+    size = registry.gauge("db_pool_size", "Configured number of persistent connections.", ("pool",))
+    checked_in = registry.gauge("db_pool_checked_in", "Idle connections in the pool.", ("pool",))
+    checked_out = registry.gauge("db_pool_checked_out", "Connections in use.", ("pool",))
+    overflow = registry.gauge("db_pool_overflow", "Connections opened beyond the size.", ("pool",))
+    timeouts = registry.counter(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts that gave up after the pool timeout.",
+        ("pool",)
+    )
+    average_wait = registry.gauge(
+        "db_pool_checkout_average_wait_seconds",
+        "Average time spent acquiring a connection (since process start).",
+        ("pool",)
+    )
+
+    def collect() -> None:
+        for name, engine in engines.items():
+            stats = get_pool_stats(engine)
+
+            if stats is None:
+                continue
+
+            size.set(stats.size, (name,))
+            checked_in.set(stats.checked_in, (name,))
+            checked_out.set(stats.checked_out, (name,))
+            overflow.set(stats.overflow, (name,))
+            timeouts.inc_to_total(stats.timeouts, (name,))
+            average_wait.set(stats.average_wait_seconds, (name,))
+
+    registry.add_collect_hook(collect)
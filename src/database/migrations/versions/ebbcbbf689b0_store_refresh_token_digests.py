@@ -0,0 +1,57 @@
+"""
+Store SHA-256 digests of refresh tokens instead of the tokens, index their expiry
+
+Revision ID: ebbcbbf689b0
+Revises: 3c9d5e1a7b42
+Create Date: 2026-10-16 22:41:07.503912
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ebbcbbf689b0'
+down_revision: Union[str, Sequence[str], None] = '3c9d5e1a7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Expired tokens are useless, drop them instead of hashing them
+    op.execute("DELETE FROM refresh_tokens WHERE expires_at < now()")
+
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True)
+    )
+    op.execute("UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+    op.create_unique_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', ['token_hash'])
+
+    op.drop_constraint('refresh_tokens_token_key', 'refresh_tokens', type_='unique')
+    op.drop_column('refresh_tokens', 'token')
+
+    op.create_index(
+        op.f('ix_refresh_tokens_expires_at'),
+        'refresh_tokens',
+        ['expires_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+
+    # Tokens cannot be recovered from their digests, so all sessions end (users must log in again)
+    op.execute("DELETE FROM refresh_tokens")
+
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(length=512), nullable=False))
+    op.create_unique_constraint('refresh_tokens_token_key', 'refresh_tokens', ['token'])
+
+    op.drop_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', type_='unique')
+    op.drop_column('refresh_tokens', 'token_hash')
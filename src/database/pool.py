@@ -0,0 +1,88 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass(slots=True, frozen=True)
+class PoolStats:
+    """
+    Snapshot of a connection pool's state.
+
+    Attributes:
+        size: The configured number of persistent connections.
+        checked_in: Idle connections currently held in the pool.
+        checked_out: Connections currently in use.
+        overflow: Connections opened beyond `size` (negative while the pool is not yet filled).
+        checkouts: Total number of successful checkouts.
+        timeouts: Total number of checkouts that gave up after the pool timeout.
+        total_wait_seconds: Total time spent acquiring connections (including connecting and
+        pre-ping).
+        max_wait_seconds: The longest single acquisition.
+    """
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that records how long checkouts wait and how often they time out."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset_stats()
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started_at
+        self._checkouts += 1
+        self._total_wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+        return connection
+
+    def get_stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            total_wait_seconds=self._total_wait_seconds,
+            max_wait_seconds=self._max_wait_seconds
+        )
+
+    def _reset_stats(self) -> None:
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    """Returns live statistics of the engine's pool, or `None` if the pool is not instrumented."""
+    pool = engine.pool
+
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return None
+
+    return pool.get_stats()
@@ -0,0 +1,116 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class ReadYourWritesTracker:
+    """
+    Bounded in-process record of when each user last committed a write.
+
+    For `window_seconds` after a commit the user's reads stay on the primary, so a replica that lags
+    behind cannot hide their own changes from them.
+
+    The record is per worker process: with several workers, a user's next request may be served by
+    a worker that did not see the write and read from the replica (a warning is logged at startup).
+    """
+
+    def __init__(self, window_seconds: float, max_size: int = 10_000):
+        self._window_seconds = window_seconds
+        self._max_size = max_size
+        self._deadlines: OrderedDict[Hashable, float] = OrderedDict()
+        self._lock = Lock()
+
+    def mark_write(self, key: Hashable) -> None:
+        """Starts (or extends) the primary-only window for the given key."""
+        with self._lock:
+            self._deadlines[key] = time.monotonic() + self._window_seconds
+            self._deadlines.move_to_end(key)
+
+            while len(self._deadlines) > self._max_size:
+                self._deadlines.popitem(last=False)
+
+    def requires_primary(self, key: Hashable) -> bool:
+        """Whether reads for the given key must still go to the primary."""
+        with self._lock:
+            deadline = self._deadlines.get(key)
+
+            if deadline is None:
+                return False
+
+            if deadline <= time.monotonic():
+                del self._deadlines[key]
+                return False
+
+            return True
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to an optional read replica and everything else to the primary.
+
+    Reads go to the replica only once `configure_routing()` marked the session as read-only.
+    Flushes and `INSERT`/`UPDATE`/`DELETE` statements always go to the primary, and once the session
+    has written, all its following statements stay there (e.g., the reload that follows a commit).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_bind: Engine | None = None,
+        read_your_writes_tracker: ReadYourWritesTracker | None = None,
+        **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.read_your_writes_tracker = read_your_writes_tracker
+        self.read_your_writes_key: Hashable | None = None
+        self.prefers_replica = False
+        self.has_written = False
+
+    def configure_routing(
+        self,
+        read_only: bool,
+        read_your_writes_key: Hashable | None = None
+    ) -> None:
+        """
+        Configures where the session's reads go.
+
+        Args:
+            read_only: Whether reads may go to the replica (if one is configured).
+            read_your_writes_key: Identifies the caller (e.g., the user ID). A commit that wrote
+                starts the caller's read-your-writes window, within which reads stay on the primary.
+        """
+        self.read_your_writes_key = read_your_writes_key
+        self.prefers_replica = (
+            read_only
+            and self.replica_bind is not None
+            and not (
+                read_your_writes_key is not None
+                and self.read_your_writes_tracker is not None
+                and self.read_your_writes_tracker.requires_primary(read_your_writes_key)
+            )
+        )
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs) -> Engine:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.has_written = True
+
+        if self.prefers_replica and not self.has_written:
+            return self.replica_bind
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def commit(self) -> None:
+        super().commit()
+
+        if (
+            self.has_written
+            and self.read_your_writes_key is not None
+            and self.read_your_writes_tracker is not None
+        ):
+            self.read_your_writes_tracker.mark_write(self.read_your_writes_key)
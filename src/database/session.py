@@ -1,17 +1,79 @@
+from typing import Any
+from uuid import uuid4
+
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
 
 from core.config import settings
+from core.metrics import instrument_query_stats
+from database.pool import InstrumentedAsyncAdaptedQueuePool
+from database.routing import ReadYourWritesTracker, RoutingSession
+
+
+def _get_asyncpg_connect_args() -> dict[str, Any]:
+    """Build asyncpg connection arguments configuring its statement caches."""
+    if settings.POSTGRES_PGBOUNCER_TRANSACTION_MODE:
+        # A pooled server connection may differ between transactions, so statements must neither be
+        # cached nor reuse names
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+        }
+
+    return {
+        "statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE
+    }
+
+
+def create_async_postgresql_engine(url: str) -> AsyncEngine:
+    """
+    Create an async engine with the configured, instrumented connection pool (recording the executed
+    queries in the request's query stats).
+    """
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        connect_args=_get_asyncpg_connect_args()
+    )
+    instrument_query_stats(engine.sync_engine)
+
+    return engine
 
 
 # Synchronous engine for Alembic and migrations
 sync_postgresql_engine = create_engine(settings.SYNC_POSTGRES_DATABASE_URL, echo=False)
 
-# Asynchronous database engine and session factory
-async_postgresql_engine = create_async_engine(settings.ASYNC_POSTGRES_DATABASE_URL, echo=False)
+# Asynchronous database engine, optional read replica engine and session factory
+async_postgresql_engine = create_async_postgresql_engine(settings.ASYNC_POSTGRES_DATABASE_URL)
+async_postgresql_replica_engine = (
+    create_async_postgresql_engine(settings.ASYNC_POSTGRES_REPLICA_DATABASE_URL)
+    if settings.ASYNC_POSTGRES_REPLICA_DATABASE_URL
+    else None
+)
+read_your_writes_tracker = ReadYourWritesTracker(
+    window_seconds=settings.POSTGRES_REPLICA_READ_YOUR_WRITES_SECONDS
+)
 async_postgresql_session_factory = async_sessionmaker(
     bind=async_postgresql_engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=(
+        async_postgresql_replica_engine.sync_engine if async_postgresql_replica_engine else None
+    ),
+    read_your_writes_tracker=read_your_writes_tracker,
     autocommit=False,
     autoflush=False,
     expire_on_commit=False
@@ -1,5 +1,7 @@
 from functools import wraps
 
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship as sqlalchemy_relationship
 
 
@@ -16,3 +18,21 @@ def safe_relationship(*args, **kwargs):
     kwargs.setdefault("lazy", "raise_on_sql")
 
     return sqlalchemy_relationship(*args, **kwargs)
+
+
+class Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` wrapper for a SQLAlchemy statement.
+
+    Compiles the wrapped statement with the same bound parameters, so it can be executed like any
+    other statement: `await session.execute(Explain(stmt))`.
+    """
+    inherit_cache = False
+
+    def __init__(self, statement: Executable):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
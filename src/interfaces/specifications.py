@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Sequence
 
 from sqlalchemy import Select
 
 
+if TYPE_CHECKING:
+    from specifications.ordering import OrderingKey
+    from core.pagination import CountStrategy
+
+
 class SpecificationInterface(ABC):
     """Interface for a specification that can be applied to a SQLAlchemy query."""
 
@@ -27,6 +33,37 @@ class PaginationSpecificationInterface(SpecificationInterface):
         """Returns the calculated offset (rows to skip)."""
         ...
 
+    @property
+    @abstractmethod
+    def count_strategy(self) -> "CountStrategy":
+        """Returns the strategy used to produce the total items count."""
+        ...
+
+
+class CursorPaginationSpecificationInterface(ABC):
+    """Interface for a keyset (cursor) pagination specification that can be applied to a query."""
+
+    @property
+    @abstractmethod
+    def limit(self) -> int:
+        """Returns the requested page size."""
+        ...
+
+    @abstractmethod
+    def apply(self, stmt: Select, ordering_keys: Sequence["OrderingKey"]) -> Select:
+        """Applies the keyset predicate, `ORDER BY` and `LIMIT` for the given ordering keys."""
+        ...
+
+    @abstractmethod
+    def build_page(
+        self,
+        items: list[Any],
+        key_values: list[tuple[Any, ...]],
+        ordering_keys: Sequence["OrderingKey"]
+    ) -> Any:
+        """Builds a page (items and boundary cursors) from the rows fetched by the query."""
+        ...
+
 
 class OrderingSpecificationInterface(SpecificationInterface):
     """Interface for an ordering specification that can be applied to a query."""
@@ -37,6 +74,18 @@ class OrderingSpecificationInterface(SpecificationInterface):
         """Returns ORM models required for joins."""
         ...
 
+    @property
+    @abstractmethod
+    def referenced_entities(self) -> frozenset[type]:
+        """Returns ORM models referenced by the built clauses (a subset of the join paths)."""
+        ...
+
+    @property
+    @abstractmethod
+    def ordering_keys(self) -> tuple["OrderingKey", ...]:
+        """Returns the resolved ordering keys in the order they are applied."""
+        ...
+
     @property
     @abstractmethod
     def allowed_fields(self) -> list[str]:
@@ -59,6 +108,12 @@ class FilterSpecificationInterface(SpecificationInterface):
         """Get list of join paths."""
         ...
 
+    @property
+    @abstractmethod
+    def referenced_entities(self) -> frozenset[type]:
+        """Returns ORM models referenced by the built clauses (a subset of the join paths)."""
+        ...
+
     @property
     @abstractmethod
     def is_empty(self) -> bool:
@@ -75,6 +130,12 @@ class SearchSpecificationInterface(SpecificationInterface):
         """Returns ORM models required for joins."""
         ...
 
+    @property
+    @abstractmethod
+    def referenced_entities(self) -> frozenset[type]:
+        """Returns ORM models referenced by the built clauses (a subset of the join paths)."""
+        ...
+
     @property
     @abstractmethod
     def query(self) -> str | None:
@@ -1,18 +1,36 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from apps.identity.api import router as identity_app_router
+from apps.identity.cache import user_data_cache
+from apps.identity.metrics import register_user_data_cache_metrics
+from apps.identity.permission_registry import permission_registry
+from apps.identity.repositories import PermissionRepository
+from apps.identity.tasks import run_refresh_token_purge
 from apps.soil_laboratory.api import router as soil_laboratory_app_router
 from core.config import settings
-from core.logging_config import logger
+from core.logging import get_batching_writer
+from core.logging.tasks import log_suppressed_request_logs, run_suppressed_request_logs_summary
+from core.logging_config import logger, request_log_sampler, shutdown_logging
+from core.metrics.api import router as metrics_router
+from core.metrics.collectors import register_log_sink_metrics, register_token_cache_metrics
+from core.metrics.dependencies import http_metrics, metrics_registry
+from core.metrics.tasks import run_metrics_snapshot_writer
 from core.middleware import (
     ErrorHandlingMiddleware,
+    GZipMiddleware,
     JWTAuthenticationMiddleware,
+    MetricsMiddleware,
     RequestLoggingMiddleware
 )
-from core.security.dependencies import get_jwt_manager
+from core.security.dependencies import get_jwt_manager, verified_token_cache
+from core.security.passwords import shutdown_password_executor
+from database.dependencies import get_postgresql_db_contextmanager
+from database.metrics import register_pool_metrics
+from database.session import async_postgresql_engine, async_postgresql_replica_engine
 from schemas.utils import resolve_schemas_forward_refs
 
 
@@ -25,12 +43,95 @@ async def lifespan(app: FastAPI):
     # Rebuild Schemas
     resolve_schemas_forward_refs("src/apps")
 
+    if async_postgresql_replica_engine and settings.WEB_CONCURRENCY > 1:
+        logger.warning(
+            "Read-your-writes windows are tracked per worker process, so with several workers a "
+            "user may not see their own writes until the read replica catches up",
+            workers=settings.WEB_CONCURRENCY
+        )
+
+    if settings.USER_DATA_CACHE_BACKEND == "memory" and settings.WEB_CONCURRENCY > 1:
+        logger.warning(
+            "The user data cache is per worker process, so with several workers users' and roles' "
+            "changes reach the other workers only when their cache entries expire",
+            workers=settings.WEB_CONCURRENCY,
+            ttl_seconds=settings.USER_DATA_CACHE_TTL_SECONDS
+        )
+
+    # Compile permission codes into bits for permission checks
+    async with get_postgresql_db_contextmanager() as db:
+        permission_registry.rebuild(await PermissionRepository(db).get_active_codes())
+
+    # Delete expired refresh tokens in the background
+    refresh_token_purge_task = (
+        asyncio.create_task(
+            run_refresh_token_purge(
+                settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+                settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+            )
+        )
+        if settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS > 0
+        else None
+    )
+
+    # Share this worker's metrics with the other workers (multiprocess mode)
+    metrics_snapshot_task = (
+        asyncio.create_task(
+            run_metrics_snapshot_writer(
+                metrics_registry,
+                settings.METRICS_SNAPSHOT_INTERVAL_SECONDS
+            )
+        )
+        if settings.METRICS_ENABLED and settings.METRICS_MULTIPROCESS_DIR
+        else None
+    )
+
+    # Summarize the suppressed request logs, even when no request comes to trigger it
+    suppressed_request_logs_task = (
+        asyncio.create_task(
+            run_suppressed_request_logs_summary(
+                request_log_sampler,
+                logger,
+                settings.LOG_REQUEST_SUPPRESSED_SUMMARY_INTERVAL_SECONDS
+            )
+        )
+        if settings.LOG_REQUEST_SUPPRESSED_SUMMARY_INTERVAL_SECONDS > 0
+        else None
+    )
+
     yield
 
     # Shutdown
     # logger.info("Application shutdown: cleaning up resources...")
+    shutdown_password_executor()
+
+    if refresh_token_purge_task:
+        refresh_token_purge_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await refresh_token_purge_task
+
+    if metrics_snapshot_task:
+        metrics_snapshot_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await metrics_snapshot_task
+
+        # Keep this worker's counters and histograms after it stops
+        metrics_registry.write_snapshot(live=False)
+
+    if suppressed_request_logs_task:
+        suppressed_request_logs_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await suppressed_request_logs_task
+
+    # Don't lose the lines suppressed since the last summary
+    log_suppressed_request_logs(request_log_sampler, logger)
+
     # ...
     # logger.info("Application shutdown complete")
+    shutdown_logging()
 
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
@@ -39,9 +140,29 @@ app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 # The first middleware added becomes the **innermost** in the actual execution chain.
 # So logging should go around error handling to ensure request is properly logged.
 
-app.add_middleware(JWTAuthenticationMiddleware, jwt_manager=get_jwt_manager())
+app.add_middleware(
+    JWTAuthenticationMiddleware,
+    jwt_manager=get_jwt_manager(),
+    token_cache=verified_token_cache
+)
 app.add_middleware(ErrorHandlingMiddleware, logger=logger)
-app.add_middleware(RequestLoggingMiddleware, logger=logger)  # Outermost middleware
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=http_metrics)
+
+app.add_middleware(
+    RequestLoggingMiddleware,
+    logger=logger,
+    sampler=request_log_sampler
+)
+
+if settings.GZIP_ENABLED:
+    app.add_middleware(  # Outermost middleware
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compression_level=settings.GZIP_COMPRESSION_LEVEL,
+        content_types=settings.GZIP_CONTENT_TYPES
+    )
 
 # TODO: Remove this:
 app.add_middleware(
@@ -54,3 +175,18 @@ app.add_middleware(
 
 app.include_router(identity_app_router)
 app.include_router(soil_laboratory_app_router)
+
+if settings.METRICS_ENABLED:
+    pool_engines = {"primary": async_postgresql_engine}
+
+    if async_postgresql_replica_engine:
+        pool_engines["replica"] = async_postgresql_replica_engine
+
+    register_pool_metrics(metrics_registry, pool_engines)
+    register_token_cache_metrics(metrics_registry, verified_token_cache)
+    register_user_data_cache_metrics(metrics_registry, user_data_cache)
+
+    if batching_writer := get_batching_writer():
+        register_log_sink_metrics(metrics_registry, batching_writer)
+
+    app.include_router(metrics_router)
@@ -1,26 +1,53 @@
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Generic, Protocol, Type, TypeVar, runtime_checkable
-from uuid import UUID
-
-from sqlalchemy import BinaryExpression, BooleanClauseList, Select, and_, exists, func, select
+from typing import Any, Generic, Protocol, Type, TypeVar, runtime_checkable
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    BinaryExpression,
+    BooleanClauseList,
+    ColumnElement,
+    Delete,
+    Row,
+    Select,
+    Update,
+    and_,
+    column as column_clause,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    table as sa_table,
+    text,
+    update
+)
+from sqlalchemy.dialects.postgresql import Insert as PgInsert, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute, Load
 
 from core import context
 from core.config import settings
-from database.models import BaseORM
+from core.pagination import CountStrategy
+from database.models import AuditMixin, BaseORM, OptimisticLockingMixin
+from database.utils import Explain
 from dto import CreateDTOBase, UpdateDTOBase
 from interfaces.specifications import (
+    CursorPaginationSpecificationInterface,
     FilterSpecificationInterface,
     OrderingSpecificationInterface,
     PaginationSpecificationInterface,
     SearchSpecificationInterface
 )
+from repositories.count_cache import count_cache, mark_tables_written
+from repositories.join_planner import plan_join_paths, unique_join_paths
+from specifications.ordering import OrderingKey
+from specifications.pagination import CursorPage, OffsetPage
 
 
 ModelT = TypeVar("ModelT", bound=BaseORM)
 LoadOptionsT = TypeVar("LoadOptionsT", bound=Enum)
+ProjectionT = TypeVar("ProjectionT", bound=Enum)
+StmtT = TypeVar("StmtT", Select, Delete)
 
 
 @runtime_checkable
@@ -38,11 +65,34 @@ class IsBaseRepository(Protocol[ModelT]):
 
     def _apply_load_options(
         self,
-        stmt: Select,
+        stmt: StmtT,
         include: list[LoadOptionsT] | None = None
+    ) -> StmtT:
+        pass
+
+    def _build_filtered_stmt(
+        self,
+        stmt: Select,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        ordering_spec: OrderingSpecificationInterface | None = None
     ) -> Select:
         pass
 
+    def _plan_join_paths(
+        self,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        ordering_spec: OrderingSpecificationInterface | None = None
+    ) -> tuple[type, ...]:
+        pass
+
+    def _build_filter_condition(
+        self,
+        filter_spec: FilterSpecificationInterface
+    ) -> ColumnElement[bool]:
+        pass
+
 
 class BaseRepository(Generic[ModelT, LoadOptionsT]):
     _LOAD_OPTIONS_MAP: dict[LoadOptionsT, Load] = {}
@@ -53,9 +103,9 @@ class BaseRepository(Generic[ModelT, LoadOptionsT]):
 
     def _apply_load_options(
         self,
-        stmt: Select,
+        stmt: StmtT,
         include: list[LoadOptionsT] | None = None
-    ) -> Select:
+    ) -> StmtT:
         """Apply SQLAlchemy load options (e.g. joinedload, selectinload) to the statement."""
         if not include or not self._LOAD_OPTIONS_MAP:
             return stmt
@@ -65,6 +115,79 @@ class BaseRepository(Generic[ModelT, LoadOptionsT]):
 
         return stmt
 
+    def _build_filtered_stmt(
+        self,
+        stmt: Select,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        ordering_spec: OrderingSpecificationInterface | None = None
+    ) -> Select:
+        """
+        Apply filter and search specifications to the statement and perform required JOINs.
+
+        Args:
+            stmt: The base SQLAlchemy Select statement.
+            filter_spec: Optional filter specification.
+            search_spec: Optional search specification.
+            ordering_spec: Optional ordering specification. Its clauses are not applied here (the
+            caller decides where `ORDER BY` goes), only its JOINs are performed.
+        """
+        join_paths = self._plan_join_paths(filter_spec, search_spec, ordering_spec)
+
+        if filter_spec and not filter_spec.is_empty:
+            stmt = filter_spec.apply(stmt)
+
+        if search_spec and not search_spec.is_empty:
+            stmt = search_spec.apply(stmt)
+
+        # Perform JOINs. Required to filter, search and order by nested objects' fields
+        for path in join_paths:
+            stmt = stmt.join(path)
+
+        return stmt
+
+    def _plan_join_paths(
+        self,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        ordering_spec: OrderingSpecificationInterface | None = None
+    ) -> tuple[type, ...]:
+        """
+        Collect the join paths of the active specifications, keeping only those referenced by
+        their built clauses (see `plan_join_paths`).
+        """
+        active_specs = []
+
+        if filter_spec and not filter_spec.is_empty:
+            active_specs.append(filter_spec)
+
+        if search_spec and not search_spec.is_empty:
+            active_specs.append(search_spec)
+
+        if ordering_spec and ordering_spec.is_applicable:
+            active_specs.append(ordering_spec)
+
+        join_paths = unique_join_paths(*(spec.join_paths for spec in active_specs))
+        referenced_entities = frozenset().union(
+            *(spec.referenced_entities for spec in active_specs)
+        )
+
+        return plan_join_paths(self.model, join_paths, referenced_entities)
+
+    def _build_filter_condition(
+        self,
+        filter_spec: FilterSpecificationInterface
+    ) -> ColumnElement[bool]:
+        """
+        Build a `WHERE` condition matching the rows selected by the filter specification.
+
+        The filter is applied to an `id` subquery, so specifications requiring JOINs can be used
+        in `UPDATE`/`DELETE` statements as well.
+        """
+        model_id_field: InstrumentedAttribute = self.model.id
+
+        return model_id_field.in_(self._build_filtered_stmt(select(model_id_field), filter_spec))
+
 
 class ExistsMixin(Generic[ModelT]):
     async def exists_by_id(self: IsBaseRepository[ModelT], obj_id: UUID) -> bool:
@@ -115,32 +238,59 @@ class ReadPaginatedMixin(Generic[ModelT, LoadOptionsT]):
     optionally including loader options (`LoadOptionsT`) such as joinedload or selectinload.
 
     Should be combined with a CRUD base class providing `self.model` and `self.db`.
+
+    Repositories may opt in to deferred-join pagination by setting `_DEFERRED_JOIN_PAGINATION`.
+    Offset pages are then fetched in two phases: a narrow query selects only the ordered IDs of the
+    page (so the database sorts and skips `(id, sort key)` tuples instead of full joined rows), and
+    a second query hydrates those IDs with the requested load options, preserving their order.
     """
+    _DEFERRED_JOIN_PAGINATION: bool = False
 
     async def get_count(
         self: IsBaseRepository[ModelT],
         filter_spec: FilterSpecificationInterface | None = None,
         search_spec: SearchSpecificationInterface | None = None
     ) -> int:
-        stmt = select(func.count(self.model.id))
-        join_paths = []
+        stmt = self._build_filtered_stmt(
+            select(func.count(self.model.id)),
+            filter_spec,
+            search_spec
+        )
+        result = await self.db.execute(stmt)
 
-        if filter_spec and not filter_spec.is_empty:
-            join_paths.extend(filter_spec.join_paths or [])
-            stmt = filter_spec.apply(stmt)
+        return result.scalar_one()
 
-        if search_spec and not search_spec.is_empty:
-            join_paths.extend(search_spec.join_paths or [])
-            stmt = search_spec.apply(stmt)
+    async def get_estimated_count(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None
+    ) -> int:
+        """
+        Estimate the number of matching rows without counting them.
 
-        # Perform JOINs. Required to search by nested objects' fields
-        unique_join_paths = list(dict.fromkeys(join_paths))
-        for path in unique_join_paths:
-            stmt = stmt.join(path)
+        An unfiltered query uses `pg_class.reltuples` of the model's table directly; otherwise (or
+        if the table was never analyzed) the planner's row estimate is taken from `EXPLAIN`.
+        """
+        is_unfiltered = (
+            (not filter_spec or filter_spec.is_empty)
+            and (not search_spec or search_spec.is_empty)
+        )
+
+        if is_unfiltered:
+            result = await self.db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+                {"name": self.model.__tablename__}
+            )
+            reltuples = result.scalar_one_or_none()
 
-        result = await self.db.execute(stmt)
+            if reltuples is not None and reltuples >= 0:
+                return reltuples
 
-        return result.scalar_one()
+        stmt = self._build_filtered_stmt(select(self.model.id), filter_spec, search_spec)
+        result = await self.db.execute(Explain(stmt))
+        plan = result.scalar_one()
+
+        return int(plan[0]["Plan"]["Plan Rows"])
 
     async def get_all_paginated(
         self: IsBaseRepository[ModelT],
@@ -150,33 +300,226 @@ class ReadPaginatedMixin(Generic[ModelT, LoadOptionsT]):
         search_spec: SearchSpecificationInterface | None = None,
         include: list[LoadOptionsT] | None = None
     ) -> list[ModelT]:
-        stmt = select(self.model)
-        join_paths = []
+        is_deferred = self._DEFERRED_JOIN_PAGINATION
+        stmt = select(self.model.id) if is_deferred else select(self.model)
 
-        if filter_spec and not filter_spec.is_empty:
-            join_paths.extend(filter_spec.join_paths or [])
-            stmt = filter_spec.apply(stmt)
+        if ordering_spec and ordering_spec.is_applicable:
+            stmt = ordering_spec.apply(stmt)
 
-        if search_spec and not search_spec.is_empty:
-            join_paths.extend(search_spec.join_paths or [])
-            stmt = search_spec.apply(stmt)
+        stmt = self._build_filtered_stmt(stmt, filter_spec, search_spec, ordering_spec)
+        stmt = pagination_spec.apply(stmt)
+
+        if is_deferred:
+            result = await self.db.execute(stmt)
+
+            return await self._get_many_by_ids_in_order(list(result.scalars().all()), include)
+
+        stmt = self._apply_load_options(stmt, include)
+        result = await self.db.execute(stmt)
+
+        return list(result.scalars().all())
+
+    async def get_all_paginated_with_count(
+        self: IsBaseRepository[ModelT],
+        pagination_spec: PaginationSpecificationInterface,
+        ordering_spec: OrderingSpecificationInterface | None = None,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        include: list[LoadOptionsT] | None = None
+    ) -> OffsetPage[ModelT]:
+        """
+        Fetch a page of `ModelT` objects together with the total number of matching rows.
+
+        The total is produced according to `pagination_spec.count_strategy`:
+            - EXACT: a `COUNT(*) OVER ()` window in the page query itself, so the filter/search/join
+              plan is executed once instead of twice (`get_count` + `get_all_paginated`). Window
+              functions are evaluated before `LIMIT`/`OFFSET`, so every returned row carries the
+              count of the whole filtered set.
+            - CACHED: the exact count cached per filter signature; a cache miss is counted exactly.
+            - ESTIMATED: the planner estimate; below `COUNT_ESTIMATE_THRESHOLD` it is counted
+              exactly.
+            - NONE: no count at all.
+
+        One extra row is always fetched to determine `has_next` without relying on the count.
+        """
+        is_deferred = self._DEFERRED_JOIN_PAGINATION
+        page = await self._get_offset_page(
+            [self.model.id if is_deferred else self.model],
+            pagination_spec,
+            ordering_spec,
+            filter_spec,
+            search_spec,
+            include=None if is_deferred else include
+        )
+        items = [row[0] for row in page.items]
+
+        if is_deferred:
+            items = await self._get_many_by_ids_in_order(items, include)
+
+        return OffsetPage(items, page.total_items, page.has_next, page.count_strategy)
+
+    async def _get_offset_page(
+        self: IsBaseRepository[ModelT],
+        columns: list[Any],
+        pagination_spec: PaginationSpecificationInterface,
+        ordering_spec: OrderingSpecificationInterface | None = None,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        include: list[LoadOptionsT] | None = None
+    ) -> OffsetPage[Row]:
+        """
+        Fetch a page of rows selecting the given columns, counted according to the pagination's
+        count strategy (see `get_all_paginated_with_count`).
+
+        The returned rows start with the given columns; an exact count, if any, is appended after
+        them.
+        """
+        count_strategy = pagination_spec.count_strategy
+        total_items: int | None = None
+        cache_key: str | None = None
+
+        if count_strategy is CountStrategy.CACHED:
+            cache_key = self._get_count_cache_key(filter_spec, search_spec)
+            total_items = count_cache.get(cache_key)
+        elif count_strategy is CountStrategy.ESTIMATED:
+            estimated_count = await self.get_estimated_count(filter_spec, search_spec)
+
+            if estimated_count >= settings.COUNT_ESTIMATE_THRESHOLD:
+                total_items = estimated_count
+
+        is_counted_exactly = count_strategy is not CountStrategy.NONE and total_items is None
+
+        if is_counted_exactly:
+            stmt = select(*columns, func.count().over().label("total_count"))
+        else:
+            stmt = select(*columns)
 
         if ordering_spec and ordering_spec.is_applicable:
-            join_paths.extend(ordering_spec.join_paths or [])
             stmt = ordering_spec.apply(stmt)
 
-        stmt = pagination_spec.apply(stmt)
+        stmt = self._build_filtered_stmt(stmt, filter_spec, search_spec, ordering_spec)
+        stmt = pagination_spec.apply(stmt).limit(pagination_spec.limit + 1)
+        stmt = self._apply_load_options(stmt, include)
 
-        # Perform JOINs. Required to search by nested objects' fields
-        unique_join_paths = list(dict.fromkeys(join_paths))
-        for path in unique_join_paths:
-            stmt = stmt.join(path)
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        items = rows[:pagination_spec.limit]
+        has_next = len(rows) > pagination_spec.limit
+
+        if not is_counted_exactly:
+            if total_items is not None:
+                # An estimate must never contradict the rows that were actually fetched
+                total_items = max(total_items, pagination_spec.offset + len(rows))
+
+            return OffsetPage(items, total_items, has_next, count_strategy)
+
+        if rows:
+            total_items = rows[0].total_count
+        elif pagination_spec.offset == 0:
+            total_items = 0
+        else:
+            total_items = await self.get_count(filter_spec, search_spec)
+
+        if cache_key is not None:
+            count_tables = self._get_count_tables(filter_spec, search_spec)
+            count_cache.set(cache_key, total_items, count_tables)
+
+        return OffsetPage(items, total_items, has_next, CountStrategy.EXACT)
+
+    async def get_all_cursor_paginated(
+        self: IsBaseRepository[ModelT],
+        cursor_spec: CursorPaginationSpecificationInterface,
+        ordering_spec: OrderingSpecificationInterface | None = None,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None,
+        include: list[LoadOptionsT] | None = None
+    ) -> CursorPage[ModelT]:
+        """
+        Fetch a page of `ModelT` objects using keyset (cursor) pagination.
 
+        The active ordering keys are extended with `id` as a unique tiebreaker, and the key values
+        are selected alongside each entity so that the boundary cursors can be built even when
+        ordering by a joined model's column.
+        """
+        ordering_keys = list(ordering_spec.ordering_keys) if ordering_spec else []
+
+        if not any(key.orm_attribute is self.model.id for key in ordering_keys):
+            # Follow the direction of the last key so that a composite index can be scanned
+            tiebreaker_is_desc = ordering_keys[-1].is_desc if ordering_keys else False
+            ordering_keys.append(OrderingKey("id", self.model.id, tiebreaker_is_desc))
+
+        key_columns = [
+            key.orm_attribute.label(f"_cursor_key_{i}")
+            for i, key in enumerate(ordering_keys)
+        ]
+        stmt = select(self.model, *key_columns)
+        stmt = self._build_filtered_stmt(stmt, filter_spec, search_spec, ordering_spec)
+        stmt = cursor_spec.apply(stmt, ordering_keys)
         stmt = self._apply_load_options(stmt, include)
 
         result = await self.db.execute(stmt)
+        rows = result.all()
 
-        return list(result.scalars().all())
+        return cursor_spec.build_page(
+            items=[row[0] for row in rows],
+            key_values=[tuple(row[1:]) for row in rows],
+            ordering_keys=ordering_keys
+        )
+
+    async def _get_many_by_ids_in_order(
+        self: IsBaseRepository[ModelT],
+        obj_ids: list[UUID],
+        include: list[LoadOptionsT] | None = None
+    ) -> list[ModelT]:
+        """
+        Hydrate the objects with the given IDs (second phase of deferred-join pagination).
+
+        The objects are returned in the order of `obj_ids`; IDs whose rows were deleted since the
+        first phase are skipped.
+        """
+        if not obj_ids:
+            return []
+
+        model_id_field: InstrumentedAttribute = self.model.id
+
+        stmt = select(self.model).where(model_id_field.in_(obj_ids))
+        stmt = self._apply_load_options(stmt, include)
+        result = await self.db.execute(stmt)
+        objs_by_id = {obj.id: obj for obj in result.scalars().all()}
+
+        return [objs_by_id[obj_id] for obj_id in obj_ids if obj_id in objs_by_id]
+
+    def _get_count_cache_key(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None
+    ) -> str:
+        """Build the filter signature of a count: the compiled count query and its parameters."""
+        stmt = self._build_filtered_stmt(
+            select(func.count(self.model.id)),
+            filter_spec,
+            search_spec
+        )
+        compiled = stmt.compile()
+        params = sorted(compiled.params.items(), key=lambda item: item[0])
+
+        return f"{compiled.string}|{params!r}"
+
+    def _get_count_tables(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None
+    ) -> set[str]:
+        """Collect the names of the tables a count depends on (for cache invalidation)."""
+        tables = {self.model.__tablename__}
+        tables.update(
+            table_name
+            for path in self._plan_join_paths(filter_spec, search_spec)
+            if (table_name := getattr(path, "__tablename__", None))
+        )
+
+        return tables
 
     # @staticmethod
     # def _perform_joins(stmt: Select, join_paths: list[type]) -> Select:
@@ -212,6 +555,78 @@ class ReadPaginatedMixin(Generic[ModelT, LoadOptionsT]):
     #     ...
 
 
+class ReadProjectedMixin(Generic[ModelT, ProjectionT]):
+    """
+    Read-only list path returning plain mappings instead of ORM objects.
+
+    Each projection in `_PROJECTIONS_MAP` is a tuple of column expressions (labeled where needed)
+    selecting exactly what a response schema needs. Nested objects and collections are built by
+    the database as JSON through correlated subqueries (see `repositories.projections`). No ORM
+    objects, identity map entries or relationship collections are created, and the mappings can be
+    validated without Pydantic's `from_attributes` path (see `schemas.utils.get_type_adapter`).
+
+    Must be combined with `ReadPaginatedMixin`.
+    """
+    _PROJECTIONS_MAP: dict[ProjectionT, tuple[ColumnElement, ...]] = {}
+
+    async def get_all_projected_paginated_with_count(
+        self: IsBaseRepository[ModelT],
+        projection: ProjectionT,
+        pagination_spec: PaginationSpecificationInterface,
+        ordering_spec: OrderingSpecificationInterface | None = None,
+        filter_spec: FilterSpecificationInterface | None = None,
+        search_spec: SearchSpecificationInterface | None = None
+    ) -> OffsetPage[dict[str, Any]]:
+        """
+        Fetch a page of projected rows (see `get_all_paginated_with_count` for counting).
+
+        With deferred-join pagination, the page's ordered IDs are selected first and only those
+        rows are projected (see `ReadPaginatedMixin`).
+        """
+        columns = self._PROJECTIONS_MAP[projection]
+        is_deferred = self._DEFERRED_JOIN_PAGINATION
+        page = await self._get_offset_page(
+            [self.model.id] if is_deferred else list(columns),
+            pagination_spec,
+            ordering_spec,
+            filter_spec,
+            search_spec
+        )
+
+        if is_deferred:
+            items = await self._get_many_projected_by_ids_in_order(
+                columns,
+                [row[0] for row in page.items]
+            )
+        else:
+            # `zip` stops at the projection's columns, dropping the trailing count column (if any)
+            keys = [column.key for column in columns]
+            items = [dict(zip(keys, row)) for row in page.items]
+
+        return OffsetPage(items, page.total_items, page.has_next, page.count_strategy)
+
+    async def _get_many_projected_by_ids_in_order(
+        self: IsBaseRepository[ModelT],
+        columns: tuple[ColumnElement, ...],
+        obj_ids: list[UUID]
+    ) -> list[dict[str, Any]]:
+        """
+        Project the rows with the given IDs (second phase of deferred-join pagination), in the order
+        of `obj_ids`; IDs whose rows were deleted since the first phase are skipped.
+        """
+        if not obj_ids:
+            return []
+
+        model_id_field: InstrumentedAttribute = self.model.id
+
+        stmt = select(*columns, model_id_field.label("_deferred_id"))
+        result = await self.db.execute(stmt.where(model_id_field.in_(obj_ids)))
+        keys = [column.key for column in columns]
+        items_by_id = {row._deferred_id: dict(zip(keys, row)) for row in result.all()}
+
+        return [items_by_id[obj_id] for obj_id in obj_ids if obj_id in items_by_id]
+
+
 class ReadByIdMixin(Generic[ModelT, LoadOptionsT]):
     async def get_by_id(
         self: IsBaseRepository[ModelT],
@@ -250,84 +665,391 @@ class CreateMixin(Generic[ModelT]):
         return obj
 
 
+class BulkCreateMixin(Generic[ModelT]):
+    """
+    Set-based creation of many `ModelT` rows without instantiating ORM objects.
+
+    Batches smaller than `_BULK_COPY_THRESHOLD` are sent as multi-row `INSERT ... RETURNING`
+    statements (SQLAlchemy "insertmanyvalues"); larger batches are streamed through asyncpg's binary
+    `COPY` protocol on the session's own connection, so they take part in the same transaction.
+
+    ORM `before_insert` listeners do not run for these statements, so the `AuditMixin` fields are
+    populated here from the current user in context.
+    """
+    _BULK_COPY_THRESHOLD: int = 1000
+
+    async def bulk_create(
+        self: IsBaseRepository[ModelT],
+        objs_data: list[CreateDTOBase]
+    ) -> list[UUID]:
+        """Insert all objects and return their IDs in input order."""
+        if not objs_data:
+            return []
+
+        rows = self._prepare_bulk_rows(objs_data)
+
+        if len(rows) >= self._BULK_COPY_THRESHOLD:
+            await self._copy_rows(self.model.__tablename__, rows)
+
+            return [row["id"] for row in rows]
+
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        result = await self.db.execute(stmt, rows)
+
+        return list(result.scalars().all())
+
+    async def bulk_upsert(
+        self: IsBaseRepository[ModelT],
+        objs_data: list[CreateDTOBase],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None
+    ) -> list[UUID]:
+        """
+        Insert all objects, updating the existing rows that conflict on `conflict_columns`.
+
+        Args:
+            objs_data: The objects to insert or update.
+            conflict_columns: Columns of a unique constraint/index identifying an existing row.
+            update_columns: Columns overwritten on conflict. Defaults to every provided column
+            except the conflict columns, `id` and the creation audit fields.
+
+        Returns:
+            The IDs of the inserted or updated rows.
+        """
+        if not objs_data:
+            return []
+
+        rows = self._prepare_bulk_rows(objs_data)
+        table = self.model.__table__
+
+        if update_columns is None:
+            excluded_from_update = {*conflict_columns, "id", "created_at", "created_by_id"}
+            update_columns = [key for key in rows[0] if key not in excluded_from_update]
+
+        if len(rows) >= self._BULK_COPY_THRESHOLD:
+            # COPY cannot resolve conflicts: stage the rows in a temporary table first
+            staging_table = f"_bulk_upsert_{table.name}_{uuid4().hex[:8]}"
+
+            await self.db.execute(text(
+                f"CREATE TEMPORARY TABLE {staging_table} "
+                f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            ))
+            await self._copy_rows(staging_table, rows)
+
+            columns = [table.c[key] for key in rows[0]]
+            staging = sa_table(staging_table, *[column_clause(c.name) for c in columns])
+            stmt = pg_insert(table).from_select(
+                [c.name for c in columns],
+                select(*[staging.c[c.name] for c in columns])
+            )
+            result = await self.db.execute(
+                self._on_conflict_do_update(stmt, conflict_columns, update_columns)
+                .returning(table.c.id)
+            )
+            ids = list(result.scalars().all())
+
+            await self.db.execute(text(f"DROP TABLE {staging_table}"))
+
+            return ids
+
+        stmt = self._on_conflict_do_update(pg_insert(self.model), conflict_columns, update_columns)
+        stmt = stmt.returning(self.model.id, sort_by_parameter_order=True)
+        result = await self.db.execute(stmt, rows)
+
+        return list(result.scalars().all())
+
+    def _prepare_bulk_rows(
+        self: IsBaseRepository[ModelT],
+        objs_data: list[CreateDTOBase]
+    ) -> list[dict[str, Any]]:
+        """Dump DTOs and fill the Python-side column defaults and audit fields."""
+        rows = [obj_data.model_dump() for obj_data in objs_data]
+        columns = self.model.__table__.columns
+
+        for column in columns:
+            default = column.default
+
+            if default is None or default.is_sequence or default.is_clause_element:
+                continue
+
+            for row in rows:
+                if column.key not in row:
+                    row[column.key] = default.arg(None) if default.is_callable else default.arg
+
+        if issubclass(self.model, AuditMixin):
+            actor_id = _get_actor_id()
+
+            for row in rows:
+                row["created_by_id"] = actor_id
+                row["updated_by_id"] = actor_id
+
+        return rows
+
+    async def _copy_rows(
+        self: IsBaseRepository[ModelT],
+        table_name: str,
+        rows: list[dict[str, Any]]
+    ) -> None:
+        """Stream rows into the table via asyncpg `COPY` on the session's connection."""
+        columns = list(rows[0])
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_name,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns
+        )
+
+        mark_tables_written(self.db.sync_session, [self.model.__tablename__])
+
+    def _on_conflict_do_update(
+        self: IsBaseRepository[ModelT],
+        stmt: PgInsert,
+        conflict_columns: list[str],
+        update_columns: list[str]
+    ) -> PgInsert:
+        """Build the `ON CONFLICT DO UPDATE` clause, including the ORM-maintained columns."""
+        table = self.model.__table__
+        set_ = {column: stmt.excluded[column] for column in update_columns}
+
+        # The updating user is recorded even if the caller picked the updated columns
+        if issubclass(self.model, AuditMixin):
+            set_["updated_by_id"] = stmt.excluded.updated_by_id
+
+        # `onupdate` defaults and the version counter are not applied to `ON CONFLICT DO UPDATE`
+        for column in table.columns:
+            if (
+                column.key not in set_
+                and column.onupdate is not None
+                and column.onupdate.is_clause_element
+            ):
+                set_[column.key] = column.onupdate.arg
+
+        if "version" in table.c and "version" not in set_:
+            set_["version"] = table.c.version + 1
+
+        return stmt.on_conflict_do_update(index_elements=conflict_columns, set_=set_)
+
+
 class UpdateMixin(Generic[ModelT]):
+    """
+    Set-based updates: each operation is a single `UPDATE ... WHERE ... RETURNING` statement.
+
+    ORM `before_update` listeners do not run for these statements, so the audit fields and the
+    optimistic locking version are maintained by `_build_update_stmt`.
+    """
+
     async def update(
         self: IsBaseRepository[ModelT],
         obj_id: UUID,
         obj_data: UpdateDTOBase
     ) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
+        update_data = obj_data.model_dump(exclude_unset=True)
+
+        if not update_data:
+            return await self.get_by_id(obj_id)
 
-        if not db_obj:
-            return None
+        return await _update_one(self, obj_id, update_data)
 
+    async def update_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface,
+        obj_data: UpdateDTOBase
+    ) -> list[UUID]:
+        """Update every object matching the filter specification and return their IDs."""
         update_data = obj_data.model_dump(exclude_unset=True)
 
         if not update_data:
-            return db_obj
+            return []
 
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
+        return await _update_many(self, self._build_filter_condition(filter_spec), update_data)
 
-        return db_obj
 
+class HardDeleteMixin(Generic[ModelT, LoadOptionsT]):
+    """
+    Set-based hard deletion: each operation is a single `DELETE ... WHERE ... RETURNING` statement.
+
+    Rows are not loaded before deletion, so dependent rows must be removed by the database
+    (`ON DELETE CASCADE`) rather than by ORM cascades.
+    """
 
-class HardDeleteMixin(Generic[ModelT]):
-    async def hard_delete(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
+    async def hard_delete(
+        self: IsBaseRepository[ModelT],
+        obj_id: UUID,
+        include: list[LoadOptionsT] | None = None
+    ) -> ModelT | None:
+        """
+        Delete a single object by ID and return its final state.
+
+        The returned object is built from the `RETURNING` row and detached from the session. Only
+        load options that issue their own `SELECT` (e.g. `selectinload`) can be used in `include`.
+        """
+        model_id_field: InstrumentedAttribute = self.model.id
 
-        if not db_obj:
-            return None
+        stmt = delete(self.model).where(model_id_field == obj_id).returning(self.model)
+        stmt = self._apply_load_options(stmt, include)
+        result = await self.db.execute(stmt)
+        db_obj = result.scalar_one_or_none()
 
-        await self.db.delete(db_obj)
+        if db_obj is not None:
+            # RETURNING rows are added to the identity map although the row no longer exists
+            self.db.expunge(db_obj)
 
         return db_obj
 
+    async def hard_delete_many_by_ids(
+        self: IsBaseRepository[ModelT],
+        obj_ids: list[UUID]
+    ) -> list[UUID]:
+        """Delete the objects with the given IDs and return the IDs that actually existed."""
+        if not obj_ids:
+            return []
+
+        model_id_field: InstrumentedAttribute = self.model.id
+
+        stmt = delete(self.model).where(model_id_field.in_(obj_ids)).returning(model_id_field)
+        result = await self.db.execute(stmt)
+
+        return list(result.scalars().all())
+
+    async def hard_delete_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface
+    ) -> list[UUID]:
+        """Delete every object matching the filter specification and return their IDs."""
+        model_id_field: InstrumentedAttribute = self.model.id
+
+        stmt = (
+            delete(self.model)
+            .where(self._build_filter_condition(filter_spec))
+            .returning(model_id_field)
+        )
+        result = await self.db.execute(stmt)
+
+        return list(result.scalars().all())
+
 
 class SoftDeleteMixin(Generic[ModelT]):
     async def soft_delete(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
+        return await _update_one(self, obj_id, _get_soft_delete_values())
 
-        if not db_obj:
-            return None
+    async def restore(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
+        return await _update_one(self, obj_id, {"deleted_at": None, "deleted_by_id": None})
 
-        user = context.get_current_user()
-        actor_id = user.id if user else settings.SYSTEM_USER_ID
+    async def soft_delete_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface
+    ) -> list[UUID]:
+        """Soft delete every not yet deleted object matching the filter and return their IDs."""
+        return await _update_many(
+            self,
+            and_(self._build_filter_condition(filter_spec), self.model.deleted_at.is_(None)),
+            _get_soft_delete_values()
+        )
+
+    async def restore_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface
+    ) -> list[UUID]:
+        """
+        Restore every deleted object matching the filter and return their IDs.
 
-        setattr(db_obj, "deleted_at", datetime.now(timezone.utc))
-        setattr(db_obj, "deleted_by_id", actor_id)
+        The filter specification must not exclude deleted objects (e.g., `show_deleted=True`).
+        """
+        return await _update_many(
+            self,
+            and_(self._build_filter_condition(filter_spec), self.model.deleted_at.is_not(None)),
+            {"deleted_at": None, "deleted_by_id": None}
+        )
 
-        return db_obj
+
+class ArchiveByStatusMixin(Generic[ModelT]):
+    async def soft_archive(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
+        return await _update_one(self, obj_id, {"archived_at": func.now()})
 
     async def restore(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
+        return await _update_one(self, obj_id, {"archived_at": None})
 
-        if not db_obj:
-            return None
+    async def soft_archive_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface
+    ) -> list[UUID]:
+        """Archive every active object matching the filter and return their IDs."""
+        return await _update_many(
+            self,
+            and_(self._build_filter_condition(filter_spec), self.model.archived_at.is_(None)),
+            {"archived_at": func.now()}
+        )
+
+    async def restore_many(
+        self: IsBaseRepository[ModelT],
+        filter_spec: FilterSpecificationInterface
+    ) -> list[UUID]:
+        """Restore every archived object matching the filter and return their IDs."""
+        return await _update_many(
+            self,
+            and_(self._build_filter_condition(filter_spec), self.model.archived_at.is_not(None)),
+            {"archived_at": None}
+        )
 
-        setattr(db_obj, "deleted_at", None)
-        setattr(db_obj, "deleted_by_id", None)
 
-        return db_obj
+def _get_actor_id() -> UUID:
+    """Return the ID of the current user in context, falling back to the system user."""
+    user = context.get_current_user()
 
+    return user.id if user else settings.SYSTEM_USER_ID
 
-class ArchiveByStatusMixin(Generic[ModelT]):
-    async def soft_archive(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
 
-        if not db_obj:
-            return None
+def _get_soft_delete_values() -> dict[str, Any]:
+    return {"deleted_at": func.now(), "deleted_by_id": _get_actor_id()}
 
-        setattr(db_obj, "archived_at", datetime.now(timezone.utc))
 
-        return db_obj
+def _build_update_stmt(
+    model: Type[ModelT],
+    condition: ColumnElement[bool],
+    values: dict[str, Any]
+) -> Update:
+    """Build an `UPDATE` statement maintaining the ORM-managed audit and version columns."""
+    values = dict(values)
 
-    async def restore(self: IsBaseRepository[ModelT], obj_id: UUID) -> ModelT | None:
-        db_obj = await self.get_by_id(obj_id)
+    if issubclass(model, AuditMixin):
+        values.setdefault("updated_by_id", _get_actor_id())
 
-        if not db_obj:
-            return None
+    if issubclass(model, OptimisticLockingMixin):
+        values.setdefault("version", model.version + 1)
 
-        setattr(db_obj, "archived_at", None)
+    return update(model).where(condition).values(values)
 
-        return db_obj
+
+async def _update_one(
+    repository: IsBaseRepository[ModelT],
+    obj_id: UUID,
+    values: dict[str, Any]
+) -> ModelT | None:
+    """
+    Update a single object by ID and return it.
+
+    Rows returned by an ORM-enabled `UPDATE ... RETURNING` refresh the identity map, so an already
+    loaded instance is returned with the new state and no additional `SELECT`.
+    """
+    model_id_field: InstrumentedAttribute = repository.model.id
+
+    stmt = _build_update_stmt(repository.model, model_id_field == obj_id, values)
+    result = await repository.db.execute(stmt.returning(repository.model))
+
+    return result.scalar_one_or_none()
+
+
+async def _update_many(
+    repository: IsBaseRepository[ModelT],
+    condition: ColumnElement[bool],
+    values: dict[str, Any]
+) -> list[UUID]:
+    """Update every object matching the condition and return their IDs."""
+    model_id_field: InstrumentedAttribute = repository.model.id
+
+    stmt = _build_update_stmt(repository.model, condition, values)
+    result = await repository.db.execute(stmt.returning(model_id_field))
+
+    return list(result.scalars().all())
@@ -0,0 +1,134 @@
+import time
+from collections import OrderedDict
+from itertools import chain
+from threading import Lock
+from typing import Final, Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from core.config import settings
+
+
+class CountCache:
+    """
+    Bounded, TTL-based in-process cache of exact list counts.
+
+    Entries are keyed by a "filter signature" (the compiled count statement and its parameters) and
+    remember the tables the count depends on. A committed write to any of those tables drops the
+    entry (see the session event listeners below), the TTL bounds staleness caused by writes from
+    other processes.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[int, float, frozenset[str]]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> int | None:
+        """Returns the cached count for the given key, or `None` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            count, expires_at, _ = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return count
+
+    def set(self, key: str, count: int, tables: Iterable[str]) -> None:
+        """Stores the count for the given key, evicting the least recently used entry if full."""
+        with self._lock:
+            expires_at = time.monotonic() + self._ttl_seconds
+            self._entries[key] = (count, expires_at, frozenset(tables))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> None:
+        """Drops every entry that depends on any of the given tables."""
+        tables = set(tables)
+
+        if not tables:
+            return
+
+        with self._lock:
+            stale_keys = [
+                key
+                for key, (_, _, entry_tables) in self._entries.items()
+                if entry_tables & tables
+            ]
+
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Global count cache instance
+count_cache: Final[CountCache] = CountCache(
+    max_size=settings.COUNT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+_WRITTEN_TABLES_KEY: Final[str] = "count_cache_written_tables"
+
+
+def _get_written_tables(session: Session) -> set[str]:
+    return session.info.setdefault(_WRITTEN_TABLES_KEY, set())
+
+
+def mark_tables_written(session: Session, tables: Iterable[str]) -> None:
+    """
+    Registers tables written outside the ORM's knowledge (e.g., through a raw `COPY`), so that
+    cached counts depending on them are invalidated when the transaction commits.
+    """
+    _get_written_tables(session).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, _: UOWTransaction) -> None:
+    """Event listener: remembers tables touched by the unit of work until the commit."""
+    written_tables = _get_written_tables(session)
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        written_tables.update(table.name for table in inspect(obj).mapper.tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_executed_tables(orm_execute_state: ORMExecuteState) -> None:
+    """Event listener: remembers tables touched by `INSERT`/`UPDATE`/`DELETE` statements."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+
+    table = getattr(orm_execute_state.statement, "table", None)
+
+    if table is not None:
+        _get_written_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session: Session) -> None:
+    """Event listener: invalidates cached counts depending on tables written by the transaction."""
+    count_cache.invalidate_tables(session.info.pop(_WRITTEN_TABLES_KEY, ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session: Session) -> None:
+    """Event listener: forgets tables written by a rolled back transaction."""
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
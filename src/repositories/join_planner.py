@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Iterable
+
+from sqlalchemy import inspect
+
+
+@lru_cache(maxsize=512)
+def plan_join_paths(
+    root: type,
+    join_paths: tuple[type, ...],
+    referenced_entities: frozenset[type]
+) -> tuple[type, ...]:
+    """
+    Select the join paths a query actually needs, preserving their declared order.
+
+    A declared path is kept if the query's clauses reference it, or if a kept path can only be
+    joined through it (e.g., `MaterialType` is reached from `Sample` via `Material`). Every other
+    path is dropped: all declared paths follow non-nullable foreign keys, so an unreferenced
+    inner JOIN never changes the result, only the cost of the query.
+
+    Args:
+        root: The ORM model the query selects from.
+        join_paths: The declared join paths, ordered from outermost to innermost.
+        referenced_entities: The ORM models referenced by the query's clauses.
+
+    Returns:
+        The join paths to perform, in their declared order.
+    """
+    required = {path for path in join_paths if path in referenced_entities}
+
+    # Walk backwards so that each required path can pull in the path it is joined through
+    for i in range(len(join_paths) - 1, -1, -1):
+        path = join_paths[i]
+
+        if path not in required or _are_related(root, path):
+            continue
+
+        for anchor in reversed(join_paths[:i]):
+            if _are_related(anchor, path):
+                required.add(anchor)
+                break
+
+    return tuple(path for path in join_paths if path in required)
+
+
+def unique_join_paths(*join_paths: Iterable[type] | None) -> tuple[type, ...]:
+    """Merge join path sequences, removing duplicates while preserving order."""
+    return tuple(dict.fromkeys(path for paths in join_paths for path in paths or ()))
+
+
+def _are_related(left: type, right: type) -> bool:
+    """Check whether the tables of two ORM models are linked by a foreign key."""
+    left_table = inspect(left).local_table
+    right_table = inspect(right).local_table
+
+    return (
+        any(fk.references(right_table) for fk in left_table.foreign_keys)
+        or any(fk.references(left_table) for fk in right_table.foreign_keys)
+    )
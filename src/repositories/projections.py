@@ -0,0 +1,31 @@
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import JSON, ColumnElement, func, literal_column
+
+
+def json_object(**fields: Any) -> ColumnElement[dict[str, Any]]:
+    """
+    Build a `json_build_object(...)` expression from keyword fields.
+
+    Example:
+        `json_object(id=Material.id, name=Material.name)` →
+        `json_build_object('id', materials.id, 'name', materials.name)`
+
+    Keys are rendered as SQL literals (not bound parameters, whose type Postgres cannot infer for
+    the variadic arguments), so they must be plain identifiers.
+    """
+    if not all(key.isidentifier() for key in fields):
+        raise ValueError(f"JSON object keys must be identifiers: {list(fields)}")
+
+    arguments = chain.from_iterable(
+        (literal_column(f"'{key}'"), value)
+        for key, value in fields.items()
+    )
+
+    return func.json_build_object(*arguments, type_=JSON)
+
+
+def json_array_agg(element: ColumnElement[Any]) -> ColumnElement[list[Any]]:
+    """Build a `json_agg(...)` expression that yields an empty array instead of `NULL`."""
+    return func.coalesce(func.json_agg(element), literal_column("'[]'::json"), type_=JSON)
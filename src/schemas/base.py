@@ -4,6 +4,8 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+from core.pagination import CountStrategy
+
 
 class SchemaBase(BaseModel):
     """Base class for all Pydantic schemas in the project."""
@@ -70,5 +72,15 @@ class PaginatedListResponseBase(SchemaBase, Generic[SchemaModelT]):
 
     data: list[SchemaModelT]
     page: int
-    total_pages: int
-    total_items: int
+    total_pages: int | None = None
+    total_items: int | None = None
+    has_next: bool
+    count_strategy: CountStrategy = CountStrategy.EXACT
+
+
+class CursorPaginatedListResponseBase(SchemaBase, Generic[SchemaModelT]):
+    model_config = ConfigDict(from_attributes=True)
+
+    data: list[SchemaModelT]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
@@ -1,8 +1,10 @@
 import importlib
 import inspect
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 def resolve_schemas_forward_refs(apps_dir: Path | str, verbose: bool = False) -> None:
@@ -86,3 +88,14 @@ def resolve_schemas_forward_refs(apps_dir: Path | str, verbose: bool = False) ->
             f"🧩✅ Rebuild complete: {rebuilt_schemas_count}/{len(schemas_to_rebuild)} schemas "
             f"rebuilt successfully."
         )
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(type_: Any) -> TypeAdapter:
+    """
+    Return a cached `TypeAdapter` for the given type (e.g., `list[SampleListItemResponse]`).
+
+    Building an adapter compiles a new validator, so adapters must not be created per request. The
+    cache is filled lazily, after forward references were resolved at startup.
+    """
+    return TypeAdapter(type_)
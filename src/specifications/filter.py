@@ -1,14 +1,19 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from sqlalchemy import BinaryExpression, Select, and_, or_
 from sqlalchemy.orm import InstrumentedAttribute
 
 from interfaces.specifications import FilterSpecificationInterface
-from specifications.mixins import QueryParamParsingMixin
+from specifications.mixins import QueryParamParsingMixin, ReferencedEntitiesMixin
 
 
-class FilteringSpecificationBase(FilterSpecificationInterface, QueryParamParsingMixin):
+class FilteringSpecificationBase(
+    FilterSpecificationInterface,
+    QueryParamParsingMixin,
+    ReferencedEntitiesMixin
+):
     """Generic specification for applying validated filtering to SQLAlchemy queries."""
 
     @dataclass(slots=True)
@@ -32,6 +37,11 @@ class FilteringSpecificationBase(FilterSpecificationInterface, QueryParamParsing
         """Get list of join paths."""
         return self._join_paths
 
+    @cached_property
+    def referenced_entities(self) -> frozenset[type]:
+        """Get the ORM models referenced by the built filter clauses."""
+        return self._collect_referenced_entities(self._filter_clauses)
+
     @property
     def is_empty(self) -> bool:
         return not self._filter_clauses
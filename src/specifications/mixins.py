@@ -1,3 +1,9 @@
+from typing import Iterable
+
+from sqlalchemy import ClauseElement
+from sqlalchemy.sql import visitors
+
+
 class QueryParamParsingMixin:
     """
     Mixin providing helper methods for parsing and normalizing query parameter values.
@@ -33,3 +39,32 @@ class QueryParamParsingMixin:
                 result.append(token)
 
         return result
+
+
+class ReferencedEntitiesMixin:
+    """
+    Mixin providing a helper for collecting the ORM entities referenced by built SQL clauses.
+
+    Specifications use it to report which of their join paths are actually required, so that
+    repositories can skip JOINs to tables none of the active clauses touch.
+    """
+
+    @staticmethod
+    def _collect_referenced_entities(clauses: Iterable[ClauseElement]) -> frozenset[type]:
+        """
+        Walks the given clauses and collects the ORM classes their columns belong to.
+
+        Args:
+            clauses: Built SQLAlchemy clauses (e.g., filter conditions or `ORDER BY` expressions).
+
+        Returns:
+            frozenset[type]: The ORM model classes of every ORM-annotated column in the clauses.
+        """
+        entities = set()
+
+        for clause in clauses:
+            for element in visitors.iterate(clause):
+                if (parent_entity := element._annotations.get("parententity")) is not None:
+                    entities.add(parent_entity.class_)
+
+        return frozenset(entities)
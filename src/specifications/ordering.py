@@ -6,7 +6,7 @@ from sqlalchemy import ColumnElement, Select
 from sqlalchemy.orm import InstrumentedAttribute
 
 from interfaces.specifications import OrderingSpecificationInterface
-from specifications.mixins import QueryParamParsingMixin
+from specifications.mixins import QueryParamParsingMixin, ReferencedEntitiesMixin
 
 
 @dataclass(slots=True, frozen=True)
@@ -23,7 +23,35 @@ class OrderingField:
     orm_attribute: InstrumentedAttribute
 
 
-class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsingMixin):
+@dataclass(slots=True, frozen=True)
+class OrderingKey:
+    """
+    Represents a single, resolved `ORDER BY` key produced by an ordering specification.
+
+    Attributes:
+        name: The public-facing API name of the field the key was built from (e.g., "receivedAt").
+        orm_attribute: The SQLAlchemy InstrumentedAttribute the query is ordered by.
+        is_desc: Whether the key is applied in descending order.
+    """
+    name: str
+    orm_attribute: InstrumentedAttribute
+    is_desc: bool = False
+
+    @property
+    def clause(self) -> ColumnElement:
+        """Returns the `ORDER BY` clause (`.asc()` or `.desc()`) for this key."""
+        return self.orm_attribute.desc() if self.is_desc else self.orm_attribute.asc()
+
+    def reversed(self) -> "OrderingKey":
+        """Returns the same key with the opposite sort direction."""
+        return OrderingKey(self.name, self.orm_attribute, not self.is_desc)
+
+
+class OrderingSpecificationBase(
+    OrderingSpecificationInterface,
+    QueryParamParsingMixin,
+    ReferencedEntitiesMixin
+):
     """
     Base specification for applying dynamic, validated ordering to a query.
 
@@ -117,18 +145,29 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
         Args:
             query_param: The raw query string from the user, e.g., "email,-created_at".
         """
-        self._ordering_clauses = self._build_clauses_from_query_param(query_param)
+        self._ordering_keys = self._build_keys_from_query_param(query_param)
+        self._ordering_clauses = [key.clause for key in self._ordering_keys]
 
     @property
     def join_paths(self) -> tuple[type, ...]:
         """Returns the tuple of ORM models required for joins."""
         return self.__join_paths__
 
+    @cached_property
+    def referenced_entities(self) -> frozenset[type]:
+        """Returns the ORM models referenced by the applied `ORDER BY` clauses."""
+        return self._collect_referenced_entities(self._ordering_clauses)
+
     @cached_property
     def allowed_fields(self) -> list[str]:
         """Returns a list of public-facing field names allowed for ordering."""
         return [field.name for field in self.__ordering_fields__]
 
+    @property
+    def ordering_keys(self) -> tuple[OrderingKey, ...]:
+        """Returns the resolved ordering keys in the order they are applied."""
+        return tuple(self._ordering_keys)
+
     @property
     def is_applicable(self) -> bool:
         """Checks if any valid ordering clauses were generated."""
@@ -151,9 +190,9 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
 
         return stmt
 
-    def _build_clauses_from_query_param(self, query_param: str | None) -> list[ColumnElement]:
+    def _build_keys_from_query_param(self, query_param: str | None) -> list[OrderingKey]:
         """
-        Parses the raw query param string and builds a list of `ORDER BY` clauses.
+        Parses the raw query param string and builds a list of ordering keys.
 
         It handles comma-separated values and applies the `__default_query_param__` if the provided
         `query_param` is invalid or empty.
@@ -162,13 +201,13 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
             query_param: The raw user-provided query string.
 
         Returns:
-            A list of SQLAlchemy `ColumnElement` (ordering) objects (e.g., [User.name.asc(),
-            User.created_at.desc()]).
+            A list of `OrderingKey` objects (e.g., [OrderingKey("name", User.name, False),
+            OrderingKey("createdAt", User.created_at, True)]).
         """
         if not self.__ordering_fields__:
             return []
 
-        def get_clauses_from_raw_query_param(raw_query_param: str | None) -> list[ColumnElement]:
+        def get_keys_from_raw_query_param(raw_query_param: str | None) -> list[OrderingKey]:
             """
             Inner helper function to process a raw string.
 
@@ -178,23 +217,23 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
 
             # Build a list, safely ignoring any invalid/unrecognized params
             return [
-                clause
+                key
                 for p in query_params
-                if (clause := self._build_clause(p)) is not None
+                if (key := self._build_key(p)) is not None
             ]
 
-        # 1. Try to get clauses from the user-provided query param
-        ordering_clauses = get_clauses_from_raw_query_param(query_param)
+        # 1. Try to get keys from the user-provided query param
+        ordering_keys = get_keys_from_raw_query_param(query_param)
 
-        # 2. If no valid clauses were found, fall back to the default ordering (if available)
-        if not ordering_clauses and self.__default_query_param__:
-            ordering_clauses = get_clauses_from_raw_query_param(self.__default_query_param__)
+        # 2. If no valid keys were found, fall back to the default ordering (if available)
+        if not ordering_keys and self.__default_query_param__:
+            ordering_keys = get_keys_from_raw_query_param(self.__default_query_param__)
 
-        return ordering_clauses
+        return ordering_keys
 
-    def _build_clause(self, query_param: str) -> ColumnElement | None:
+    def _build_key(self, query_param: str) -> OrderingKey | None:
         """
-        Builds a single ColumnElement (ASC/DESC) from a single query param.
+        Builds a single OrderingKey (ASC/DESC) from a single query param.
 
         It parses the optional "-" prefix for descending order and, crucially, validates the field
         name against the `__ordering_fields__` allow-list.
@@ -206,8 +245,8 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
             query_param: A single, clean query parameter (e.g., "-name" or "email").
 
         Returns:
-            A `ColumnElement` (e.g., `User.name.desc()`) if the field is valid, or `None` if the
-            field is not in the allow-list.
+            An `OrderingKey` (e.g., `OrderingKey("name", User.name, True)`) if the field is valid,
+            or `None` if the field is not in the allow-list.
         """
         # 1. Check for the descending prefix
         is_desc = query_param.startswith("-")
@@ -218,11 +257,8 @@ class OrderingSpecificationBase(OrderingSpecificationInterface, QueryParamParsin
         # 3. Securely check against the allow-list
         for ordering_field in self.__ordering_fields__:
             if field_name == ordering_field.name:
-                # Found a match. Return the correct ORM attribute with .desc() or .asc() applied.
-                return (
-                    ordering_field.orm_attribute.desc()
-                    if is_desc else ordering_field.orm_attribute.asc()
-                )
+                # Found a match. Return the key with the requested direction.
+                return OrderingKey(ordering_field.name, ordering_field.orm_attribute, is_desc)
 
         # 4. If no match is found, the param is invalid or not allowed - silently ignore it.
         return None
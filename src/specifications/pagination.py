@@ -1,6 +1,24 @@
-from sqlalchemy import Select
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Generic, Sequence, TypeVar
 
-from interfaces.specifications import PaginationSpecificationInterface
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy import ColumnElement, Select, and_, false, or_, tuple_
+
+from core.exceptions.pagination import InvalidCursorError
+from core.pagination import CountStrategy
+from interfaces.specifications import (
+    CursorPaginationSpecificationInterface,
+    PaginationSpecificationInterface
+)
+from specifications.ordering import OrderingKey
+
+
+ItemT = TypeVar("ItemT")
 
 
 class PaginationSpecification(PaginationSpecificationInterface):
@@ -15,7 +33,12 @@ class PaginationSpecification(PaginationSpecificationInterface):
     numbers or sizes).
     """
 
-    def __init__(self, page_number: int, page_size: int):
+    def __init__(
+        self,
+        page_number: int,
+        page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT
+    ):
         """
         Initializes the pagination specification and calculates offset/limit.
 
@@ -23,6 +46,7 @@ class PaginationSpecification(PaginationSpecificationInterface):
             page_number: The user-facing page number (1-indexed). Must be a positive integer (>= 1).
             page_size: The number of items to include on a page. Must be a non-negative integer
             (>= 0).
+            count_strategy: The strategy used to produce the total items count.
 
         Raises:
             ValueError: If `page_number` is not positive (<= 0) or if `page_size` is negative (< 0).
@@ -44,6 +68,7 @@ class PaginationSpecification(PaginationSpecificationInterface):
         self._limit = page_size
         # The offset for a 1-indexed page is (page_number - 1) * page_size
         self._offset = (page_number - 1) * page_size
+        self._count_strategy = count_strategy
 
     @property
     def limit(self) -> int:
@@ -55,8 +80,16 @@ class PaginationSpecification(PaginationSpecificationInterface):
         """Returns the calculated `OFFSET` value (the number of rows to skip) for the SQL query."""
         return self._offset
 
-    def get_total_pages(self, total_items_count: int) -> int:
-        """Returns the total amount of pages for the given page size."""
+    @property
+    def count_strategy(self) -> CountStrategy:
+        """Returns the strategy used to produce the total items count."""
+        return self._count_strategy
+
+    def get_total_pages(self, total_items_count: int | None) -> int | None:
+        """Returns the total amount of pages for the given page size (`None` if not counted)."""
+        if total_items_count is None:
+            return None
+
         return max((total_items_count + self._limit - 1) // self._limit, 1)
 
     def apply(self, stmt: Select) -> Select:
@@ -70,3 +103,260 @@ class PaginationSpecification(PaginationSpecificationInterface):
             The modified `Select` statement with the `LIMIT` and `OFFSET` applied.
         """
         return stmt.limit(self._limit).offset(self._offset)
+
+
+@dataclass(slots=True)
+class OffsetPage(Generic[ItemT]):
+    """
+    A single page fetched with offset pagination.
+
+    Attributes:
+        items: The page items.
+        total_items: The total items count, or `None` if it was not counted.
+        has_next: Whether another page follows this one.
+        count_strategy: The strategy that actually produced `total_items`.
+    """
+    items: list[ItemT]
+    total_items: int | None
+    has_next: bool
+    count_strategy: CountStrategy
+
+
+@dataclass(slots=True)
+class CursorPage(Generic[ItemT]):
+    """
+    A single page fetched with keyset (cursor) pagination.
+
+    Attributes:
+        items: The page items in the requested order.
+        next_cursor: Opaque cursor pointing past the last item, or `None` if there is no next page.
+        previous_cursor: Opaque cursor pointing before the first item, or `None` if there is no
+        previous page.
+    """
+    items: list[ItemT] = field(default_factory=list)
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+class CursorPaginationSpecification(CursorPaginationSpecificationInterface):
+    """
+    A specification for applying keyset (cursor) pagination to a query.
+
+    Instead of skipping `OFFSET` rows, the query continues strictly after (or before) the boundary
+    row encoded in an opaque cursor: `WHERE (ordering keys) > (cursor values) ORDER BY ... LIMIT n`.
+    The cost of a page therefore does not grow with its depth, and rows inserted in the meantime do
+    not shift the page boundaries.
+
+    The cursor is bound to the ordering keys it was produced for (including the `id` tiebreaker
+    appended by the repository), so a cursor cannot be replayed against a different ordering.
+
+    NULL values follow PostgreSQL's default ordering (NULLS LAST for ASC, NULLS FIRST for DESC).
+    """
+
+    def __init__(self, page_size: int, after: str | None = None, before: str | None = None):
+        """
+        Initializes the cursor pagination specification.
+
+        Args:
+            page_size: The number of items to include on a page. Must be a positive integer (>= 1).
+            after: Opaque cursor of the row after which the page starts (`page[after]`).
+            before: Opaque cursor of the row before which the page ends (`page[before]`).
+
+        Raises:
+            ValueError: If `page_size` is not positive (<= 0).
+            InvalidCursorError: If both `after` and `before` cursors are provided.
+        """
+        if page_size <= 0:
+            raise ValueError(f"{self.__class__.__name__} error: page size must be positive.")
+
+        if after and before:
+            raise InvalidCursorError(
+                "Only one of 'page[after]' and 'page[before]' cursors can be provided."
+            )
+
+        self._limit = page_size
+        self._after = after or None
+        self._before = before or None
+
+    @property
+    def limit(self) -> int:
+        """Returns the requested page size."""
+        return self._limit
+
+    @property
+    def is_backward(self) -> bool:
+        """Checks if the page is requested before the cursor (`page[before]`)."""
+        return self._before is not None
+
+    def apply(self, stmt: Select, ordering_keys: Sequence[OrderingKey]) -> Select:
+        """
+        Applies the keyset `WHERE`, `ORDER BY` and `LIMIT` clauses to the query.
+
+        One extra row is requested to detect whether another page follows in the same direction.
+        For backward pages the ordering is reversed; `build_page` restores the requested order.
+
+        Args:
+            stmt: The SQLAlchemy `Select` statement to modify.
+            ordering_keys: The complete ordering keys, ending with a unique tiebreaker.
+
+        Returns:
+            The modified `Select` statement.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for a different ordering.
+        """
+        if self.is_backward:
+            keys, cursor = [key.reversed() for key in ordering_keys], self._before
+        else:
+            keys, cursor = list(ordering_keys), self._after
+
+        if cursor:
+            values = self._decode_cursor(cursor, ordering_keys)
+            stmt = stmt.where(self._build_keyset_clause(keys, values))
+
+        return stmt.order_by(*[key.clause for key in keys]).limit(self._limit + 1)
+
+    def build_page(
+        self,
+        items: list[ItemT],
+        key_values: list[tuple[Any, ...]],
+        ordering_keys: Sequence[OrderingKey]
+    ) -> CursorPage[ItemT]:
+        """
+        Builds a `CursorPage` from the rows fetched by a query this specification was applied to.
+
+        Args:
+            items: The fetched items, in query order (including the extra look-ahead row).
+            key_values: The ordering key values of each fetched item, in the same order.
+            ordering_keys: The complete ordering keys that were passed to `apply`.
+
+        Returns:
+            The page items in the requested order together with the boundary cursors.
+        """
+        has_more = len(items) > self._limit
+        items, key_values = items[:self._limit], key_values[:self._limit]
+
+        if self.is_backward:
+            items, key_values = items[::-1], key_values[::-1]
+
+        if not items:
+            return CursorPage(items=[])
+
+        first_cursor = self._encode_cursor(key_values[0], ordering_keys)
+        last_cursor = self._encode_cursor(key_values[-1], ordering_keys)
+
+        if self.is_backward:
+            return CursorPage(
+                items=items,
+                next_cursor=last_cursor,
+                previous_cursor=first_cursor if has_more else None
+            )
+
+        return CursorPage(
+            items=items,
+            next_cursor=last_cursor if has_more else None,
+            previous_cursor=first_cursor if self._after else None
+        )
+
+    @classmethod
+    def _build_keyset_clause(
+        cls,
+        keys: Sequence[OrderingKey],
+        values: Sequence[Any]
+    ) -> ColumnElement[bool]:
+        """
+        Builds the "strictly after the cursor row" predicate for the given ordering keys.
+
+        When all keys share the same direction and none of them is nullable, a row-value comparison
+        `(a, b) > (x, y)` is used, which PostgreSQL can satisfy with a single composite index range
+        scan. Otherwise, the equivalent expanded form is built:
+        `(a > x) OR (a = x AND b > y) OR ...`.
+        """
+        if len({key.is_desc for key in keys}) == 1 and not any(map(cls._is_nullable, keys)):
+            columns = tuple_(*[key.orm_attribute for key in keys])
+            row_values = tuple_(*values)
+
+            return columns < row_values if keys[0].is_desc else columns > row_values
+
+        clauses = []
+
+        for i, key in enumerate(keys):
+            after_clause = cls._build_after_clause(key, values[i])
+
+            if after_clause is None:
+                continue
+
+            equal_clauses = [
+                prev.orm_attribute.is_(None) if value is None else prev.orm_attribute == value
+                for prev, value in zip(keys[:i], values[:i])
+            ]
+            clauses.append(and_(*equal_clauses, after_clause))
+
+        return or_(*clauses) if clauses else false()
+
+    @classmethod
+    def _build_after_clause(cls, key: OrderingKey, value: Any) -> ColumnElement[bool] | None:
+        """Builds the "strictly after `value`" predicate for a single key (`None` if impossible)."""
+        attr = key.orm_attribute
+
+        if key.is_desc:
+            # NULLS FIRST: non-NULL values follow a NULL, smaller values follow a non-NULL
+            return attr.is_not(None) if value is None else attr < value
+
+        # NULLS LAST: nothing follows a NULL, larger values and NULLs follow a non-NULL
+        if value is None:
+            return None
+
+        return or_(attr > value, attr.is_(None)) if cls._is_nullable(key) else attr > value
+
+    @staticmethod
+    def _is_nullable(key: OrderingKey) -> bool:
+        return getattr(key.orm_attribute.expression, "nullable", True)
+
+    @staticmethod
+    def _get_signature(ordering_keys: Sequence[OrderingKey]) -> list[str]:
+        return [f"-{key.name}" if key.is_desc else key.name for key in ordering_keys]
+
+    @classmethod
+    def _encode_cursor(cls, values: tuple[Any, ...], ordering_keys: Sequence[OrderingKey]) -> str:
+        payload = {"k": cls._get_signature(ordering_keys), "v": to_jsonable_python(list(values))}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str, ordering_keys: Sequence[OrderingKey]) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+
+            if not isinstance(payload, dict):
+                raise ValueError("Cursor payload is not an object")
+
+            signature, raw_values = payload["k"], payload["v"]
+
+            if not isinstance(raw_values, list):
+                raise ValueError("Cursor values are not a list")
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidCursorError()
+
+        if signature != cls._get_signature(ordering_keys) or len(raw_values) != len(ordering_keys):
+            raise InvalidCursorError("Pagination cursor does not match the requested ordering.")
+
+        try:
+            return [
+                None if value is None else _get_type_adapter(key).validate_python(value)
+                for key, value in zip(ordering_keys, raw_values)
+            ]
+        except ValidationError:
+            raise InvalidCursorError()
+
+
+@lru_cache(maxsize=None)
+def _get_python_type_adapter(python_type: type) -> TypeAdapter:
+    return TypeAdapter(python_type)
+
+
+def _get_type_adapter(key: OrderingKey) -> TypeAdapter:
+    """Returns a (cached) adapter that restores a cursor value to the column's Python type."""
+    return _get_python_type_adapter(key.orm_attribute.type.python_type)
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import ClassVar
 
 from sqlalchemy import BinaryExpression, ColumnElement, Select, or_
 from sqlalchemy.orm import InstrumentedAttribute
 
 from interfaces.specifications import SearchSpecificationInterface
+from specifications.mixins import ReferencedEntitiesMixin
 
 
 @dataclass(slots=True, frozen=True)
@@ -22,7 +24,7 @@ class SearchField:
     operator: str
 
 
-class SearchSpecificationBase(SearchSpecificationInterface):
+class SearchSpecificationBase(SearchSpecificationInterface, ReferencedEntitiesMixin):
     """
     Base specification for applying N-field OR-based search to a query.
 
@@ -98,6 +100,11 @@ class SearchSpecificationBase(SearchSpecificationInterface):
         """Returns the tuple of ORM models required for joins."""
         return self.__join_paths__
 
+    @cached_property
+    def referenced_entities(self) -> frozenset[type]:
+        """Returns the ORM models referenced by the search clauses (none for an empty query)."""
+        return self._collect_referenced_entities(self._search_clauses)
+
     @property
     def is_empty(self) -> bool:
         """Checks if the search query is empty or was not provided."""
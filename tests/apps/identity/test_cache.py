@@ -0,0 +1,135 @@
+import fnmatch
+from uuid import uuid4
+
+import pytest
+
+from apps.identity.cache import InMemoryUserDataCache, RedisUserDataCache, UserDataCacheStats
+from apps.identity.metrics import register_user_data_cache_metrics
+from apps.identity.schemas import UserData
+from core.metrics import MetricsRegistry
+
+
+class _FakeRedis:
+    """In-process stand-in for the subset of `redis.asyncio.Redis` used by the cache."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.expirations: dict[str, int | None] = {}
+
+    async def get(self, name):
+        return self.values.get(name)
+
+    async def set(self, name, value, ex=None):
+        self.values[name] = value
+        self.expirations[name] = ex
+
+    async def delete(self, *names):
+        return sum(self.values.pop(name, None) is not None for name in names)
+
+    async def scan_iter(self, match=None):
+        for key in list(self.values):
+            if match is None or fnmatch.fnmatch(key, match):
+                yield key
+
+
+def _user_data() -> UserData:
+    return UserData(
+        id=uuid4(),
+        email="technician@steel.pl.ua",
+        is_active=True,
+        is_superuser=False,
+        permission_codes=["samples:read"]
+    )
+
+
+@pytest.mark.anyio
+async def test_in_memory_cache_expires_entries():
+    cache = InMemoryUserDataCache(max_size=10, ttl_seconds=0)
+    user_data = _user_data()
+
+    await cache.set(user_data)
+
+    assert await cache.get(user_data.id) is None
+
+
+@pytest.mark.anyio
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryUserDataCache(max_size=2, ttl_seconds=60)
+    first, second, third = _user_data(), _user_data(), _user_data()
+
+    await cache.set(first)
+    await cache.set(second)
+    await cache.get(first.id)
+    await cache.set(third)
+
+    assert await cache.get(first.id) == first
+    assert await cache.get(second.id) is None
+    assert await cache.get(third.id) == third
+
+
+@pytest.mark.anyio
+async def test_in_memory_cache_invalidation():
+    cache = InMemoryUserDataCache(max_size=10, ttl_seconds=60)
+    first, second = _user_data(), _user_data()
+
+    await cache.set(first)
+    await cache.set(second)
+    await cache.invalidate(first.id)
+
+    assert await cache.get(first.id) is None
+    assert await cache.get(second.id) == second
+
+    await cache.clear()
+
+    assert await cache.get(second.id) is None
+
+
+@pytest.mark.anyio
+async def test_redis_cache_round_trip_and_invalidation():
+    client = _FakeRedis()
+    cache = RedisUserDataCache(client, ttl_seconds=30)
+    first, second = _user_data(), _user_data()
+
+    await cache.set(first)
+    await cache.set(second)
+
+    assert await cache.get(first.id) == first
+    assert set(client.expirations.values()) == {30}
+
+    await cache.invalidate(first.id)
+
+    assert await cache.get(first.id) is None
+    assert await cache.get(second.id) == second
+
+    client.values["unrelated"] = "kept"
+    await cache.clear()
+
+    assert await cache.get(second.id) is None
+    assert client.values == {"unrelated": "kept"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "cache_factory",
+    [
+        lambda: InMemoryUserDataCache(max_size=10, ttl_seconds=60),
+        lambda: RedisUserDataCache(_FakeRedis(), ttl_seconds=30)
+    ]
+)
+async def test_lookups_are_counted_and_exposed(cache_factory):
+    cache = cache_factory()
+    registry = MetricsRegistry()
+    register_user_data_cache_metrics(registry, cache)
+    user_data = _user_data()
+
+    await cache.get(user_data.id)
+    await cache.set(user_data)
+    await cache.get(user_data.id)
+    await cache.get(user_data.id)
+
+    assert cache.get_stats() == UserDataCacheStats(hits=2, misses=1)
+
+    rendered = registry.render()
+
+    assert "auth_user_data_cache_hits_total 2.0" in rendered
+    assert "auth_user_data_cache_misses_total 1.0" in rendered
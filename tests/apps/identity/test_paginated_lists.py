@@ -0,0 +1,66 @@
+import pytest
+
+from apps.identity.services import PermissionService, RoleService, UserService
+from core.config import settings
+from core.pagination import CountStrategy
+from schemas.utils import resolve_schemas_forward_refs
+from specifications.pagination import OffsetPage
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _resolve_forward_refs() -> None:
+    """Completes the response schemas referring to each other, as on the application's startup."""
+    resolve_schemas_forward_refs(settings.BASE_DIR / "apps")
+
+
+class _PaginatedRepository:
+    """Stands in for a repository, returning one page (and nothing else, e.g., no `get_count`)."""
+
+    def __init__(self, page: OffsetPage):
+        self.page = page
+        self.calls = 0
+
+    async def get_all_paginated_with_count(self, pagination_spec, *args, **kwargs) -> OffsetPage:
+        self.calls += 1
+
+        return self.page
+
+
+def _get_permissions(repo):
+    return PermissionService(None, repo, None, None).get_permissions_paginated(2, 20)
+
+
+def _get_roles(repo):
+    return RoleService(None, repo, None, None, None).get_roles_paginated(2, 20)
+
+
+def _get_users(repo):
+    return UserService(None, repo, None, None, None, None).get_users_paginated(2, 20)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("get_paginated", [_get_permissions, _get_roles, _get_users])
+async def test_list_response_is_built_from_one_page(get_paginated):
+    repo = _PaginatedRepository(OffsetPage([], 45, True, CountStrategy.EXACT))
+
+    response = await get_paginated(repo)
+
+    assert repo.calls == 1
+    assert response.page == 2
+    assert response.total_items == 45
+    assert response.total_pages == 3
+    assert response.has_next
+    assert response.count_strategy is CountStrategy.EXACT
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("get_paginated", [_get_permissions, _get_roles, _get_users])
+async def test_uncounted_list_response_has_no_total_pages(get_paginated):
+    repo = _PaginatedRepository(OffsetPage([], None, False, CountStrategy.NONE))
+
+    response = await get_paginated(repo)
+
+    assert response.total_items is None
+    assert response.total_pages is None
+    assert not response.has_next
+    assert response.count_strategy is CountStrategy.NONE
@@ -0,0 +1,146 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import apps.identity.schemas.auth.user_data as user_data_module
+from apps.identity.permission_registry import PermissionRegistry
+from apps.identity.repositories import UserRepository
+from apps.identity.schemas import UserData
+
+
+@pytest.fixture
+def registry(monkeypatch) -> PermissionRegistry:
+    """Replaces the global permission registry, which `UserData` compiles its codes against."""
+    registry = PermissionRegistry()
+    monkeypatch.setattr(user_data_module, "permission_registry", registry)
+
+    return registry
+
+
+def _user_data(*permission_codes: str) -> UserData:
+    return UserData(
+        id=uuid4(),
+        email="user@example.com",
+        is_active=True,
+        is_superuser=False,
+        permission_codes=list(permission_codes)
+    )
+
+
+def test_bits_are_stable_across_rebuilds(registry):
+    registry.rebuild(["samples.read", "samples.write"])
+    bits = {code: registry.compile([code]) for code in ("samples.read", "samples.write")}
+
+    # A code sorted before the registered ones, and a registered code left out (e.g., archived)
+    registry.rebuild(["roles.read", "samples.read"])
+
+    assert {code: registry.compile([code]) for code in bits} == bits
+    assert registry.compile(["roles.read"]) not in bits.values()
+    assert registry.compile(["samples.read", "samples.write", "roles.read"]).bit_count() == 3
+
+
+def test_generation_changes_only_when_codes_are_added(registry):
+    registry.rebuild(["samples.read"])
+    generation = registry.generation
+
+    registry.rebuild(["samples.read"])
+    assert registry.generation == generation
+
+    registry.rebuild(["samples.write"])
+    assert registry.generation == generation + 1
+
+
+def test_mask_of_unregistered_codes_is_none(registry):
+    registry.rebuild(["samples.read"])
+
+    assert registry.get_mask(("samples.read",)) == registry.compile(["samples.read"])
+    assert registry.get_mask(("samples.read", "samples.write")) is None
+
+    # Memoized masks are dropped once the code is registered
+    registry.rebuild(["samples.write"])
+
+    assert registry.get_mask(("samples.read", "samples.write")) == registry.compile(
+        ["samples.read", "samples.write"]
+    )
+
+
+def test_permission_checks_use_the_bitsets(registry):
+    registry.rebuild(["samples.read", "samples.write", "roles.read"])
+    user_data = _user_data("samples.read", "samples.write")
+
+    assert user_data.has_permission("samples.read")
+    assert user_data.has_permissions("samples.read", "samples.write")
+    assert not user_data.has_permissions("samples.read", "roles.read")
+    assert user_data.has_any_permission("roles.read", "samples.write")
+    assert not user_data.has_any_permission("roles.read")
+
+
+def test_unregistered_codes_fall_back_to_comparing_codes(registry):
+    registry.rebuild(["samples.read"])
+    user_data = _user_data("samples.read", "reports.create")
+
+    assert user_data.has_permissions("samples.read", "reports.create")
+    assert not user_data.has_permissions("samples.read", "reports.delete")
+    assert user_data.has_any_permission("reports.delete", "reports.create")
+    assert not user_data.has_any_permission("reports.delete")
+
+
+def test_cached_user_data_is_recompiled_after_a_rebuild(registry):
+    registry.rebuild(["samples.read"])
+    user_data = _user_data("samples.read", "samples.write")
+    assert user_data.has_permission("samples.read")
+
+    # Compiled before "samples.write" had a bit: only a recompilation can include it
+    registry.rebuild(["samples.write"])
+
+    assert user_data.has_permissions("samples.read", "samples.write")
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def mappings(self):
+        return self
+
+    def one_or_none(self):
+        return self._row
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements."""
+
+    def __init__(self, row=None):
+        self.executed = []
+        self._row = row
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._row)
+
+
+@pytest.mark.anyio
+async def test_authorization_data_unions_direct_and_role_permissions():
+    session = _RecordingSession(row={"id": uuid4()})
+    user_id = uuid4()
+
+    row = await UserRepository(session).get_authorization_data(user_id)
+
+    (stmt,) = session.executed
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert row == session._row
+    assert set(compiled.params.values()) == {user_id}
+    assert "array_agg(roles.code)" in sql
+    assert "array_agg(permissions.code)" in sql
+    # Permissions granted directly, united with those of the user's roles
+    assert "SELECT users_permissions.permission_id FROM users_permissions" in sql
+    assert (
+        "UNION SELECT roles_permissions.permission_id FROM roles_permissions "
+        "WHERE roles_permissions.role_id IN (SELECT users_roles.role_id"
+    ) in sql
+    # Archived roles (also as a source of permissions) and archived permissions are skipped
+    assert sql.count("roles.archived_at IS NULL") == 2
+    assert "permissions.archived_at IS NULL" in sql
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from apps.identity.dependencies.auth import _get_user_data_from_token_claims
+from apps.identity.permissions_epoch import (
+    InMemoryPermissionsEpochStore,
+    RedisPermissionsEpochStore,
+    create_permissions_epoch_store
+)
+from core.config import settings
+
+
+class _FakeRedis:
+    """In-process stand-in for the subset of `redis.asyncio.Redis` used by the store."""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def incr(self, name):
+        self.values[name] = self.values.get(name, 0) + 1
+
+        return self.values[name]
+
+    async def set(self, name, value, nx=False):
+        if nx and name in self.values:
+            return None
+
+        self.values[name] = value
+
+        return True
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "create_store",
+    [InMemoryPermissionsEpochStore, lambda: RedisPermissionsEpochStore(_FakeRedis())]
+)
+async def test_bumps_change_epochs(create_store):
+    store = create_store()
+    user_id, other_user_id = uuid4(), uuid4()
+    # The Redis store seeds the epochs on their first read
+    await store.get(user_id), await store.get(other_user_id)
+    epoch, other_epoch = await store.get(user_id), await store.get(other_user_id)
+
+    await store.bump(user_id)
+
+    assert await store.get(user_id) != epoch
+    assert await store.get(other_user_id) == other_epoch
+
+    epoch = await store.get(user_id)
+    await store.bump_all()
+
+    assert await store.get(user_id) != epoch
+    assert await store.get(other_user_id) != other_epoch
+
+
+@pytest.mark.parametrize(("embed_claims", "workers"), [(False, 4), (True, 1)])
+def test_in_memory_store_is_created_when_safe(monkeypatch, embed_claims, workers):
+    monkeypatch.setattr(settings, "USER_DATA_CACHE_BACKEND", "memory")
+    monkeypatch.setattr(settings, "JWT_EMBED_AUTHORIZATION_CLAIMS", embed_claims)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", workers)
+
+    assert isinstance(create_permissions_epoch_store(), InMemoryPermissionsEpochStore)
+
+
+def test_in_memory_store_is_refused_with_embedded_claims_and_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "USER_DATA_CACHE_BACKEND", "memory")
+    monkeypatch.setattr(settings, "JWT_EMBED_AUTHORIZATION_CLAIMS", True)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 2)
+
+    with pytest.raises(RuntimeError, match="USER_DATA_CACHE_BACKEND=redis"):
+        create_permissions_epoch_store()
+
+
+@pytest.mark.anyio
+async def test_redis_epoch_is_unknown_until_seeded():
+    store = RedisPermissionsEpochStore(_FakeRedis())
+    user_id = uuid4()
+
+    assert await store.get(user_id) is None
+    assert await store.get(user_id) is not None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("evicted_key", ["global", "user"])
+async def test_redis_evicted_epoch_does_not_revive_stale_claims(evicted_key):
+    client = _FakeRedis()
+    store = RedisPermissionsEpochStore(client)
+    user_id = uuid4()
+    await store.get(user_id)
+    stamped_epoch = await store.get(user_id)
+
+    # A revocation, then the server evicts the key
+    await store.bump(user_id)
+    await store.bump_all()
+    del client.values[f"permissions_epoch:{user_id if evicted_key == 'user' else 'global'}"]
+
+    assert await store.get(user_id) is None
+    assert await store.get(user_id) not in (None, stamped_epoch)
+
+
+@pytest.mark.anyio
+async def test_claims_are_not_trusted_with_an_unknown_epoch(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_EMBED_AUTHORIZATION_CLAIMS", True)
+    store = RedisPermissionsEpochStore(_FakeRedis())
+    user_id = uuid4()
+    request = SimpleNamespace(state=SimpleNamespace(access_token_payload={"pe": "0.0"}))
+
+    assert await _get_user_data_from_token_claims(request, user_id, store) is None
@@ -0,0 +1,101 @@
+import hashlib
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import apps.identity.tasks as tasks
+from apps.identity.models import RefreshToken
+from apps.identity.repositories import TokenRepository
+from core.security.utils import hash_token
+
+
+class _Result:
+    def __init__(self, rowcount: int = 0):
+        self.rowcount = rowcount
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return None
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements."""
+
+    def __init__(self, rowcounts: list[int] | None = None):
+        self.executed = []
+        self.commits = 0
+        self._rowcounts = list(rowcounts or [])
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._rowcounts.pop(0) if self._rowcounts else 0)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _compile(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def test_token_digest_is_fixed_size_sha256():
+    token = "x" * 512
+
+    assert hash_token(token) == hashlib.sha256(token.encode()).digest()
+    assert len(hash_token(token)) == 32
+
+
+def test_only_the_digest_is_stored():
+    refresh_token = RefreshToken.create(user_id=uuid4(), days_valid=7, token="secret-token")
+
+    assert refresh_token.token_hash == hash_token("secret-token")
+    assert "secret-token" not in repr(refresh_token)
+
+
+@pytest.mark.anyio
+async def test_lookup_compares_digests():
+    session = _RecordingSession()
+
+    await TokenRepository(session).get_refresh_token_by_token("secret-token")
+
+    compiled = _compile(session.executed[0])
+
+    assert "refresh_tokens.token_hash = %(token_hash_1)s" in str(compiled)
+    assert compiled.params["token_hash_1"] == hash_token("secret-token")
+
+
+@pytest.mark.anyio
+async def test_expired_tokens_are_deleted_in_locked_batches():
+    session = _RecordingSession(rowcounts=[5])
+
+    deleted = await TokenRepository(session).delete_expired_refresh_tokens(batch_size=100)
+
+    sql = str(_compile(session.executed[0]))
+
+    assert deleted == 5
+    assert sql.startswith("DELETE FROM refresh_tokens WHERE refresh_tokens.id IN (SELECT")
+    assert "refresh_tokens.expires_at < now()" in sql
+    assert "LIMIT %(param_1)s FOR UPDATE SKIP LOCKED" in sql
+
+
+@pytest.mark.anyio
+async def test_purge_repeats_batches_each_in_its_own_transaction(monkeypatch):
+    sessions = []
+    rowcounts = [3, 3, 1]
+
+    @asynccontextmanager
+    async def session_factory():
+        sessions.append(_RecordingSession(rowcounts=[rowcounts.pop(0)]))
+        yield sessions[-1]
+
+    monkeypatch.setattr(tasks, "get_postgresql_db_contextmanager", session_factory)
+
+    deleted = await tasks.purge_expired_refresh_tokens(batch_size=3)
+
+    assert deleted == 7
+    assert [session.commits for session in sessions] == [1, 1, 1]
@@ -0,0 +1,14 @@
+import pytest
+
+from apps.identity.models import User
+
+
+def test_create_with_hashed_password_does_not_hash():
+    user = User.create("Ada", "Lovelace", "ada@example.com", hashed_password="$2b$12$hash")
+
+    assert user._hashed_password == "$2b$12$hash"
+
+
+def test_create_without_password_is_rejected():
+    with pytest.raises(ValueError):
+        User.create("Ada", "Lovelace", "ada@example.com")
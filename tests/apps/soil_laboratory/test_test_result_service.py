@@ -0,0 +1,80 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.sql import Delete, Select
+
+from apps.soil_laboratory import models, repositories
+from apps.soil_laboratory.services import test_result as test_result_services
+from core.config import settings
+from core.exceptions.database import EntityNotFoundError
+from schemas.utils import resolve_schemas_forward_refs
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _resolve_forward_refs() -> None:
+    """Completes the response schemas referring to each other, as on the application's startup."""
+    resolve_schemas_forward_refs(settings.BASE_DIR / "apps")
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, returning the given object for every statement."""
+
+    def __init__(self, obj):
+        self.executed = []
+        self.committed = False
+        self._obj = obj
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._obj)
+
+    def expunge(self, obj):
+        pass
+
+    async def commit(self):
+        self.committed = True
+
+
+def _test_result_service(session: _RecordingSession) -> test_result_services.TestResultService:
+    return test_result_services.TestResultService(session, repositories.TestResultRepository(session), None, None, None, None)
+
+
+@pytest.mark.anyio
+async def test_delete_test_loads_the_parameter_before_deleting():
+    test_result = models.TestResult(
+        id=uuid4(),
+        parameter=models.Parameter(id=uuid4(), code="W", name="Water content", units="%"),
+        mean_value=12.5,
+        variation_percentage=1.5,
+        is_compliant=True
+    )
+    session = _RecordingSession(test_result)
+
+    response = await _test_result_service(session).delete_test(test_result.id)
+
+    select_stmt, delete_stmt = session.executed
+    assert isinstance(select_stmt, Select) and len(select_stmt._with_options) == 1
+    assert isinstance(delete_stmt, Delete)
+    assert session.committed
+    assert response.id == test_result.id
+    assert response.parameter.name == "Water content"
+
+
+@pytest.mark.anyio
+async def test_delete_missing_test_deletes_nothing():
+    session = _RecordingSession(None)
+
+    with pytest.raises(EntityNotFoundError):
+        await _test_result_service(session).delete_test(uuid4())
+
+    assert len(session.executed) == 1
+    assert not session.committed
@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field
+
+import anyio
+from starlette.types import ASGIApp, Message, Scope
+
+
+@dataclass
+class ASGIResponse:
+    """Messages an application sent in response to a request."""
+    messages: list[Message] = field(default_factory=list)
+
+    @property
+    def start(self) -> Message:
+        return next(m for m in self.messages if m["type"] == "http.response.start")
+
+    @property
+    def status_code(self) -> int:
+        return self.start["status"]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {key.decode().lower(): value.decode() for key, value in self.start["headers"]}
+
+    @property
+    def body_messages(self) -> list[Message]:
+        return [m for m in self.messages if m["type"] == "http.response.body"]
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(m.get("body", b"") for m in self.body_messages)
+
+
+def make_scope(
+    path: str = "/",
+    method: str = "GET",
+    headers: dict[str, str] | None = None
+) -> Scope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+        ],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000)
+    }
+
+
+async def call_asgi(
+    app: ASGIApp,
+    path: str = "/",
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    scope: Scope | None = None,
+    response: ASGIResponse | None = None
+) -> ASGIResponse:
+    """
+    Sends a request with an empty body to an ASGI application and collects the messages it sends.
+
+    The client disconnects only once the response is complete. Passing a `response` gives access to
+    the messages sent so far if the application raises.
+    """
+    scope = scope or make_scope(path, method, headers)
+    response = response if response is not None else ASGIResponse()
+    response_complete = anyio.Event()
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await response_complete.wait()
+
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        response.messages.append(message)
+
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    await app(scope, receive, send)
+
+    return response
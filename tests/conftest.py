@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Runs the `anyio`-marked tests on asyncio only (the event loop the application runs on)."""
+    return "asyncio"
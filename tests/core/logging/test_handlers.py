@@ -0,0 +1,100 @@
+import io
+import threading
+
+from core.logging.handlers import BatchingWriter
+from core.metrics import MetricsRegistry
+from core.metrics.collectors import register_log_sink_metrics
+
+
+class _StalledStream(io.BytesIO):
+    """Stream whose first write waits until released, so the writer's queue can be filled."""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.released = threading.Event()
+
+    def write(self, data: bytes) -> int:
+        self.writing.set()
+        self.released.wait(timeout=5)
+        return super().write(data)
+
+
+class _FailingStream(io.BytesIO):
+    def write(self, data: bytes) -> int:
+        raise OSError("disk full")
+
+
+def _fill(drop_policy: str) -> tuple[BatchingWriter, _StalledStream]:
+    stream = _StalledStream()
+    writer = BatchingWriter(stream, max_queue_size=2, batch_size=1, drop_policy=drop_policy)
+    writer.write(b"a")
+    # The writer thread holds "a", so the queue holds "b" and "c" and is full
+    assert stream.writing.wait(timeout=5)
+
+    if drop_policy == "block":
+        # Writing "d" waits for room, which is made once the stream accepts "a"
+        threading.Timer(0.05, stream.released.set).start()
+
+    for chunk in (b"b", b"c", b"d"):
+        writer.write(chunk)
+
+    stream.released.set()
+    writer.close()
+
+    return writer, stream
+
+
+def test_drop_newest_discards_the_new_chunk():
+    writer, stream = _fill("drop_newest")
+
+    assert stream.getvalue() == b"abc"
+    assert writer.dropped == 1
+
+
+def test_drop_oldest_discards_the_oldest_buffered_chunk():
+    writer, stream = _fill("drop_oldest")
+
+    assert stream.getvalue() == b"acd"
+    assert writer.dropped == 1
+
+
+def test_block_waits_for_room():
+    writer, stream = _fill("block")
+
+    assert stream.getvalue() == b"abcd"
+    assert writer.dropped == 0
+
+
+def test_write_errors_are_reported_once_and_summarized_on_close(capsys):
+    writer = BatchingWriter(_FailingStream(), batch_size=1, flush_interval_seconds=0.01)
+    writer.write(b"a")
+    writer.drain()
+    writer.write(b"b")
+    writer.drain()
+    writer.close()
+
+    errors = capsys.readouterr().err.splitlines()
+
+    assert writer.write_errors == 2
+    assert len(errors) == 2
+    assert "failed to write 1 log events" in errors[0] and "disk full" in errors[0]
+    assert errors[1] == "Log writer: 0 log events dropped (queue full), 2 batch writes failed"
+
+
+def test_clean_close_reports_nothing(capsys):
+    writer = BatchingWriter(io.BytesIO())
+    writer.write(b"a")
+    writer.close()
+
+    assert capsys.readouterr().err == ""
+
+
+def test_dropped_events_are_exposed_as_a_counter():
+    writer, _ = _fill("drop_newest")
+    registry = MetricsRegistry()
+    register_log_sink_metrics(registry, writer)
+
+    assert "log_events_dropped_total 1.0" in registry.render()
+    # Collecting again doesn't count the same drops twice
+    assert "log_events_dropped_total 1.0" in registry.render()
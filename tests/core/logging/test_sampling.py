@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pytest
+
+import core.logging.sampling as sampling_module
+import core.logging.tasks as tasks_module
+from core.logging import RequestLogSampler, SuppressedRequestLogs
+from core.logging.tasks import log_suppressed_request_logs, run_suppressed_request_logs_summary
+
+
+class _RecordingLogger:
+    def __init__(self):
+        self.infos: list[tuple[str, dict]] = []
+
+    def info(self, message: str, **kwargs) -> None:
+        self.infos.append((message, kwargs))
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    """Replaces the monotonic clock of the sampler with a settable one."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(sampling_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    return clock
+
+
+@pytest.fixture
+def draw(monkeypatch) -> SimpleNamespace:
+    """Replaces the sampler's random draws with a settable value."""
+    draw = SimpleNamespace(value=0.5)
+    monkeypatch.setattr(sampling_module, "random", SimpleNamespace(random=lambda: draw.value))
+
+    return draw
+
+
+def test_longest_matching_prefix_sets_the_sample_rate(draw):
+    sampler = RequestLogSampler(
+        sample_rate=1.0,
+        route_sample_rates={"/api/v1/": 0.6, "/api/v1/samples": 0.4}
+    )
+
+    # 0.5 is kept at 0.6, dropped at 0.4
+    assert sampler.sample_request("/api/v1/users")
+    assert not sampler.sample_request("/api/v1/samples/cursor")
+    assert sampler.sample_request("/health")
+
+
+def test_failed_and_slow_requests_are_always_logged():
+    sampler = RequestLogSampler(sample_rate=0, slow_threshold_ms=500)
+
+    assert sampler.should_log_end(False, 500, 10)
+    assert sampler.should_log_end(False, 404, 10)
+    assert sampler.should_log_end(False, 200, 500)
+    assert not sampler.should_log_end(False, 200, 499.9)
+
+
+def test_token_bucket_caps_the_lines_per_second(clock):
+    sampler = RequestLogSampler(max_lines_per_second=2)
+
+    assert [sampler.should_log_start(True) for _ in range(3)] == [True, True, False]
+
+    clock.now += 0.5
+    assert [sampler.should_log_start(True) for _ in range(2)] == [True, False]
+
+    # Idle time refills the bucket up to its capacity only
+    clock.now += 60
+    assert [sampler.should_log_start(True) for _ in range(3)] == [True, True, False]
+
+
+def test_pop_suppressed_returns_the_counts_once():
+    sampler = RequestLogSampler(max_lines_per_second=1)
+
+    assert sampler.pop_suppressed() is None
+
+    sampler.should_log_start(False)
+    sampler.should_log_end(False, 200, 10)
+    sampler.should_log_start(True)
+    sampler.should_log_end(True, 200, 10)
+
+    assert sampler.pop_suppressed() == SuppressedRequestLogs(sampled_out=2, rate_limited=1)
+    assert sampler.pop_suppressed() is None
+
+
+def test_suppressed_logs_are_summarized_only_when_lines_were_dropped():
+    logger = _RecordingLogger()
+    sampler = RequestLogSampler(sample_rate=0)
+
+    log_suppressed_request_logs(sampler, logger)
+    sampler.should_log_start(False)
+    log_suppressed_request_logs(sampler, logger)
+
+    assert logger.infos == [(
+        "Request logs suppressed: 1 sampled out, 0 rate limited",
+        {"sampled_out": 1, "rate_limited": 0}
+    )]
+
+
+@pytest.mark.anyio
+async def test_summary_task_logs_without_requests(monkeypatch):
+    logger = _RecordingLogger()
+    sampler = RequestLogSampler(sample_rate=0)
+    sampler.should_log_start(False)
+    sleeps = []
+
+    async def sleep(seconds):
+        # The second sleep stops the task, after one summary
+        if sleeps:
+            raise RuntimeError
+
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(tasks_module, "asyncio", SimpleNamespace(sleep=sleep))
+
+    with pytest.raises(RuntimeError):
+        await run_suppressed_request_logs_summary(sampler, logger, 60)
+
+    assert sleeps == [60]
+    assert len(logger.infos) == 1
@@ -0,0 +1,131 @@
+import io
+import json
+import logging
+import sys
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+import core.context as context
+from core.logging import StructlogLogger, configure_structlog
+from core.logging.structlog.config import add_context_data
+
+
+@pytest.fixture
+def restore_logging():
+    structlog_config = structlog.get_config()
+    root_logger = logging.getLogger()
+    handlers, level = list(root_logger.handlers), root_logger.level
+
+    yield
+
+    structlog.configure(**structlog_config)
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+@pytest.fixture
+def output(monkeypatch, restore_logging) -> io.BytesIO:
+    buffer = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", SimpleNamespace(buffer=buffer))
+    configure_structlog(log_level="INFO", environment="production")
+
+    return buffer
+
+
+def _configure_stdlib_chain(stream: io.StringIO) -> None:
+    """The production chain before it skipped stdlib logging (events rendered to str)."""
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            add_context_data,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer()
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True
+    )
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.StreamHandler(stream)]
+    root_logger.setLevel(logging.INFO)
+
+
+def _log_sample_events() -> None:
+    context.set_correlation_id("abc-123")
+    context.set_request_method("GET")
+    context.set_request_path("/samples")
+    logger = StructlogLogger("lab")
+    logger.info("Samples listed", count=3)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Listing failed")
+
+
+def _read_events(lines: list[str]) -> list[dict]:
+    # The stdlib handler also appended the traceback after the JSON line
+    events = [json.loads(line) for line in lines if line.startswith("{")]
+
+    for event in events:
+        del event["timestamp"]
+
+    return events
+
+
+def test_production_events_are_json_bytes_with_the_request_context(output):
+    _log_sample_events()
+
+    event = json.loads(output.getvalue().splitlines()[0])
+
+    assert event.pop("timestamp")
+    assert event == {
+        "event": "Samples listed",
+        "count": 3,
+        "logger": "lab",
+        "level": "info",
+        "correlation_id": "abc-123",
+        "request_path": "/samples",
+        "request_method": "GET",
+        "user_id": None
+    }
+
+
+def test_production_fields_match_the_stdlib_chain(output):
+    _log_sample_events()
+    events = _read_events(output.getvalue().decode().splitlines())
+
+    stream = io.StringIO()
+    _configure_stdlib_chain(stream)
+    _log_sample_events()
+    stdlib_events = _read_events(stream.getvalue().splitlines())
+
+    for event in (events[1], stdlib_events[1]):
+        assert "ValueError: boom" in event.pop("exception")
+
+    assert events == stdlib_events
+
+
+def test_events_below_the_level_are_filtered(output):
+    StructlogLogger("lab").debug("Not written")
+
+    assert output.getvalue() == b""
+
+
+def test_production_events_bypass_stdlib_logging(output):
+    root_logger = logging.getLogger()
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    root_logger.addHandler(handler)
+
+    StructlogLogger("lab").info("Written directly")
+
+    assert records == []
+    assert b"Written directly" in output.getvalue()
@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+from core.metrics import Counter, MetricsRegistry
+from core.metrics.registry import Metric
+
+
+def test_metric_subclasses_must_dump_their_values():
+    class Incomplete(Metric):
+        type = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Missing _dump_values.")
+
+
+def test_counter_follows_a_total_counted_elsewhere():
+    counter = Counter("timeouts_total", "Timeouts.", ("pool",))
+
+    counter.inc_to_total(3, ("primary",))
+    counter.inc_to_total(5, ("primary",))
+    # The source was reset (e.g., a recreated pool) and counted 2 since
+    counter.inc_to_total(2, ("primary",))
+
+    assert counter.dump()["values"] == [[["primary"], 7]]
+
+
+def test_render_in_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("http_requests_total", "Requests.", ("method",))
+    in_use = registry.gauge("db_pool_checked_out", "Connections in use.")
+    duration = registry.histogram("duration_seconds", "Durations.", buckets=(0.1, 1))
+    requests.inc(("GET",))
+    requests.inc(("GET",))
+    in_use.set(3)
+    duration.observe(0.05)
+    duration.observe(0.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP http_requests_total Requests.",
+        "# TYPE http_requests_total counter",
+        'http_requests_total{method="GET"} 2.0',
+        "# HELP db_pool_checked_out Connections in use.",
+        "# TYPE db_pool_checked_out gauge",
+        "db_pool_checked_out 3.0",
+        "# HELP duration_seconds Durations.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{le="0.1"} 1',
+        'duration_seconds_bucket{le="1.0"} 2',
+        'duration_seconds_bucket{le="+Inf"} 2',
+        "duration_seconds_sum 0.55",
+        "duration_seconds_count 2"
+    ]
+
+
+def test_duplicate_registration_is_rejected():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.")
+
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "Requests.")
+
+
+def test_multiprocess_render_merges_worker_snapshots(tmp_path):
+    registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+    requests = registry.counter("requests_total", "Requests.")
+    in_use = registry.gauge("in_use", "In use.")
+    requests.inc(amount=2)
+    in_use.set(1)
+
+    # A stopped worker's final snapshot: its counters are kept, its gauges are not
+    stopped_worker = {
+        "pid": 999_999_999,
+        "live": False,
+        "metrics": {
+            "requests_total": {**requests.dump(), "values": [[[], 3]]},
+            "in_use": {**in_use.dump(), "values": [[[], 5]]}
+        }
+    }
+    (tmp_path / "metrics_999999999.json").write_text(json.dumps(stopped_worker))
+
+    rendered = registry.render()
+
+    assert "requests_total 5.0" in rendered
+    assert f'in_use{{pid="{os.getpid()}"}} 1.0' in rendered
+    assert "5.0" not in rendered.split("# HELP in_use")[1]
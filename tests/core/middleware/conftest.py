@@ -0,0 +1,34 @@
+import pytest
+
+
+class RecordingLogger:
+    """Logger recording the request lifecycle calls made by the middlewares."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, tuple]] = []
+
+    def _record(self, name: str, *args) -> None:
+        self.calls.append((name, args))
+
+    def info(self, message: str, **kwargs) -> None:
+        self._record("info", message, kwargs)
+
+    def request_start(self, request, **kwargs) -> None:
+        self._record("request_start", request.url.path)
+
+    def request_end(self, request, status_code: int, duration_ms: float, **kwargs) -> None:
+        self._record("request_end", request.url.path, status_code)
+
+    def request_error(self, exc, request, **kwargs) -> None:
+        self._record("request_error", type(exc))
+
+    def request_unexpected_error(self, e, request, **kwargs) -> None:
+        self._record("request_unexpected_error", type(e))
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+
+@pytest.fixture
+def logger() -> RecordingLogger:
+    return RecordingLogger()
@@ -0,0 +1,96 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from starlette.responses import JSONResponse, Response
+
+from core.middleware import GZipMiddleware
+from tests.asgi import ASGIResponse, call_asgi
+
+
+LARGE_CONTENT = {"items": [{"id": i, "name": f"Sample {i}"} for i in range(200)]}
+
+
+def _gzip(app, minimum_size: int = 1024) -> GZipMiddleware:
+    return GZipMiddleware(app, minimum_size=minimum_size)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept_encoding", ["gzip", "deflate, gzip;q=0.5", "*", "GZIP"])
+async def test_large_json_is_compressed(accept_encoding):
+    response = await call_asgi(
+        _gzip(JSONResponse(LARGE_CONTENT)),
+        headers={"Accept-Encoding": accept_encoding}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(response.body)
+    assert json.loads(gzip.decompress(response.body)) == LARGE_CONTENT
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Accept-Encoding": "gzip;q=0"}, {"Accept-Encoding": "br"}]
+)
+async def test_clients_not_accepting_gzip_get_the_original(headers):
+    response = await call_asgi(_gzip(JSONResponse(LARGE_CONTENT)), headers=headers)
+
+    assert "content-encoding" not in response.headers
+    assert json.loads(response.body) == LARGE_CONTENT
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "response_app",
+    [
+        JSONResponse({"id": 1}),  # Below the minimum size
+        Response(b"x" * 4096, media_type="application/octet-stream"),
+        Response(b"x" * 4096, media_type="text/plain", headers={"Content-Encoding": "br"})
+    ]
+)
+async def test_small_or_excluded_responses_are_not_compressed(response_app):
+    response = await call_asgi(_gzip(response_app), headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers.get("content-encoding") != "gzip"
+    assert response.body == response_app.body
+
+
+@pytest.mark.anyio
+async def test_strong_etag_is_weakened():
+    response_app = JSONResponse(LARGE_CONTENT, headers={"ETag": '"abc"'})
+
+    response = await call_asgi(_gzip(response_app), headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["etag"] == 'W/"abc"'
+
+
+@pytest.mark.anyio
+async def test_streamed_response_is_compressed_without_buffering():
+    response = ASGIResponse()
+    delivered_before_chunk = []
+    chunks = [b"line %d\n" % i * 100 for i in range(3)]
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/csv"), (b"content-length", b"2400")]
+        })
+
+        for i, chunk in enumerate(chunks):
+            delivered_before_chunk.append(len(response.body_messages))
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < 2})
+
+    await call_asgi(_gzip(app), headers={"Accept-Encoding": "gzip"}, response=response)
+
+    assert delivered_before_chunk == [0, 1, 2]
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    # Every chunk is flushed, so each one can be decompressed as soon as it arrives
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    for message, chunk in zip(response.body_messages, chunks):
+        assert decompressor.decompress(message["body"]) == chunk
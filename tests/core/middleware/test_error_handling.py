@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from starlette.responses import PlainTextResponse
+
+from core.exceptions import ClientError
+from core.middleware import ErrorHandlingMiddleware
+from tests.asgi import ASGIResponse, call_asgi
+
+
+class _ConflictError(ClientError):
+    status_code = 409
+
+
+@pytest.mark.anyio
+async def test_app_exception_is_mapped_to_its_status_code(logger):
+    async def app(scope, receive, send):
+        raise _ConflictError("Already exists")
+
+    response = await call_asgi(ErrorHandlingMiddleware(app, logger))
+
+    assert response.status_code == 409
+    assert json.loads(response.body)["detail"] == "Already exists"
+    assert logger.calls == [("request_error", (_ConflictError,))]
+
+
+@pytest.mark.anyio
+async def test_unexpected_exception_is_mapped_to_500(logger):
+    async def app(scope, receive, send):
+        raise KeyError("boom")
+
+    response = await call_asgi(ErrorHandlingMiddleware(app, logger))
+
+    assert response.status_code == 500
+    assert json.loads(response.body)["detail"] == "Internal Server Error. Please contact support."
+    assert logger.calls == [("request_unexpected_error", (KeyError,))]
+
+
+@pytest.mark.anyio
+async def test_successful_response_is_passed_through(logger):
+    response = await call_asgi(ErrorHandlingMiddleware(PlainTextResponse("ok"), logger))
+
+    assert (response.status_code, response.body) == (200, b"ok")
+    assert logger.calls == []
+
+
+@pytest.mark.anyio
+async def test_exception_after_the_response_started_is_reraised(logger):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"partial", "more_body": True})
+        raise RuntimeError("stream failed")
+
+    response = ASGIResponse()
+
+    with pytest.raises(RuntimeError):
+        await call_asgi(ErrorHandlingMiddleware(app, logger), response=response)
+
+    # No second response was started over the partial one
+    assert [m["type"] for m in response.messages] == ["http.response.start", "http.response.body"]
+    assert logger.calls == [("request_unexpected_error", (RuntimeError,))]
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from core.middleware import ErrorHandlingMiddleware, JWTAuthenticationMiddleware
+from core.security.hmac_token_manager import HMACJWTManager
+from core.security.token_cache import VerifiedTokenCache
+from tests.asgi import call_asgi
+
+
+class _CountingJWTManager(HMACJWTManager):
+    def __init__(self):
+        super().__init__("access-secret", "refresh-secret", "HS256", 15, 7)
+        self.decodes = 0
+
+    def decode_access_token(self, token: str) -> dict:
+        self.decodes += 1
+        return super().decode_access_token(token)
+
+
+async def _echo_state(scope, receive, send):
+    state = Request(scope).state
+    response = JSONResponse({"user_id": state.user_id, "user_email": state.user_email})
+    await response(scope, receive, send)
+
+
+@pytest.fixture
+def jwt_manager() -> _CountingJWTManager:
+    return _CountingJWTManager()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/api/v1/auth/login", "/health", "/docs"])
+async def test_excluded_paths_skip_authentication(jwt_manager, path):
+    async def app(scope, receive, send):
+        await JSONResponse({})(scope, receive, send)
+
+    response = await call_asgi(JWTAuthenticationMiddleware(app, jwt_manager), path)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Basic abc"}, {"Authorization": "Bearer"}, {"Authorization": "token"}]
+)
+async def test_missing_or_malformed_header_is_rejected(jwt_manager, headers):
+    response = await call_asgi(
+        JWTAuthenticationMiddleware(_echo_state, jwt_manager),
+        "/api/v1/samples",
+        headers=headers
+    )
+
+    assert response.status_code == 401
+    assert jwt_manager.decodes == 0
+
+
+@pytest.mark.anyio
+async def test_invalid_token_is_rejected(jwt_manager, logger):
+    app = ErrorHandlingMiddleware(JWTAuthenticationMiddleware(_echo_state, jwt_manager), logger)
+
+    response = await call_asgi(
+        app,
+        "/api/v1/samples",
+        headers={"Authorization": "Bearer not.a.token"}
+    )
+
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_user_is_set_on_the_request_state(jwt_manager):
+    token = jwt_manager.create_access_token({"sub": "user-1", "email": "user@example.com"})
+
+    response = await call_asgi(
+        JWTAuthenticationMiddleware(_echo_state, jwt_manager),
+        "/api/v1/samples",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"user_id": "user-1", "user_email": "user@example.com"}
+
+
+@pytest.mark.anyio
+async def test_verified_tokens_are_served_from_the_cache(jwt_manager):
+    token_cache = VerifiedTokenCache(max_size=10)
+    app = JWTAuthenticationMiddleware(_echo_state, jwt_manager, token_cache)
+    token = jwt_manager.create_access_token({"sub": "user-1"})
+
+    for _ in range(3):
+        response = await call_asgi(
+            app,
+            "/api/v1/samples",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+
+    assert jwt_manager.decodes == 1
+    assert token_cache.get_stats().hits == 2
@@ -0,0 +1,70 @@
+import pytest
+from starlette.responses import PlainTextResponse
+
+import core.context as context
+from core.logging import RequestLogSampler
+from core.middleware import RequestLoggingMiddleware
+from tests.asgi import call_asgi
+
+
+@pytest.mark.anyio
+async def test_correlation_id_is_propagated(logger):
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["correlation_id"] = context.get_correlation_id()
+        seen["path"] = context.get_request_path()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    response = await call_asgi(
+        RequestLoggingMiddleware(app, logger),
+        "/samples",
+        headers={"Correlation-Id": "abc-123"}
+    )
+
+    assert response.headers["correlation-id"] == "abc-123"
+    assert seen == {"correlation_id": "abc-123", "path": "/samples"}
+
+
+@pytest.mark.anyio
+async def test_correlation_id_is_generated(logger):
+    response = await call_asgi(RequestLoggingMiddleware(PlainTextResponse("ok"), logger))
+
+    assert len(response.headers["correlation-id"]) == 36
+
+
+@pytest.mark.anyio
+async def test_request_start_and_end_are_logged(logger):
+    app = RequestLoggingMiddleware(PlainTextResponse("missing", status_code=404), logger)
+
+    await call_asgi(app, "/samples")
+
+    assert logger.calls == [("request_start", ("/samples",)), ("request_end", ("/samples", 404))]
+
+
+@pytest.mark.anyio
+async def test_request_end_is_logged_as_500_when_the_app_raises(logger):
+    async def app(scope, receive, send):
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await call_asgi(RequestLoggingMiddleware(app, logger))
+
+    assert logger.calls[-1] == ("request_end", ("/", 500))
+
+
+@pytest.mark.anyio
+async def test_sampled_out_requests_are_not_logged(logger):
+    sampler = RequestLogSampler(sample_rate=0)
+    ok_app = RequestLoggingMiddleware(PlainTextResponse("ok"), logger, sampler)
+    failing_app = RequestLoggingMiddleware(
+        PlainTextResponse("failed", status_code=500),
+        logger,
+        sampler
+    )
+
+    await call_asgi(ok_app)
+    await call_asgi(failing_app)
+
+    # Failed requests are always logged (their end line)
+    assert logger.calls == [("request_end", ("/", 500))]
@@ -0,0 +1,49 @@
+import pytest
+
+from core.middleware import (
+    ErrorHandlingMiddleware,
+    GZipMiddleware,
+    JWTAuthenticationMiddleware,
+    RequestLoggingMiddleware
+)
+from core.security.hmac_token_manager import HMACJWTManager
+from tests.asgi import ASGIResponse, call_asgi
+
+
+@pytest.mark.anyio
+async def test_streamed_body_is_not_buffered_by_the_stack(logger):
+    response = ASGIResponse()
+    # Body messages that had reached the client when each chunk was produced
+    delivered_before_chunk = []
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain")]
+        })
+
+        for i in range(3):
+            delivered_before_chunk.append(len(response.body_messages))
+            await send({"type": "http.response.body", "body": b"chunk", "more_body": i < 2})
+
+    jwt_manager = HMACJWTManager("access-secret", "refresh-secret", "HS256", 15, 7)
+    stack = GZipMiddleware(
+        RequestLoggingMiddleware(
+            ErrorHandlingMiddleware(JWTAuthenticationMiddleware(app, jwt_manager), logger),
+            logger
+        ),
+        minimum_size=1
+    )
+    token = jwt_manager.create_access_token({"sub": "user-1"})
+
+    await call_asgi(
+        stack,
+        "/api/v1/samples",
+        headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"},
+        response=response
+    )
+
+    assert delivered_before_chunk == [0, 1, 2]
+    assert response.headers["content-encoding"] == "gzip"
+    assert logger.names() == ["request_start", "request_end"]
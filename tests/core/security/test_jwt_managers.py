@@ -0,0 +1,128 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import core.security.hmac_token_manager as hmac_token_manager
+import core.security.token_manager as token_manager
+from core.security.exceptions import (
+    ExpiredTokenError,
+    InvalidTokenError,
+    InvalidTokenTypeError,
+    TokenSignatureError
+)
+from core.security.hmac_token_manager import HMACJWTManager
+from core.security.token_manager import JWTManager
+
+
+MANAGERS = [JWTManager, HMACJWTManager]
+PAIRS = [(encoder, decoder) for encoder in MANAGERS for decoder in MANAGERS]
+
+
+def _make(manager_class, algorithm: str = "HS256", access_expire_minutes: int = 15):
+    return manager_class("access-secret", "refresh-secret", algorithm, access_expire_minutes, 7)
+
+
+def _b64url(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def _b64url_json(segment: str) -> dict:
+    return json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_tokens_are_interchangeable(encoder, decoder):
+    access_token = _make(encoder).create_access_token({"sub": "user-1", "email": "a@b.c"})
+    refresh_token = _make(encoder).create_refresh_token({"sub": "user-1"})
+
+    payload = _make(decoder).decode_access_token(access_token)
+
+    assert (payload["sub"], payload["email"], payload["type"]) == ("user-1", "a@b.c", "access")
+    assert _make(decoder).decode_refresh_token(refresh_token)["type"] == "refresh"
+    assert _make(decoder).get_token_expiration(access_token) == datetime.fromtimestamp(
+        payload["exp"],
+        tz=timezone.utc
+    )
+
+
+def test_tokens_are_byte_for_byte_identical(monkeypatch):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 1, 2, 3, 4, 5, 678000, tzinfo=tz)
+
+    monkeypatch.setattr(token_manager, "datetime", FrozenDatetime)
+    monkeypatch.setattr(hmac_token_manager, "datetime", FrozenDatetime)
+    data = {"sub": "user-1", "roles": ["admin"]}
+
+    for algorithm in ("HS256", "HS384", "HS512"):
+        assert (
+            _make(JWTManager, algorithm).create_access_token(data)
+            == _make(HMACJWTManager, algorithm).create_access_token(data)
+        )
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_tampered_payload_is_rejected(encoder, decoder):
+    header, payload, signature = _make(encoder).create_access_token({"sub": "user-1"}).split(".")
+    tampered_payload = _b64url({**_b64url_json(payload), "sub": "admin"})
+
+    with pytest.raises(InvalidTokenError):
+        _make(decoder).decode_access_token(f"{header}.{tampered_payload}.{signature}")
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_token_signed_with_another_key_is_rejected(encoder, decoder):
+    # A refresh token is signed with the refresh secret
+    token = _make(encoder).create_refresh_token({"sub": "user-1"})
+
+    with pytest.raises(InvalidTokenError):
+        _make(decoder).decode_access_token(token)
+
+
+def test_signature_mismatch_is_an_invalid_token_error():
+    header, payload, _ = _make(HMACJWTManager).create_access_token({"sub": "user-1"}).split(".")
+    forged_signature = _b64url({"forged": True})
+
+    with pytest.raises(TokenSignatureError) as exc_info:
+        _make(HMACJWTManager).decode_access_token(f"{header}.{payload}.{forged_signature}")
+
+    assert isinstance(exc_info.value, InvalidTokenError)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_expired_token_is_rejected(encoder, decoder):
+    token = _make(encoder, access_expire_minutes=-1).create_access_token({"sub": "user-1"})
+
+    with pytest.raises(ExpiredTokenError):
+        _make(decoder).decode_access_token(token)
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_token_of_another_algorithm_is_rejected(encoder, decoder):
+    token = _make(encoder, "HS512").create_access_token({"sub": "user-1"})
+
+    with pytest.raises(InvalidTokenError):
+        _make(decoder, "HS256").decode_access_token(token)
+
+
+@pytest.mark.parametrize("decoder", MANAGERS)
+def test_unsigned_token_is_rejected(decoder):
+    header = _b64url({"alg": "none", "typ": "JWT"})
+    payload = _b64url({"sub": "user-1", "type": "access", "exp": 4102444800})
+
+    with pytest.raises(InvalidTokenError):
+        _make(decoder).decode_access_token(f"{header}.{payload}.")
+
+
+
+@pytest.mark.parametrize("encoder, decoder", PAIRS)
+def test_token_of_another_type_is_rejected(encoder, decoder):
+    # With a single secret for both token types, only the `type` claim tells them apart
+    token = encoder("secret", "secret", "HS256", 15, 7).create_access_token({"sub": "user-1"})
+
+    with pytest.raises(InvalidTokenTypeError):
+        decoder("secret", "secret", "HS256", 15, 7).decode_refresh_token(token)
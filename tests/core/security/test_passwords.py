@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from core.security.passwords import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async
+)
+
+
+@pytest.mark.anyio
+async def test_async_hash_and_verify_round_trip():
+    hashed_password = await hash_password_async("correct horse")
+
+    assert verify_password("correct horse", hashed_password)
+    assert await verify_password_async("correct horse", hashed_password)
+    assert not await verify_password_async("wrong horse", hashed_password)
+
+
+@pytest.mark.anyio
+async def test_event_loop_keeps_running_during_concurrent_verifications():
+    hashed_password = hash_password("correct horse")
+    largest_gap = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal largest_gap
+
+        while not done:
+            tick = time.perf_counter()
+            await asyncio.sleep(0.005)
+            largest_gap = max(largest_gap, time.perf_counter() - tick)
+
+    ticker_task = asyncio.create_task(ticker())
+    results = await asyncio.gather(
+        *(verify_password_async("correct horse", hashed_password) for _ in range(2))
+    )
+    done = True
+    await ticker_task
+
+    assert all(results)
+    # A single blocking bcrypt verification (12 rounds) takes far longer than this
+    assert largest_gap < 0.1
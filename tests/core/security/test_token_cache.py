@@ -0,0 +1,65 @@
+import pytest
+
+from core.security.token_cache import VerifiedTokenCache
+
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(VerifiedTokenCache, "_get_now", staticmethod(lambda: NOW))
+
+
+def test_payload_is_served_until_exp_inclusive(monkeypatch):
+    cache = VerifiedTokenCache(max_size=10)
+    payload = {"sub": "user-1", "exp": NOW}
+    cache.set("token", payload)
+
+    assert cache.get("token") is payload
+
+    # One second past `exp` a full decode rejects the token, and so does the cache
+    monkeypatch.setattr(VerifiedTokenCache, "_get_now", staticmethod(lambda: NOW + 1))
+
+    assert cache.get("token") is None
+    assert cache.get_stats().size == 0
+
+
+def test_least_recently_used_token_is_evicted():
+    cache = VerifiedTokenCache(max_size=2)
+    cache.set("a", {"exp": NOW + 60})
+    cache.set("b", {"exp": NOW + 60})
+    cache.get("a")
+    cache.set("c", {"exp": NOW + 60})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_hits_and_misses_are_counted():
+    cache = VerifiedTokenCache(max_size=10)
+    cache.get("token")
+    cache.set("token", {"exp": NOW + 60})
+    cache.get("token")
+    cache.get("token")
+
+    stats = cache.get_stats()
+
+    assert (stats.size, stats.hits, stats.misses) == (1, 2, 1)
+    assert stats.hit_ratio == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("payload", [{"sub": "user-1"}, {"exp": "soon"}, {"exp": 1.5}])
+def test_tokens_without_integer_exp_are_not_cached(payload):
+    cache = VerifiedTokenCache(max_size=10)
+    cache.set("token", payload)
+
+    assert cache.get("token") is None
+
+
+def test_zero_size_disables_the_cache():
+    cache = VerifiedTokenCache(max_size=0)
+    cache.set("token", {"exp": NOW + 60})
+
+    assert cache.get("token") is None
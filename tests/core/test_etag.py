@@ -0,0 +1,33 @@
+from fastapi import status
+
+from core.etag import is_etag_matched, make_etag, not_modified_response
+
+
+def test_make_etag_is_strong_and_depends_on_every_part():
+    etag = make_etag("sample", 1, 2)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("sample", 1, 2)
+    assert etag != make_etag("sample", 1, 3)
+
+
+def test_etag_matching_uses_the_weak_comparison():
+    etag = make_etag("sample", 1)
+
+    assert is_etag_matched(etag, etag)
+    assert is_etag_matched(f"W/{etag}", etag)
+    assert is_etag_matched(f'"other", {etag}', etag)
+    assert is_etag_matched("*", etag)
+    assert not is_etag_matched('"other"', etag)
+    assert not is_etag_matched(None, etag)
+
+
+def test_not_modified_response_has_no_body_and_keeps_the_etag():
+    etag = make_etag("samples", "page[size]=10", 3)
+
+    response = not_modified_response(etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.body == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private, no-cache"
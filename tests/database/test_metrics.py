@@ -0,0 +1,31 @@
+import database.metrics as metrics
+from core.metrics import MetricsRegistry
+from database.pool import PoolStats
+
+
+def _stats(timeouts: int) -> PoolStats:
+    return PoolStats(
+        size=5,
+        checked_in=3,
+        checked_out=2,
+        overflow=0,
+        checkouts=10,
+        timeouts=timeouts,
+        total_wait_seconds=0.5,
+        max_wait_seconds=0.2
+    )
+
+
+def test_pool_checkout_timeouts_are_a_counter(monkeypatch):
+    timeouts = iter([2, 5])
+    monkeypatch.setattr(metrics, "get_pool_stats", lambda engine: _stats(next(timeouts)))
+    registry = MetricsRegistry()
+    metrics.register_pool_metrics(registry, {"primary": object()})
+
+    registry.render()
+    rendered = registry.render()
+
+    assert "# TYPE db_pool_checkout_timeouts_total counter" in rendered
+    assert 'db_pool_checkout_timeouts_total{pool="primary"} 5.0' in rendered
+    assert 'db_pool_checked_out{pool="primary"} 2.0' in rendered
+    assert 'db_pool_checkout_average_wait_seconds{pool="primary"} 0.05' in rendered
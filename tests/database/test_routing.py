@@ -0,0 +1,117 @@
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from database.routing import ReadYourWritesTracker, RoutingSession
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Item(_Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+def engines():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+
+    for engine in (primary, replica):
+        _Base.metadata.create_all(engine)
+
+    yield primary, replica
+
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def tracker() -> ReadYourWritesTracker:
+    return ReadYourWritesTracker(window_seconds=60)
+
+
+def _create_session(engines, tracker, read_only: bool, key: str | None = "user") -> RoutingSession:
+    primary, replica = engines
+    session = RoutingSession(bind=primary, replica_bind=replica, read_your_writes_tracker=tracker)
+    session.configure_routing(read_only=read_only, read_your_writes_key=key)
+
+    return session
+
+
+def test_read_only_session_reads_from_replica(engines, tracker):
+    _, replica = engines
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        assert session.get_bind(clause=select(_Item)) is replica
+
+
+def test_write_session_reads_from_primary(engines, tracker):
+    primary, _ = engines
+
+    with _create_session(engines, tracker, read_only=False) as session:
+        assert session.get_bind(clause=select(_Item)) is primary
+
+
+def test_without_replica_everything_goes_to_primary(engines, tracker):
+    primary, _ = engines
+    session = RoutingSession(bind=primary, read_your_writes_tracker=tracker)
+    session.configure_routing(read_only=True)
+
+    assert session.get_bind(clause=select(_Item)) is primary
+
+
+def test_reads_after_a_flush_go_to_primary(engines, tracker):
+    primary, _ = engines
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        session.add(_Item(id=1))
+        session.flush()
+
+        assert session.get_bind(clause=select(_Item)) is primary
+        # The flushed row is visible to the following read
+        assert session.scalars(select(_Item.id)).all() == [1]
+
+
+def test_reads_after_a_dml_statement_go_to_primary(engines, tracker):
+    primary, _ = engines
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        session.execute(insert(_Item).values(id=1))
+
+        assert session.get_bind(clause=select(_Item)) is primary
+
+
+def test_commit_that_wrote_keeps_the_callers_next_sessions_on_primary(engines, tracker):
+    primary, replica = engines
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        session.execute(insert(_Item).values(id=1))
+        session.commit()
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        assert session.get_bind(clause=select(_Item)) is primary
+
+    with _create_session(engines, tracker, read_only=True, key="another user") as session:
+        assert session.get_bind(clause=select(_Item)) is replica
+
+
+def test_commit_without_writes_does_not_start_a_window(engines, tracker):
+    _, replica = engines
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        session.execute(select(_Item))
+        session.commit()
+
+    with _create_session(engines, tracker, read_only=True) as session:
+        assert session.get_bind(clause=select(_Item)) is replica
+
+
+def test_read_your_writes_window_expires():
+    tracker = ReadYourWritesTracker(window_seconds=0)
+    tracker.mark_write("user")
+
+    assert not tracker.requires_primary("user")
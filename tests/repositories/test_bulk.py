@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from apps.soil_laboratory.dto.measurement import MeasurementCreateDTO
+from apps.soil_laboratory.repositories import MeasurementRepository
+from core.config import settings
+
+
+class _Result:
+    def __init__(self, ids):
+        self._ids = ids
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._ids
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements and their parameters."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+
+        return _Result([row["id"] for row in params or []])
+
+
+class _CopyConnection:
+    """Stands in for the session's connection, recording the asyncpg `COPY` calls."""
+
+    def __init__(self):
+        self.copies = []
+        self.driver_connection = self
+
+    async def get_raw_connection(self):
+        return self
+
+    async def copy_records_to_table(self, table_name, records, columns):
+        self.copies.append((table_name, records, columns))
+
+
+class _CopySession(_RecordingSession):
+    def __init__(self):
+        super().__init__()
+        self.raw_connection = _CopyConnection()
+        self.sync_session = SimpleNamespace(info={})
+
+    async def connection(self):
+        return self.raw_connection
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def measurements() -> list[MeasurementCreateDTO]:
+    test_result_id = uuid4()
+
+    return [MeasurementCreateDTO(test_result_id=test_result_id, value=value) for value in (1, 2)]
+
+
+@pytest.mark.anyio
+async def test_bulk_create_fills_audit_fields(measurements):
+    session = _RecordingSession()
+
+    ids = await MeasurementRepository(session).bulk_create(measurements)
+
+    (stmt, rows), = session.executed
+    assert ids == [measurement.id for measurement in measurements]
+    assert _compile(stmt).startswith("INSERT INTO measurements")
+    assert all(row["created_by_id"] == settings.SYSTEM_USER_ID for row in rows)
+    assert all(row["updated_by_id"] == settings.SYSTEM_USER_ID for row in rows)
+
+
+@pytest.mark.anyio
+async def test_bulk_upsert_with_update_columns_still_updates_audit_columns(measurements):
+    session = _RecordingSession()
+
+    await MeasurementRepository(session).bulk_upsert(
+        measurements,
+        conflict_columns=["id"],
+        update_columns=["value"]
+    )
+
+    (stmt, _), = session.executed
+    sql = _compile(stmt)
+    assert "ON CONFLICT (id) DO UPDATE SET" in sql
+    assert "value = excluded.value" in sql
+    assert "updated_by_id = excluded.updated_by_id" in sql
+    assert "updated_at = now()" in sql
+    assert "version = (measurements.version + " in sql
+
+
+@pytest.mark.anyio
+async def test_bulk_create_from_the_threshold_copies_rows(measurements):
+    session = _CopySession()
+    measurement_repo = MeasurementRepository(session)
+    measurement_repo._BULK_COPY_THRESHOLD = len(measurements)
+
+    ids = await measurement_repo.bulk_create(measurements)
+
+    (table_name, records, columns), = session.raw_connection.copies
+    assert not session.executed
+    assert ids == [measurement.id for measurement in measurements]
+    assert table_name == "measurements"
+    assert [record[columns.index("id")] for record in records] == ids
+    assert all(
+        record[columns.index("created_by_id")] == settings.SYSTEM_USER_ID for record in records
+    )
+    # The cached counts of the table are invalidated on commit, as for ORM writes
+    assert "measurements" in session.sync_session.info["count_cache_written_tables"]
@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+import repositories.count_cache as count_cache_module
+from apps.soil_laboratory.models import Sample
+from repositories.count_cache import CountCache, mark_tables_written
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    """Replaces the monotonic clock of the count cache with a settable one."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(count_cache_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    return clock
+
+
+@pytest.fixture
+def cache(monkeypatch) -> CountCache:
+    """Replaces the global count cache, which the session event listeners invalidate."""
+    cache = CountCache(max_size=10, ttl_seconds=60)
+    monkeypatch.setattr(count_cache_module, "count_cache", cache)
+
+    return cache
+
+
+@pytest.fixture
+def session() -> Session:
+    engine = create_engine("sqlite://")
+    Sample.__table__.create(engine)
+
+    with Session(engine) as session:
+        yield session
+
+
+def _add_sample(session: Session) -> None:
+    session.add(Sample(
+        material_id=uuid4(),
+        material_source_id=uuid4(),
+        temperature=20.5,
+        received_at=datetime.now(timezone.utc)
+    ))
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = CountCache(max_size=10, ttl_seconds=60)
+    cache.set("samples", 5, {"samples"})
+
+    clock.now += 59
+    assert cache.get("samples") == 5
+
+    clock.now += 1
+    assert cache.get("samples") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CountCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1, {"samples"})
+    cache.set("b", 2, {"samples"})
+
+    # Reading "a" makes "b" the least recently used entry
+    cache.get("a")
+    cache.set("c", 3, {"samples"})
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_invalidate_tables_drops_only_dependent_entries():
+    cache = CountCache(max_size=10, ttl_seconds=60)
+    cache.set("samples", 1, {"samples"})
+    cache.set("joined", 2, {"samples", "materials"})
+    cache.set("materials", 3, {"materials"})
+
+    cache.invalidate_tables({"materials"})
+
+    assert (cache.get("samples"), cache.get("joined"), cache.get("materials")) == (1, None, None)
+
+
+def test_flushed_tables_are_invalidated_on_commit(cache, session):
+    cache.set("samples", 1, {"samples"})
+    cache.set("materials", 2, {"materials"})
+
+    _add_sample(session)
+    session.flush()
+
+    # Nothing is invalidated before the commit: other transactions don't see the row yet
+    assert cache.get("samples") == 1
+
+    session.commit()
+
+    assert cache.get("samples") is None
+    assert cache.get("materials") == 2
+
+
+def test_executed_statements_are_invalidated_on_commit(cache, session):
+    cache.set("samples", 1, {"samples"})
+
+    session.execute(update(Sample).where(Sample.id == uuid4()).values(note="note"))
+    session.commit()
+
+    assert cache.get("samples") is None
+
+
+def test_tables_written_outside_the_orm_are_invalidated_on_commit(cache, session):
+    cache.set("samples", 1, {"samples"})
+
+    # As after a `COPY` by `BulkCreateMixin`
+    mark_tables_written(session, ["samples"])
+    session.commit()
+
+    assert cache.get("samples") is None
+
+
+def test_rolled_back_writes_are_forgotten(cache, session):
+    cache.set("samples", 1, {"samples"})
+
+    _add_sample(session)
+    session.flush()
+    session.rollback()
+    session.commit()
+
+    assert cache.get("samples") == 1
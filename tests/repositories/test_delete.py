@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from apps.soil_laboratory import repositories
+from apps.soil_laboratory import models
+from apps.soil_laboratory.specifications import SampleFilterSpecification
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._value
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements and expunged objects."""
+
+    def __init__(self, *results):
+        self.executed = []
+        self.expunged = []
+        self._results = list(results)
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._results.pop(0))
+
+    def expunge(self, obj):
+        self.expunged.append(obj)
+
+
+def _compile(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def _test_result() -> models.TestResult:
+    return models.TestResult(
+        id=uuid4(),
+        parameter=models.Parameter(id=uuid4(), code="W", name="Water content", units="%"),
+        mean_value=12.5,
+        variation_percentage=1.5,
+        is_compliant=True
+    )
+
+
+@pytest.mark.anyio
+async def test_hard_delete_returns_the_detached_deleted_row():
+    test_result = _test_result()
+    session = _RecordingSession(test_result)
+
+    deleted = await repositories.TestResultRepository(session).hard_delete(
+        test_result.id,
+        include=[repositories.TestResultLoadOptions.PARAMETER]
+    )
+
+    (stmt,) = session.executed
+    sql = _compile(stmt)
+    assert sql.startswith("DELETE FROM test_results WHERE test_results.id = ")
+    assert " RETURNING test_results.id, " in sql
+    # The parameter is loaded by its own SELECT once the row is returned
+    assert len(stmt._with_options) == 1
+    assert deleted is test_result
+    assert session.expunged == [test_result]
+
+
+@pytest.mark.anyio
+async def test_hard_delete_of_a_missing_row_returns_none():
+    session = _RecordingSession(None)
+
+    assert await repositories.TestResultRepository(session).hard_delete(uuid4()) is None
+    assert session.expunged == []
+
+
+@pytest.mark.anyio
+async def test_hard_delete_many_by_ids_returns_the_existing_ids():
+    existing_id = uuid4()
+    session = _RecordingSession([existing_id])
+    measurement_repo = repositories.MeasurementRepository(session)
+
+    assert await measurement_repo.hard_delete_many_by_ids([]) == []
+    assert await measurement_repo.hard_delete_many_by_ids([existing_id, uuid4()]) == [existing_id]
+
+    (stmt,) = session.executed
+    sql = _compile(stmt)
+    assert "DELETE FROM measurements WHERE measurements.id IN " in sql
+    assert sql.endswith("RETURNING measurements.id")
+
+
+@pytest.mark.anyio
+async def test_hard_delete_many_deletes_the_filtered_rows():
+    deleted_id = uuid4()
+    session = _RecordingSession([deleted_id])
+
+    deleted_ids = await repositories.SampleRepository(session).hard_delete_many(
+        SampleFilterSpecification(material_type_code__eq="SAND")
+    )
+
+    (stmt,) = session.executed
+    sql = _compile(stmt)
+    assert deleted_ids == [deleted_id]
+    # Joined filters are applied to an ID subquery (DELETE can't join)
+    assert sql.startswith("DELETE FROM samples WHERE samples.id IN (SELECT samples.id FROM samples")
+    assert "JOIN material_types ON " in sql
+    assert sql.endswith("RETURNING samples.id")
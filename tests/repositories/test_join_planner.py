@@ -0,0 +1,68 @@
+from sqlalchemy import func, select
+
+from apps.soil_laboratory.models import Material, MaterialSource, MaterialType, Sample
+from apps.soil_laboratory.repositories import SampleRepository
+from apps.soil_laboratory.specifications import (
+    SampleFilterSpecification,
+    SampleOrderingSpecification,
+    SampleSearchSpecification
+)
+from repositories.join_planner import plan_join_paths
+
+
+def _joined_tables(stmt) -> set[str]:
+    sql = str(stmt.compile())
+
+    return {table for table in ("materials", "material_types", "material_sources") if table in sql}
+
+
+def _build_count_stmt(filter_spec=None, search_spec=None):
+    return SampleRepository(db=None)._build_filtered_stmt(
+        select(func.count(Sample.id)),
+        filter_spec,
+        search_spec
+    )
+
+
+def test_unfiltered_count_only_reads_samples():
+    stmt = _build_count_stmt(SampleFilterSpecification(), SampleSearchSpecification(None))
+
+    assert _joined_tables(stmt) == set()
+    assert "JOIN" not in str(stmt.compile())
+
+
+def test_filter_joins_the_intermediate_path():
+    stmt = _build_count_stmt(SampleFilterSpecification(material_type_code__eq="SAND"))
+
+    assert _joined_tables(stmt) == {"materials", "material_types"}
+
+
+def test_search_joins_only_searched_tables():
+    stmt = _build_count_stmt(search_spec=SampleSearchSpecification("clay"))
+
+    assert _joined_tables(stmt) == {"materials", "material_sources"}
+
+
+def test_ordering_by_own_column_does_not_join():
+    ordering_spec = SampleOrderingSpecification("-receivedAt")
+    stmt = SampleRepository(db=None)._build_filtered_stmt(
+        ordering_spec.apply(select(Sample.id)),
+        SampleFilterSpecification(),
+        ordering_spec=ordering_spec
+    )
+
+    assert _joined_tables(stmt) == set()
+
+
+def test_plan_join_paths_keeps_declared_order():
+    join_paths = (Material, MaterialType, MaterialSource)
+
+    assert plan_join_paths(Sample, join_paths, frozenset()) == ()
+    assert plan_join_paths(Sample, join_paths, frozenset({MaterialType})) == (
+        Material,
+        MaterialType
+    )
+    assert plan_join_paths(Sample, join_paths, frozenset({MaterialSource, Material})) == (
+        Material,
+        MaterialSource
+    )
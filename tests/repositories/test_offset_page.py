@@ -0,0 +1,188 @@
+from collections import namedtuple
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import repositories.base as base_module
+from apps.soil_laboratory.repositories import MaterialTypeRepository
+from core.config import settings
+from core.pagination import CountStrategy
+from repositories.count_cache import CountCache
+from specifications.pagination import PaginationSpecification
+
+
+_CountedRow = namedtuple("_CountedRow", ["item", "total_count"])
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalar_one(self):
+        return self._rows
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, returning the given results in order."""
+
+    def __init__(self, *results):
+        self.executed = []
+        self._results = list(results)
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._results.pop(0))
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _estimate(count: int):
+    async def get_estimated_count(filter_spec=None, search_spec=None) -> int:
+        return count
+
+    return get_estimated_count
+
+
+@pytest.fixture
+def cache(monkeypatch) -> CountCache:
+    cache = CountCache(max_size=10, ttl_seconds=60)
+    monkeypatch.setattr(base_module, "count_cache", cache)
+
+    return cache
+
+
+@pytest.mark.anyio
+async def test_large_estimate_is_used_without_counting(monkeypatch):
+    session = _RecordingSession([("a",), ("b",), ("c",)])
+    repo = MaterialTypeRepository(session)
+    monkeypatch.setattr(repo, "get_estimated_count", _estimate(settings.COUNT_ESTIMATE_THRESHOLD))
+
+    page = await repo.get_all_paginated_with_count(
+        PaginationSpecification(1, 2, CountStrategy.ESTIMATED)
+    )
+
+    (stmt,) = session.executed
+    assert "OVER ()" not in _compile(stmt)
+    assert page.items == ["a", "b"]
+    assert page.total_items == settings.COUNT_ESTIMATE_THRESHOLD
+    assert page.has_next
+    assert page.count_strategy is CountStrategy.ESTIMATED
+
+
+@pytest.mark.anyio
+async def test_small_estimate_is_counted_exactly(monkeypatch):
+    session = _RecordingSession([_CountedRow("a", 2), _CountedRow("b", 2)])
+    repo = MaterialTypeRepository(session)
+    monkeypatch.setattr(repo, "get_estimated_count", _estimate(10))
+
+    page = await repo.get_all_paginated_with_count(
+        PaginationSpecification(1, 2, CountStrategy.ESTIMATED)
+    )
+
+    assert "count(*) OVER ()" in _compile(session.executed[0])
+    assert page.total_items == 2
+    assert not page.has_next
+    assert page.count_strategy is CountStrategy.EXACT
+
+
+@pytest.mark.anyio
+async def test_estimate_is_raised_to_the_fetched_rows(monkeypatch):
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_THRESHOLD", 0)
+    session = _RecordingSession([("a",), ("b",), ("c",)])
+    repo = MaterialTypeRepository(session)
+    monkeypatch.setattr(repo, "get_estimated_count", _estimate(1))
+
+    page = await repo.get_all_paginated_with_count(
+        PaginationSpecification(3, 2, CountStrategy.ESTIMATED)
+    )
+
+    # 4 rows are skipped and 3 fetched: at least 7 rows exist, whatever the estimate says
+    assert page.total_items == 7
+    assert page.has_next
+
+
+@pytest.mark.anyio
+async def test_none_strategy_reports_only_whether_a_next_page_exists():
+    pagination_spec = PaginationSpecification(1, 2, CountStrategy.NONE)
+    session = _RecordingSession([("a",), ("b",), ("c",)])
+
+    page = await MaterialTypeRepository(session).get_all_paginated_with_count(pagination_spec)
+
+    (stmt,) = session.executed
+    assert "OVER ()" not in _compile(stmt)
+    assert page.items == ["a", "b"]
+    assert page.total_items is None
+    assert page.has_next
+    assert page.count_strategy is CountStrategy.NONE
+    assert pagination_spec.get_total_pages(page.total_items) is None
+
+
+@pytest.mark.anyio
+async def test_cached_strategy_counts_once_then_reuses_the_count(cache):
+    pagination_spec = PaginationSpecification(1, 2, CountStrategy.CACHED)
+    session = _RecordingSession([_CountedRow("a", 5), _CountedRow("b", 5)], [("a",), ("b",)])
+    repo = MaterialTypeRepository(session)
+
+    first_page = await repo.get_all_paginated_with_count(pagination_spec)
+    second_page = await repo.get_all_paginated_with_count(pagination_spec)
+
+    first_stmt, second_stmt = session.executed
+    assert "count(*) OVER ()" in _compile(first_stmt)
+    assert "OVER ()" not in _compile(second_stmt)
+    assert first_page.total_items == second_page.total_items == 5
+    assert first_page.count_strategy is CountStrategy.EXACT
+    assert second_page.count_strategy is CountStrategy.CACHED
+
+
+@pytest.mark.anyio
+async def test_exact_count_comes_from_a_window_over_the_page_query():
+    session = _RecordingSession([_CountedRow("a", 5), _CountedRow("b", 5), _CountedRow("c", 5)])
+
+    page = await MaterialTypeRepository(session).get_all_paginated_with_count(
+        PaginationSpecification(2, 2)
+    )
+
+    (stmt,) = session.executed
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "count(*) OVER () AS total_count" in sql
+    # One extra row tells whether another page follows
+    assert "LIMIT 3 OFFSET 2" in sql
+    assert page.items == ["a", "b"]
+    assert page.total_items == 5
+    assert page.has_next
+    assert page.count_strategy is CountStrategy.EXACT
+
+
+@pytest.mark.anyio
+async def test_empty_first_page_is_counted_as_zero():
+    session = _RecordingSession([])
+
+    page = await MaterialTypeRepository(session).get_all_paginated_with_count(
+        PaginationSpecification(1, 2)
+    )
+
+    assert len(session.executed) == 1
+    assert page.total_items == 0
+    assert not page.has_next
+
+
+@pytest.mark.anyio
+async def test_empty_page_past_the_end_is_counted_separately():
+    # No row carries the window count, so the rows before the offset are counted on their own
+    session = _RecordingSession([], 3)
+
+    page = await MaterialTypeRepository(session).get_all_paginated_with_count(
+        PaginationSpecification(5, 2)
+    )
+
+    _, count_stmt = session.executed
+    assert _compile(count_stmt).startswith("SELECT count(material_types.id)")
+    assert page.items == []
+    assert page.total_items == 3
+    assert not page.has_next
@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.engine.result import result_tuple
+
+from apps.soil_laboratory.repositories.sample import SampleProjection, SampleRepository
+from apps.soil_laboratory.specifications import (
+    PaginationSpecification,
+    SampleFilterSpecification,
+    SampleOrderingSpecification
+)
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _ScriptedSession:
+    """Stands in for `AsyncSession`, returning the given rows for the successive statements."""
+
+    def __init__(self, *results):
+        self._results = list(results)
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._results.pop(0))
+
+
+@pytest.mark.anyio
+async def test_projected_page_uses_deferred_join():
+    ids = [uuid4(), uuid4(), uuid4()]
+    id_row = result_tuple(["id", "total_count"])
+    keys = [
+        column.key for column in SampleRepository._PROJECTIONS_MAP[SampleProjection.LIST_ITEM]
+    ]
+    projected_row = result_tuple([*keys, "_deferred_id"])
+    session = _ScriptedSession(
+        [id_row((obj_id, 7)) for obj_id in ids],
+        # Out of order, and the second row was deleted between both phases
+        [projected_row((obj_id, *[None] * (len(keys) - 1), obj_id)) for obj_id in ids[::-2]]
+    )
+
+    page = await SampleRepository(session).get_all_projected_paginated_with_count(
+        SampleProjection.LIST_ITEM,
+        PaginationSpecification(page_number=1, page_size=10),
+        SampleOrderingSpecification("materialName"),
+        SampleFilterSpecification()
+    )
+
+    ids_stmt, projection_stmt = (str(stmt.compile()) for stmt in session.executed)
+    # The first phase sorts and skips narrow rows: no JSON subqueries
+    assert "json" not in ids_stmt.lower()
+    assert "JOIN materials" in ids_stmt
+    # The second phase projects only the page's rows, without the ordering JOINs
+    assert "samples.id IN" in projection_stmt
+    assert "JOIN materials" not in projection_stmt
+    assert [item["id"] for item in page.items] == [ids[0], ids[2]]
+    assert page.total_items == 7
+    assert page.has_next is False
+
+
+@pytest.mark.anyio
+async def test_projected_page_without_rows_skips_second_phase():
+    session = _ScriptedSession([])
+
+    page = await SampleRepository(session).get_all_projected_paginated_with_count(
+        SampleProjection.LIST_ITEM,
+        PaginationSpecification(page_number=1, page_size=10)
+    )
+
+    assert len(session.executed) == 1
+    assert page.items == []
+    assert page.total_items == 0
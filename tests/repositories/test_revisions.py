@@ -0,0 +1,133 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from apps.soil_laboratory import repositories
+from apps.soil_laboratory.specifications import (
+    SampleFilterSpecification,
+    SampleSearchSpecification
+)
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one_or_none(self):
+        return self._row
+
+    def one(self):
+        return self._row
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements."""
+
+    def __init__(self, row=None):
+        self.executed = []
+        self._row = row
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return _Result(self._row)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.anyio
+async def test_sample_detail_revision_covers_the_embedded_entities():
+    session = _RecordingSession(row=(1, "m", "mt", "ms", 2, "tr", "p"))
+
+    revision = await repositories.SampleRepository(session).get_detail_revision(uuid4())
+
+    sql = _compile(session.executed[0])
+    assert revision == (1, "m", "mt", "ms", 2, "tr", "p")
+    assert "samples.version" in sql
+    for column in (
+        "materials.updated_at",
+        "material_types.updated_at",
+        "material_sources.updated_at",
+        "max(test_results.updated_at)",
+        "max(parameters.updated_at)"
+    ):
+        assert column in sql
+    assert "LEFT OUTER JOIN test_results" in sql
+    assert "LEFT OUTER JOIN parameters" in sql
+
+
+@pytest.mark.anyio
+async def test_test_result_detail_revision_covers_the_embedded_entities():
+    session = _RecordingSession(row=(1, 2, "p", "m", "mt", "ms", 3, "me"))
+
+    revision = await repositories.TestResultRepository(session).get_detail_revision(uuid4())
+
+    sql = _compile(session.executed[0])
+    assert revision == (1, 2, "p", "m", "mt", "ms", 3, "me")
+    for column in (
+        "test_results.version",
+        "samples.version",
+        "parameters.updated_at",
+        "materials.updated_at",
+        "material_types.updated_at",
+        "material_sources.updated_at",
+        "max(measurements.updated_at)"
+    ):
+        assert column in sql
+    assert "LEFT OUTER JOIN measurements" in sql
+
+
+@pytest.mark.anyio
+async def test_detail_revision_of_a_missing_entity_is_none():
+    assert await repositories.SampleRepository(_RecordingSession()).get_detail_revision(uuid4()) is None
+    assert await repositories.TestResultRepository(_RecordingSession()).get_detail_revision(uuid4()) is None
+
+
+@pytest.mark.anyio
+async def test_sample_list_revision_covers_the_embedded_entities():
+    session = _RecordingSession(row=(2, "s", "m", "mt", "ms", 3, "tr", "p"))
+
+    revision = await repositories.SampleRepository(session).get_list_revision(
+        SampleFilterSpecification(),
+        SampleSearchSpecification(None)
+    )
+
+    (stmt,) = session.executed
+    sql = " ".join(_compile(stmt).split())
+    assert revision == (2, "s", "m", "mt", "ms", 3, "tr", "p")
+    for column in (
+        "count(DISTINCT samples.id)",
+        "max(samples.updated_at)",
+        "max(materials.updated_at)",
+        "max(material_types.updated_at)",
+        "max(material_sources.updated_at)",
+        "count(test_results.id)",
+        "max(test_results.updated_at)",
+        "max(parameters.updated_at)"
+    ):
+        assert column in sql
+    assert "FROM samples JOIN materials" in sql
+    assert "JOIN material_types" in sql
+    assert "JOIN material_sources" in sql
+    assert "LEFT OUTER JOIN test_results" in sql
+    assert "LEFT OUTER JOIN parameters" in sql
+    assert "samples.deleted_at IS NULL" in sql
+
+
+@pytest.mark.anyio
+async def test_sample_list_revision_joins_the_filtered_entities_once():
+    session = _RecordingSession(row=(0, None, None, None, None, 0, None, None))
+
+    await repositories.SampleRepository(session).get_list_revision(
+        SampleFilterSpecification(material_type_code__eq="sand", material_source_code__eq="pit"),
+        SampleSearchSpecification("clay")
+    )
+
+    sql = _compile(session.executed[0])
+    for table in ("materials", "material_types", "material_sources"):
+        assert sql.count(f"JOIN {table} ") == 1
+    assert "material_types.code" in sql
+    assert "material_sources.code" in sql
@@ -0,0 +1,192 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from apps.soil_laboratory.dto.sample import SampleUpdateDTO
+from apps.soil_laboratory.models import MaterialType, Sample
+from apps.soil_laboratory.repositories import MaterialTypeRepository, SampleRepository
+from apps.soil_laboratory.specifications import (
+    MaterialTypeFilterSpecification,
+    SampleFilterSpecification
+)
+from core.config import settings
+from repositories.base import _build_update_stmt
+
+
+# A UUID of digits only would be stored with a numeric affinity by SQLite
+SYSTEM_USER_ID = UUID("5ca1ab1e-0000-4000-8000-00000000abcd")
+
+
+class _AsyncSession:
+    """Runs the repository's statements on a synchronous `Session` (SQLite has no async driver)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, stmt, params=None):
+        return self.session.execute(stmt, params)
+
+
+@pytest.fixture
+def system_user_id(monkeypatch) -> UUID:
+    monkeypatch.setattr(settings, "SYSTEM_USER_ID", SYSTEM_USER_ID)
+
+    return SYSTEM_USER_ID
+
+
+@pytest.fixture
+def session(system_user_id) -> Session:
+    engine = create_engine("sqlite://")
+    Sample.__table__.create(engine)
+
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+def _add_sample(session: Session, deleted: bool = False) -> Sample:
+    sample = Sample(
+        id=uuid4(),
+        material_id=uuid4(),
+        material_source_id=uuid4(),
+        temperature=20.5,
+        received_at=datetime.now(timezone.utc),
+        deleted_at=datetime.now(timezone.utc) if deleted else None
+    )
+    session.add(sample)
+    session.commit()
+
+    return sample
+
+
+def _compile(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_update_stmt_maintains_the_audit_and_version_columns(system_user_id):
+    stmt = _build_update_stmt(Sample, Sample.id == uuid4(), {"note": "Dry"})
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = _compile(stmt)
+
+    assert "updated_by_id=%(updated_by_id)s::UUID" in sql
+    assert "version=(samples.version + %(version_1)s)" in sql
+    assert compiled.params["updated_by_id"] == system_user_id
+    assert compiled.params["version_1"] == 1
+
+
+def test_update_stmt_keeps_explicit_audit_values():
+    user_id = uuid4()
+
+    stmt = _build_update_stmt(Sample, Sample.id == uuid4(), {"updated_by_id": user_id})
+
+    assert stmt.compile().params["updated_by_id"] == user_id
+
+
+def test_update_stmt_of_a_reference_entity_has_no_audit_columns():
+    sql = _compile(_build_update_stmt(MaterialType, MaterialType.id == uuid4(), {"name": "Sand"}))
+
+    assert "updated_by_id" not in sql
+    assert "version" not in sql
+    # `onupdate` defaults are applied to ORM-enabled UPDATE statements by SQLAlchemy itself
+    assert "updated_at=now()" in sql
+
+
+class _RecordingSession:
+    """Stands in for `AsyncSession`, recording the executed statements."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(stmt)
+
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("delete_many", "guard"),
+    [
+        (SampleRepository.soft_delete_many, "samples.deleted_at IS NULL"),
+        (SampleRepository.restore_many, "samples.deleted_at IS NOT NULL")
+    ]
+)
+async def test_soft_delete_many_guards_already_changed_rows(delete_many, guard):
+    session = _RecordingSession()
+
+    await delete_many(SampleRepository(session), SampleFilterSpecification(show_deleted=True))
+
+    (stmt,) = session.executed
+    sql = _compile(stmt)
+    assert sql.startswith("UPDATE samples SET ")
+    assert sql.endswith(f"AND {guard} RETURNING samples.id")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("archive_many", "guard"),
+    [
+        (MaterialTypeRepository.soft_archive_many, "material_types.archived_at IS NULL"),
+        (MaterialTypeRepository.restore_many, "material_types.archived_at IS NOT NULL")
+    ]
+)
+async def test_archive_many_guards_already_changed_rows(archive_many, guard):
+    session = _RecordingSession()
+
+    await archive_many(MaterialTypeRepository(session), MaterialTypeFilterSpecification())
+
+    (stmt,) = session.executed
+    assert _compile(stmt).endswith(f"AND {guard} RETURNING material_types.id")
+
+
+@pytest.mark.anyio
+async def test_update_refreshes_the_loaded_instance(session, system_user_id):
+    sample = _add_sample(session)
+    sample.updated_by_id = None
+
+    updated = await SampleRepository(_AsyncSession(session)).update(
+        sample.id,
+        SampleUpdateDTO(note="Dry")
+    )
+
+    # The identity map's instance is returned with the new state, without another `SELECT`
+    assert updated is sample
+    assert (sample.note, sample.version, sample.updated_by_id) == ("Dry", 2, system_user_id)
+
+
+@pytest.mark.anyio
+async def test_update_of_a_missing_row_returns_none(session):
+    sample_repo = SampleRepository(_AsyncSession(session))
+
+    assert await sample_repo.update(uuid4(), SampleUpdateDTO(note="Dry")) is None
+
+
+@pytest.mark.anyio
+async def test_soft_delete_many_skips_deleted_rows(session, system_user_id):
+    sample = _add_sample(session)
+    deleted_sample = _add_sample(session, deleted=True)
+
+    deleted_ids = await SampleRepository(_AsyncSession(session)).soft_delete_many(
+        SampleFilterSpecification(show_deleted=True)
+    )
+
+    assert deleted_ids == [sample.id]
+
+    rows = session.execute(
+        select(Sample.id, Sample.deleted_by_id, Sample.version).execution_options(
+            populate_existing=True
+        )
+    ).all()
+    assert {row.id: (row.deleted_by_id, row.version) for row in rows} == {
+        sample.id: (system_user_id, 2),
+        deleted_sample.id: (None, 1)
+    }
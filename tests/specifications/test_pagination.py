@@ -0,0 +1,53 @@
+import base64
+import json
+
+import pytest
+
+from apps.soil_laboratory.models.sample import Sample
+from core.exceptions.pagination import InvalidCursorError
+from specifications.ordering import OrderingKey
+from specifications.pagination import CursorPaginationSpecification
+
+
+ORDERING_KEYS = [OrderingKey("receivedAt", Sample.received_at, True), OrderingKey("id", Sample.id)]
+
+
+def _encode(payload) -> str:
+    raw = json.dumps(payload).encode()
+
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _apply(cursor: str):
+    return CursorPaginationSpecification(page_size=10, after=cursor).apply(
+        Sample.__table__.select(),
+        ORDERING_KEYS
+    )
+
+
+def test_cursor_round_trip():
+    spec = CursorPaginationSpecification(page_size=1)
+    values = [("2025-01-02T03:04:05+00:00", "00000000-0000-4000-8000-000000000001")] * 2
+    page = spec.build_page(["a", "b"], values, ORDERING_KEYS)
+
+    _apply(page.next_cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 at all!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        _encode([1, 2]),
+        _encode(5),
+        _encode({"k": ["-receivedAt", "id"]}),
+        _encode({"k": ["-receivedAt", "id"], "v": 5}),
+        _encode({"k": ["-receivedAt", "id"], "v": "ab"}),
+        _encode({"k": ["-receivedAt", "id"], "v": [None]}),
+        _encode({"k": ["id"], "v": ["00000000-0000-4000-8000-000000000001"]}),
+        _encode({"k": ["-receivedAt", "id"], "v": ["yesterday", "not-a-uuid"]})
+    ]
+)
+def test_malformed_cursor_is_rejected(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        _apply(cursor)